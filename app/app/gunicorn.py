@@ -0,0 +1,22 @@
+# Gunicorn configuration, loaded with `--config python:app.gunicorn`.
+from typing import Any
+
+
+# Threaded workers, so a request waiting on the password hashing pool doesn't block the whole worker; keep more threads
+# than USERS_PASSWORD_HASHING_WORKERS + USERS_PASSWORD_HASHING_MAX_BACKLOG, so the pool can shed load
+worker_class = "gthread"
+threads = 8
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Start the worker's invalidation bus listener, so its in-process caches follow the changes made elsewhere."""
+    from extensions.utilities.invalidation import invalidation_bus
+
+    invalidation_bus.start()
+
+
+def worker_exit(server: Any, worker: Any) -> None:
+    """Flush the per-worker buffers before the worker exits, so no data is lost."""
+    from users.last_login import last_login_buffer
+
+    last_login_buffer.flush()
@@ -21,7 +21,8 @@ ALLOWED_HOSTS = env.as_list("ALLOWED_HOSTS")
 
 # Constance settings
 
-CONSTANCE_BACKEND = "constance.backends.database.DatabaseBackend"
+CONSTANCE_BACKEND = "core.backends.CachedDatabaseBackend"
+CORE_CONSTANCE_CHECK_INTERVAL = 5  # seconds; how long the in-memory values are used before checking for changes
 CONSTANCE_CONFIG = OrderedDict(
     [
         ("AUTH_USER_REGISTRATION_ENABLED", (False, _("Enable regular user registration"), bool)),
@@ -78,6 +79,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.ConfigSnapshotMiddleware",
 ]
 ROOT_URLCONF = "app.urls"
 TEMPLATES = [
@@ -87,7 +89,7 @@ TEMPLATES = [
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
-                "constance.context_processors.config",
+                "core.context_processors.config",
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
@@ -157,6 +159,22 @@ DATABASES = {
 }
 
 
+# Shared by all the workers and containers, so the throttling limits (see `users.throttling`) hold across them. The
+# table is created by the core migrations.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "core_cache",
+        "OPTIONS": {"MAX_ENTRIES": 100_000},
+    },
+}
+
+
+# Invalidation bus (see `extensions.utilities.invalidation`): the `NOTIFY` channel used to keep the process-local caches
+# coherent across workers
+INVALIDATION_BUS_CHANNEL = "cache_invalidation"
+
+
 # File handling
 
 STATIC_URL = "static/"
@@ -170,9 +188,15 @@ MEDIA_ROOT = Path("/media")
 REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "drf_standardized_errors.handler.exception_handler",
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("users.authentication.CachedJWTAuthentication",),
     "DEFAULT_SCHEMA_CLASS": "core.openapi.AutoSchema",
+    "DEFAULT_PAGINATION_CLASS": "extensions.pagination.KeysetPagination",
+    "PAGE_SIZE": 50,
     "TEST_REQUEST_DEFAULT_FORMAT": "json",
+    "DEFAULT_THROTTLE_RATES": {"login": "10/min", "register": "5/min"},
+    # The throttles identify clients by the address NGINX appends to X-Forwarded-For; the addresses before it are sent
+    # by the client, and can't be trusted
+    "NUM_PROXIES": 1,
 }
 
 
@@ -184,8 +208,20 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(hours=6),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
-    "UPDATE_LAST_LOGIN": True,  # This hinders performance; can be turned off if necessary.
+    "UPDATE_LAST_LOGIN": True,  # Buffered and written in bulk; see USERS_LAST_LOGIN_FLUSH_*
+    "TOKEN_OBTAIN_SERIALIZER": "users.serializers.UserLoginSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.UserLoginRefreshSerializer",
+    "TOKEN_BLACKLIST_SERIALIZER": "users.serializers.UserLogoutSerializer",
+    "AUTH_TOKEN_CLASSES": ("users.tokens.AccessToken",),
 }
+# Asymmetric signing: paths to PEM private keys; the first one signs new tokens and the others only verify the
+# tokens they signed (key rotation). The public keys are published at `users/jwks/`. Without keys, the tokens are
+# signed with SIGNING_KEY (HS256).
+USERS_JWT_PRIVATE_KEY_FILES = env.as_list("JWT_PRIVATE_KEY_FILES", [])
+USERS_JWT_ALGORITHM = env.as_string("JWT_ALGORITHM", "EdDSA")
+USERS_JWKS_MAX_AGE = 3600  # seconds
+# User fields embedded in the tokens as claims, besides the USERNAME_FIELD; they must be JSON serializable.
+USERS_TOKEN_PROFILE_CLAIMS: list[str] = []
 
 
 # DRF Standardized Errors settings
@@ -194,6 +230,9 @@ DRF_STANDARDIZED_ERRORS = {
     "ALLOWED_ERROR_STATUS_CODES": ["400"],
     "EXCEPTION_HANDLER_CLASS": "core.exceptions.ExceptionHandler",
 }
+# Per-process cache of the pre-rendered common error responses (see `core.exceptions.ExceptionHandler`)
+CORE_RENDERED_ERRORS_CACHE_MAX_SIZE = 256
+CORE_RENDERED_ERRORS_CACHE_TIMEOUT = 24 * 60 * 60  # seconds
 
 
 # DRF Spectacular settings
@@ -202,7 +241,7 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
     "SERVE_AUTHENTICATION": (
         "rest_framework.authentication.SessionAuthentication",  # Same auth for admin page
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.CachedJWTAuthentication",
     ),
     "SWAGGER_UI_DIST": "SIDECAR",
     "SWAGGER_UI_FAVICON_HREF": "SIDECAR",
@@ -226,6 +265,9 @@ SPECTACULAR_SETTINGS = {
     ),
     "COMPONENT_SPLIT_REQUEST": True,
 }
+# Per-process cache of the rendered schema and Swagger UI (see `core.view_mixins.RenderedResponseCacheMixin`)
+CORE_RENDERED_RESPONSES_CACHE_MAX_SIZE = 32
+CORE_RENDERED_RESPONSES_CACHE_TIMEOUT = 24 * 60 * 60  # seconds
 
 
 # User Management
@@ -237,7 +279,54 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.CommonPasswordValidator"},
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
+# Django's default hashers, with work factors calibrated to the host by the `calibrate_hashers` command
+PASSWORD_HASHERS = [
+    "users.hashers.PBKDF2PasswordHasher",
+    "users.hashers.PBKDF2SHA1PasswordHasher",
+    "users.hashers.Argon2PasswordHasher",
+    "users.hashers.BCryptSHA256PasswordHasher",
+    "users.hashers.ScryptPasswordHasher",
+]
+# Written by `calibrate_hashers` for the host it runs on; it's ignored by git and Docker, so it's never shipped
+PASSWORD_HASHERS_CALIBRATION_FILE = env.as_string(
+    "PASSWORD_HASHERS_CALIBRATION_FILE", str(BASE_DIR / "password_hashers.json")
+)
+PASSWORD_HASHERS_CALIBRATION_TARGET_MS = 50
 AUTHENTICATION_BACKENDS = ["users.backends.AuthenticationBackend"]
+# Per-process cache of authenticated Users; the timeout is capped at the access token lifetime.
+USERS_AUTH_CACHE_MAX_SIZE = 1024
+USERS_AUTH_CACHE_TIMEOUT = 60  # seconds
+# In-memory index of the blacklisted refresh tokens. The tokens blacklisted by other workers are added through the
+# invalidation bus as they're committed; the incremental sync only catches the notifications that were missed.
+USERS_BLACKLIST_INDEX_CAPACITY = 100_000
+USERS_BLACKLIST_INDEX_RECENT_SIZE = 10_000
+USERS_BLACKLIST_INDEX_SYNC_INTERVAL = 5  # seconds
+# How long the ids skipped by a sync (rows committed out of id order) are looked up again; longer than any
+# transaction that blacklists tokens
+USERS_BLACKLIST_INDEX_SYNC_OVERLAP = 60  # seconds
+# Write-behind buffer for last_login updates
+USERS_LAST_LOGIN_FLUSH_INTERVAL = 5  # seconds; 0 disables the background flushing
+USERS_LAST_LOGIN_FLUSH_SIZE = 500
+# How the auth endpoints' bookkeeping writes (outstanding and blacklisted tokens, token versions, last_login) are
+# committed, by endpoint: see `extensions.utilities.transactions.CommitMode`. "async_commit" skips waiting for the
+# fsync, at the risk of losing the last writes on a crash; keep security relevant writes (revocations: logout, and
+# the refresh token rotation's blacklisting) durable.
+USERS_BOOKKEEPING_COMMIT_MODES = {
+    "login": "async_commit",
+    "login-refresh": "atomic",
+    "logout": "atomic",
+    "last_login": "async_commit",
+}
+# Per-process pool for password hashing; beyond the backlog, requests are shed with a 503. 0 workers hashes inline.
+# The callers wait for their hashes, so workers + backlog must stay below the gunicorn `threads` (see app/gunicorn.py)
+# for the load to ever be shed; the threads left over keep serving the other requests.
+USERS_PASSWORD_HASHING_WORKERS = 2
+USERS_PASSWORD_HASHING_MAX_BACKLOG = 2
+# Login and register throttling (see DEFAULT_THROTTLE_RATES): in-process counters, reconciled through the (shared)
+# cache every interval; between syncs, each worker can let through up to an interval's worth of extra hits. The limits
+# are soft: `DatabaseCache.incr` is a read and a write, so concurrent syncs of the same key can lose hits
+USERS_THROTTLE_MAX_KEYS = 100_000
+USERS_THROTTLE_SYNC_INTERVAL = 5  # seconds
 
 
 # Localization settings
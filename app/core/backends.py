@@ -0,0 +1,99 @@
+import time
+from threading import Lock
+from typing import Any, Iterator, Optional
+from weakref import WeakSet
+from django.conf import settings
+from django.db import OperationalError, ProgrammingError
+from constance import settings as constance_settings  # type: ignore[import-untyped]
+from constance.backends.database import DatabaseBackend  # type: ignore[import-untyped]
+from extensions.utilities import uuid
+from extensions.utilities.invalidation import invalidation_bus
+
+
+class CachedDatabaseBackend(DatabaseBackend):  # type: ignore[misc]
+    """
+    Constance DatabaseBackend that keeps all the `CONSTANCE_CONFIG` values in process memory.
+
+    Every change made through Constance also writes a new version stamp (a row under the `VERSION_KEY`). Reads are
+    served from memory, checking the stamp at most once every `CORE_CONSTANCE_CHECK_INTERVAL` seconds; all the values
+    are reloaded (in a single query) only when the stamp changed. Changes are also published on the `InvalidationBus`,
+    so processes running its listener see them right away; the stamp covers the ones that don't (or missed it).
+    """
+
+    VERSION_KEY = "__version__"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.check_interval: float = settings.CORE_CONSTANCE_CHECK_INTERVAL
+        self._lock = Lock()
+        self._values: Optional[dict[str, Any]] = None
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+        _backends.add(self)
+
+    @property
+    def version_key(self) -> str:
+        return f"{constance_settings.DATABASE_PREFIX}{self.VERSION_KEY}"
+
+    def get_version(self) -> Optional[str]:
+        """Get the current version stamp from the database (`None` if there's none yet)."""
+        try:
+            return self._model._default_manager.filter(key=self.version_key).values_list("value", flat=True).first()
+        except OperationalError, ProgrammingError:  # The table doesn't exist yet (before migrating)
+            return None
+
+    def bump_version(self) -> None:
+        """Write a new version stamp, so that every process reloads its values."""
+        self._model._default_manager.update_or_create(key=self.version_key, defaults={"value": uuid()})
+
+    def invalidate(self) -> None:
+        """Drop the values held by this process, so they're reloaded on the next read."""
+        with self._lock:
+            self._values = None
+
+    def get_values(self) -> dict[str, Any]:
+        """Get all the stored values, checking the version stamp if the interval has elapsed."""
+        current_time = time.monotonic()
+        with self._lock:
+            values = self._values
+            if values is not None and current_time - self._checked_at < self.check_interval:
+                return values
+        # Read the stamp before the values: if they change in between, the next check reloads them again
+        version = self.get_version()
+        if values is None or version != self._version:
+            values = dict(super().mget(list(settings.CONSTANCE_CONFIG)))
+        with self._lock:
+            self._values, self._version, self._checked_at = values, version, current_time
+        return values
+
+    def get(self, key: str) -> Any:
+        """Override this method to read from memory."""
+        return self.get_values().get(key)
+
+    def mget(self, keys: list[str]) -> Iterator[tuple[str, Any]]:
+        """Override this method to read from memory."""
+        values = self.get_values()
+        for key in keys:
+            if key in values:
+                yield key, values[key]
+
+    def set(self, key: str, value: Any) -> None:
+        """Override this method to write a new version stamp after the change."""
+        # Drop the values first, so that the `config_updated` receivers (called by `set`) read the new one
+        self.invalidate()
+        super().set(key, value)
+        self.bump_version()
+        invalidation_bus.publish("constance", key)
+
+
+_backends: WeakSet[CachedDatabaseBackend] = WeakSet()
+"""The `CachedDatabaseBackend` instances, invalidated by the `InvalidationBus` events."""
+
+
+def invalidate_backends(key: Optional[str]) -> None:
+    """Drop the values held by this process' `CachedDatabaseBackend`s (all of them, whichever key changed)."""
+    for backend in list(_backends):
+        backend.invalidate()
+
+
+invalidation_bus.subscribe("constance", invalidate_backends)
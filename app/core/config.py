@@ -0,0 +1,38 @@
+from typing import Any, Optional
+from django.http import HttpRequest
+from rest_framework.request import Request
+from constance.utils import get_values  # type: ignore[import-untyped]
+
+
+class ConfigSnapshot:
+    """
+    Snapshot of all the Constance values (`CONSTANCE_CONFIG`), read as attributes like `constance.config`.
+
+    The values are loaded with a single bulk read on first access and never change afterwards, so all the reads made
+    with the same snapshot are consistent with each other.
+    """
+
+    def __init__(self) -> None:
+        self._values: Optional[dict[str, Any]] = None
+
+    @property
+    def values(self) -> dict[str, Any]:
+        """All the values, loading them on first access."""
+        if self._values is None:
+            self._values = get_values()
+        return self._values
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self.values[key]
+        except KeyError as e:
+            raise AttributeError(key) from e
+
+
+def get_config(request: Optional[HttpRequest | Request] = None) -> ConfigSnapshot:
+    """
+    Get the request's config snapshot (set by the `ConfigSnapshotMiddleware`), or a new snapshot if there's no request
+    (or it didn't go through the middleware).
+    """
+    snapshot = getattr(request, "config", None)
+    return snapshot if isinstance(snapshot, ConfigSnapshot) else ConfigSnapshot()
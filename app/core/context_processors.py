@@ -0,0 +1,12 @@
+from typing import Any
+from django.http import HttpRequest
+from core.config import get_config
+
+
+def config(request: HttpRequest) -> dict[str, Any]:
+    """
+    Replacement for Constance's `config` context processor, that exposes the request's `ConfigSnapshot` as `config`.
+
+    The snapshot is lazy: rendering a template only reads the config if the template actually uses it.
+    """
+    return {"config": get_config(request)}
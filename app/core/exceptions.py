@@ -1,11 +1,66 @@
+import re
+import time
+from functools import cache
+from typing import Hashable, Optional
+from django.apps import apps
+from django.conf import settings
 from django.core.exceptions import ValidationError as DjangoValidationError
-from rest_framework.exceptions import ValidationError
+from django.db import IntegrityError
+from django.db.models import Model, UniqueConstraint
+from django.http import HttpResponse
+from rest_framework.exceptions import APIException, ErrorDetail, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
 from rest_framework.serializers import as_serializer_error
+from rest_framework.settings import api_settings
+from rest_framework.status import is_client_error
+from rest_framework.utils.field_mapping import get_unique_error_message
+from rest_framework.validators import UniqueTogetherValidator
 from drf_standardized_errors.handler import ExceptionHandler as BaseExceptionHandler
+from extensions.utilities.cache import TTLCache
+from extensions.utilities.metrics import metrics_registry
+
+
+UNIQUE_VIOLATION = "23505"
+"""The Postgres error code for unique violations."""
+
+
+@cache
+def get_table_models() -> dict[str, type[Model]]:
+    """Map the installed (concrete) models by their database table, to resolve the tables Postgres reports."""
+    return {m._meta.db_table: m for m in apps.get_models() if not m._meta.proxy}
+
+
+def get_table_model(table: Optional[str]) -> Optional[type[Model]]:
+    """
+    Get the model of a database table, or `None` if there's none. Models registered since the map was built (for
+    example, the test models) are found by rebuilding it once.
+    """
+    if table is None:
+        return None
+    if table not in get_table_models():
+        get_table_models.cache_clear()
+    return get_table_models().get(table)
+
+
+rendered_errors = TTLCache[tuple[Hashable, ...], bytes](
+    max_size=settings.CORE_RENDERED_ERRORS_CACHE_MAX_SIZE,
+    timeout=settings.CORE_RENDERED_ERRORS_CACHE_TIMEOUT,
+)
+"""Per-process cache of the error responses rendered by the `ExceptionHandler`'s fast path."""
 
 
 class ExceptionHandler(BaseExceptionHandler):
-    """Custom ExceptionHandler for drf_standardized_errors that will properly handle Django ValidationErrors."""
+    """
+    Custom ExceptionHandler for drf_standardized_errors that will properly handle Django ValidationErrors.
+
+    Also has a fast path for the most common errors (401, 403, 404...): client errors with a single message, rendered
+    as JSON, are formatted and rendered only once per exception class, message (already translated) and media type;
+    afterwards, the rendered body is served from memory.
+
+    Every handled exception is recorded in the `metrics_registry`, as an `exceptions` timing (count and time spent
+    handling it) by view, status, error code and (original) exception class.
+    """
 
     def convert_known_exceptions(self, exc: Exception) -> Exception:
         """
@@ -14,4 +69,114 @@ class ExceptionHandler(BaseExceptionHandler):
         """
         if isinstance(exc, DjangoValidationError):
             return ValidationError(as_serializer_error(exc))
+        if isinstance(exc, IntegrityError):
+            return self.convert_unique_violation(exc) or exc
         return super().convert_known_exceptions(exc)
+
+    def convert_unique_violation(self, exc: IntegrityError) -> Optional[ValidationError]:
+        """
+        Convert a unique violation `IntegrityError` to the `ValidationError` the serializer's uniqueness validators
+        would have raised (see `AbstractBaseModel.enforce_unique_in_db`), or `None` if it's not one, or the model
+        didn't opt in to `enforce_unique_in_db`.
+        """
+        cause = exc.__cause__
+        if getattr(cause, "pgcode", None) != UNIQUE_VIOLATION:
+            return None
+        diag = getattr(cause, "diag", None)
+        model = get_table_model(getattr(diag, "table_name", None))
+        if diag is None or model is None or not getattr(model, "enforce_unique_in_db", False):
+            return None
+        # Use the constraint's fields if it's declared in the model; else, the columns reported by Postgres, like in
+        # "Key (column_a, column_b)=(value_a, value_b) already exists."
+        constraint = next(
+            (
+                c
+                for c in model._meta.constraints
+                if isinstance(c, UniqueConstraint) and c.fields and c.name == diag.constraint_name
+            ),
+            None,
+        )
+        if constraint is not None:
+            fields = [model._meta.get_field(name) for name in constraint.fields]
+        else:
+            match = re.match(r"Key \((.+?)\)=", diag.message_detail or "")
+            columns = match.group(1).split(", ") if match else []
+            fields = [f for column in columns for f in model._meta.concrete_fields if f.column == column]
+            if not fields or len(fields) != len(columns):
+                return None
+        if len(fields) == 1:
+            return ValidationError({fields[0].name: [ErrorDetail(get_unique_error_message(fields[0]), code="unique")]})
+        message = UniqueTogetherValidator.message.format(field_names=", ".join(f.name for f in fields))
+        return ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [ErrorDetail(message, code="unique")]})
+
+    def get_rendered_key(self, exc: Exception) -> Optional[tuple[Hashable, ...]]:
+        """Get the key of the exception's rendered response, or `None` if it can't take the fast path."""
+        if not isinstance(exc, APIException) or isinstance(exc, ValidationError) or getattr(exc, "wait", None):
+            return None
+        if not is_client_error(exc.status_code) or not isinstance(exc.detail, ErrorDetail):
+            return None
+        request = self.context.get("request")
+        if request is None or not isinstance(getattr(request, "accepted_renderer", None), JSONRenderer):
+            return None
+        media_type = (type(request.accepted_renderer), request.accepted_media_type)
+        return (type(exc), exc.status_code, exc.detail.code, str(exc.detail), *media_type)
+
+    def get_error_code(self, exc: Exception) -> str:
+        """Get the error code of the (converted) exception, for the metrics."""
+        if not isinstance(exc, APIException):
+            return "error"
+        if isinstance(exc.detail, ErrorDetail):
+            return str(exc.detail.code)
+        return str(exc.default_code)
+
+    def run(self) -> Optional[Response | HttpResponse]:  # type: ignore[override]
+        """Override this method to record the metrics of the handled exception."""
+        start = time.perf_counter()
+        exc = self.convert_known_exceptions(self.exc)
+        response = self.handle(exc)
+        view = self.context.get("view")
+        metrics_registry.observe(
+            "exceptions",
+            time.perf_counter() - start,
+            view=type(view).__qualname__ if view is not None else "",
+            status=str(response.status_code if response is not None else 500),
+            code=self.get_error_code(exc),
+            exception=f"{type(self.exc).__module__}.{type(self.exc).__qualname__}",
+        )
+        return response
+
+    def get_converted_response(self, exc: Exception) -> Optional[Response]:
+        """Run the base handler's steps on the already converted exception, so that it isn't converted a second time."""
+        if self.should_not_handle(exc):
+            return None
+        exc = self.convert_unhandled_exceptions(exc)
+        data = self.format_exception(exc)
+        self.set_rollback()
+        response = self.get_response(exc, data)
+        self.report_exception(exc, response)
+        return response
+
+    def handle(self, exc: Exception) -> Optional[Response | HttpResponse]:
+        """Handle the (converted) exception, serving the pre-rendered response if it can take the fast path."""
+        key = self.get_rendered_key(exc)
+        if key is None:
+            return self.get_converted_response(exc)
+        assert isinstance(exc, APIException)
+        request = self.context["request"]
+        assert request is not None
+        renderer: JSONRenderer = request.accepted_renderer
+        content = rendered_errors.get(key)
+        if content is None:
+            response = self.get_converted_response(exc)
+            assert response is not None
+            content = renderer.render(
+                response.data, request.accepted_media_type, self.context["view"].get_renderer_context()
+            )
+            rendered_errors.set(key, content)
+        else:
+            self.set_rollback()
+        # Same as the `Content-Type` set by DRF's `Response`
+        content_type = (
+            renderer.media_type if renderer.charset is None else f"{renderer.media_type}; charset={renderer.charset}"
+        )
+        return HttpResponse(content, status=exc.status_code, content_type=content_type, headers=self.get_headers(exc))
@@ -0,0 +1,69 @@
+import timeit
+from functools import partial
+from typing import Any
+from django.core.management.base import CommandParser
+from rest_framework import exceptions
+from rest_framework.test import APIRequestFactory
+from drf_standardized_errors.handler import ExceptionHandler as BaseExceptionHandler
+from drf_standardized_errors.types import ExceptionHandlerContext
+from core.exceptions import ExceptionHandler
+from core.management.commands._base_command import BaseCommand
+from core.views import PingView
+
+
+class Command(BaseCommand):
+    """
+    Command to benchmark the `ExceptionHandler`'s fast path against the regular drf_standardized_errors pipeline
+    (format, then render), for the most common error responses.
+
+    Also checks that both paths render byte-identical bodies.
+    """
+
+    EXCEPTIONS: tuple[type[exceptions.APIException], ...] = (
+        exceptions.NotAuthenticated,
+        exceptions.PermissionDenied,
+        exceptions.NotFound,
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--iterations", type=int, default=10_000, help="Number of responses per measurement.")
+
+    def get_context(self) -> ExceptionHandlerContext:
+        """Get the context of a JSON request to a regular view, as passed to the exception handler."""
+        view = PingView()
+        view.args, view.kwargs, view.format_kwarg = (), {}, None
+        request = view.initialize_request(APIRequestFactory().get("/", HTTP_ACCEPT="application/json"))
+        request.accepted_renderer, request.accepted_media_type = view.perform_content_negotiation(request)
+        view.request = request
+        return {"view": view, "args": (), "kwargs": {}, "request": request}
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        iterations: int = kwargs["iterations"]
+        context = self.get_context()
+        request, view = context["request"], context["view"]
+        assert request is not None
+
+        def regular_path(exc_class: type[exceptions.APIException]) -> bytes:
+            response = BaseExceptionHandler(exc_class(), context).run()
+            assert response is not None
+            rendered: bytes = request.accepted_renderer.render(
+                response.data, request.accepted_media_type, view.get_renderer_context()
+            )
+            return rendered
+
+        def fast_path(exc_class: type[exceptions.APIException]) -> bytes:
+            response = ExceptionHandler(exc_class(), context).run()
+            assert response is not None
+            return response.content
+
+        self.info(f"Benchmarking the exception handler ({iterations} responses each)...")
+        for exc_class in self.EXCEPTIONS:
+            if regular_path(exc_class) != fast_path(exc_class):
+                self.error(f"{exc_class.__name__}: the fast path rendered a different body!")
+                continue
+            regular = timeit.timeit(partial(regular_path, exc_class), number=iterations) / iterations
+            fast = timeit.timeit(partial(fast_path, exc_class), number=iterations) / iterations
+            self.stdout.write(
+                f"  {exc_class.__name__}: regular {regular * 1e6:.1f}µs, fast {fast * 1e6:.1f}µs ({regular / fast:.1f}x)"
+            )
+        self.success("Finished benchmarking!")
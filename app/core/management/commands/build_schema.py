@@ -0,0 +1,21 @@
+from typing import Any
+from core.management.commands._base_command import BaseCommand
+from core.openapi import build_schema_files, get_schema_file
+
+
+class Command(BaseCommand):
+    """
+    Command to pre-build the OpenAPI schema into the `STATIC_ROOT`, for the web server to serve directly.
+
+    Writes `schema/schema.json` with its `.gz` and `.br` (if the `brotli` package is installed) compressed variants.
+    If the schema is admin only (`OPENAPI_ADMIN_ONLY`), removes them instead, so that the requests reach Django.
+    """
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        paths = build_schema_files()
+        if not paths:
+            self.warning(f"The schema is admin only; removed the pre-built schema from {get_schema_file().parent}.")
+            return
+        for path in paths:
+            self.info(f"Wrote {path}")
+        self.success("Schema built!")
@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+from typing import Any
+from django.conf import settings
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import CommandParser
+from core.management.commands._base_command import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Command to calibrate the password hashers' work factors to this host.
+
+    Benchmarks every hasher in `PASSWORD_HASHERS` that supports calibration (see `users.hashers`), picks the work
+    factors that make a hash take about `--target-ms` milliseconds, and writes them to
+    `PASSWORD_HASHERS_CALIBRATION_FILE`. They're picked up when the app (re)starts.
+
+    **Note**: every host serving the same database should share the same calibration; otherwise, hashes keep being
+    upgraded back and forth as Users log in on different hosts.
+    """
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--target-ms",
+            type=float,
+            default=settings.PASSWORD_HASHERS_CALIBRATION_TARGET_MS,
+            help="Target time per hash, in milliseconds.",
+        )
+        parser.add_argument(
+            "--output",
+            default=settings.PASSWORD_HASHERS_CALIBRATION_FILE,
+            help="File to write the work factors to.",
+        )
+        parser.add_argument(
+            "--allow-weaker",
+            action="store_true",
+            help="Allow work factors lower than Django's defaults.",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        target_ms: float = kwargs["target_ms"]
+        self.info(f"Calibrating password hashers for {target_ms:g}ms per hash...")
+        i_stdout, i_stderr = self.get_indented_streams(kwargs)
+        work_factors: dict[str, dict[str, Any]] = {}
+        for hasher in get_hashers():
+            if not hasattr(hasher, "calibrate"):
+                continue
+            try:
+                work_factors[hasher.algorithm] = hasher.calibrate(target_ms / 1000, kwargs["allow_weaker"])
+            except ValueError as e:  # The hasher's library is not installed
+                i_stderr.write(self.style.WARNING(f"Skipping {hasher.algorithm}: {e}"))
+                continue
+            i_stdout.write(f"{hasher.algorithm}: {work_factors[hasher.algorithm]}")
+        output = Path(kwargs["output"])
+        output.write_text(json.dumps(work_factors, indent=2))
+        self.success(f"Wrote the work factors to {output}. Restart the app to apply them.")
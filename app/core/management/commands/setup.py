@@ -11,12 +11,14 @@ class Command(BaseCommand):
     - Clears and re-collects all static files
     - Waits for database
     - Migrates
+    - Pre-builds the OpenAPI schema (if it's public)
     """
 
     TASKS = [
         ("Collection static...", ("collectstatic", "--no-input", "--clear")),
         ("Waiting for DB connection...", ("wait_for_db",)),
         ("Migrating...", ("migrate",)),
+        ("Building schema...", ("build_schema",)),
     ]
 
     def handle(self, *args: Any, **kwargs: Any) -> None:
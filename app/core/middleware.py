@@ -0,0 +1,14 @@
+from typing import Callable
+from django.http import HttpRequest, HttpResponse
+from core.config import ConfigSnapshot
+
+
+class ConfigSnapshotMiddleware:
+    """Middleware that sets a lazy `ConfigSnapshot` as `request.config`, so a request reads the config at most once."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        request.config = ConfigSnapshot()  # type: ignore[attr-defined]
+        return self.get_response(request)
@@ -1,6 +1,20 @@
-from typing import Any
-from constance import config  # type: ignore[import-untyped]
+import gzip
+import json
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Optional, Self
+from django.conf import settings
+from django.http import HttpRequest
+from django.utils import translation
+from rest_framework.request import Request
+from drf_spectacular.renderers import OpenApiJsonRenderer
+from drf_spectacular.settings import spectacular_settings
 from drf_standardized_errors.openapi import AutoSchema as BaseAutoSchema
+from core.config import get_config
 
 
 class AutoSchema(BaseAutoSchema):  # pragma: no cover
@@ -16,9 +30,16 @@ class AutoSchema(BaseAutoSchema):  # pragma: no cover
         return super()._should_add_error_response(responses, status_code)
 
 
+def get_openapi_config(request: Optional[HttpRequest | Request] = None) -> tuple[str, str, str]:
+    """Get the OpenAPI title, description and version from the Constance configs."""
+    config = get_config(request)
+    return config.OPENAPI_TITLE, config.OPENAPI_DESCRIPTION, config.OPENAPI_VERSION
+
+
 def post_processing_hook_apply_config(
     result: dict[str, Any],
     *args: Any,
+    request: Optional[HttpRequest] = None,
     **kwargs: Any,
 ) -> dict[str, Any]:  # pragma: no cover
     """
@@ -26,7 +47,160 @@ def post_processing_hook_apply_config(
     to the configs.
     """
     # Apply the Constance configs
-    result["info"]["title"] = config.OPENAPI_TITLE
-    result["info"]["description"] = config.OPENAPI_DESCRIPTION
-    result["info"]["version"] = config.OPENAPI_VERSION
+    result["info"]["title"], result["info"]["description"], result["info"]["version"] = get_openapi_config(request)
     return result
+
+
+def get_schema_file() -> Path:
+    """Get the path of the pre-built schema file, in the `STATIC_ROOT`."""
+    return Path(settings.STATIC_ROOT) / "schema" / "schema.json"
+
+
+def _write_file(path: Path, content: bytes) -> None:
+    """Write the file atomically, so that the web server never serves it half written."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+
+
+def build_schema_files() -> list[Path]:
+    """
+    Build the (public) schema as a JSON file, with its gzip and brotli (if the `brotli` package is installed)
+    compressed variants, for the web server to serve directly. If the schema is admin only, the previously built files
+    are removed instead, so that the requests reach Django (which checks the permissions).
+
+    Returns the paths of the files written.
+    """
+    schema_file = get_schema_file()
+    variants = [
+        schema_file,
+        schema_file.with_name(f"{schema_file.name}.gz"),
+        schema_file.with_name(f"{schema_file.name}.br"),
+    ]
+    if get_config().OPENAPI_ADMIN_ONLY:
+        for path in variants:
+            path.unlink(missing_ok=True)
+        return []
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    # In the default language, the only one the web server serves it for
+    with translation.override(settings.LANGUAGE_CODE):
+        content = OpenApiJsonRenderer().render(generator.get_schema(request=None, public=True), renderer_context={})
+    compressed = {variants[0]: content, variants[1]: gzip.compress(content, compresslevel=9, mtime=0)}
+    try:
+        import brotli  # type: ignore[import-not-found]
+
+        compressed[variants[2]] = brotli.compress(content, quality=11)
+    except ImportError:
+        variants[2].unlink(missing_ok=True)
+    schema_file.parent.mkdir(parents=True, exist_ok=True)
+    for path, path_content in compressed.items():
+        _write_file(path, path_content)
+    return list(compressed)
+
+
+def schema_files_outdated() -> bool:
+    """
+    Check if the pre-built schema files don't match the current OpenAPI configs: they exist while the schema is admin
+    only, or are missing (or built with other configs) while it's public.
+    """
+    schema_file = get_schema_file()
+    if get_config().OPENAPI_ADMIN_ONLY:
+        return schema_file.exists()
+    try:
+        info = json.loads(schema_file.read_bytes())["info"]
+    except OSError, ValueError, KeyError:
+        return True
+    return (info.get("title"), info.get("description", ""), info.get("version")) != get_openapi_config()
+
+
+@dataclass
+class ProfileEntry:
+    """The calls to, and the time spent on, an entry of the `SchemaProfiler`."""
+
+    calls: int = 0
+    total: float = 0.0
+
+
+class SchemaProfiler:
+    """
+    Profiler for the schema generation, that times (inclusively) every endpoint, every serializer mapping, the
+    postprocessing hooks and our own overrides (`AutoSchema` and serializer field extensions).
+
+    Use it as a context manager around `get_schema`; the entries are kept in `entries`, by category and name. Nested
+    serializers are also counted in the serializers that contain them.
+    """
+
+    def __init__(self) -> None:
+        self.entries: defaultdict[str, defaultdict[str, ProfileEntry]] = defaultdict(lambda: defaultdict(ProfileEntry))
+        self._patches: list[tuple[Any, str, Any]] = []
+
+    def timed[**P, R](self, func: Callable[P, R], category: str, get_name: Callable[..., str]) -> Callable[P, R]:
+        """Wrap the function so that its calls are timed under the category, with the name from `get_name`."""
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                entry = self.entries[category][get_name(*args, **kwargs)]
+                entry.calls += 1
+                entry.total += time.perf_counter() - start
+
+        return wrapper
+
+    def patch(self, owner: Any, attribute: str, category: str, get_name: Callable[..., str]) -> None:
+        """Time the owner's attribute (a function) until the profiler exits."""
+        self._patches.append((owner, attribute, owner.__dict__.get(attribute)))
+        setattr(owner, attribute, self.timed(getattr(owner, attribute), category, get_name))
+
+    def __enter__(self) -> Self:
+        # Imported here, so that the extension is registered as usual
+        from extensions.serializers import NestedPrimaryKeyRelatedFieldSerializerExtension
+
+        # Patched on our AutoSchema (the `DEFAULT_SCHEMA_CLASS`), so any overrides in between are timed too
+        self.patch(
+            AutoSchema,
+            "get_operation",
+            "endpoints",
+            lambda _self, path, path_regex, path_prefix, method, *args, **kwargs: f"{method} {path}",
+        )
+        self.patch(
+            AutoSchema,
+            "_map_serializer",
+            "serializers",
+            lambda _self, serializer, direction, *args, **kwargs: (
+                f"{getattr(serializer, '__name__', type(serializer).__name__)} ({direction})"
+            ),
+        )
+        self.patch(
+            AutoSchema,
+            "_should_add_error_response",
+            "overrides",
+            lambda *args, **kwargs: "_should_add_error_response",
+        )
+        self.patch(
+            NestedPrimaryKeyRelatedFieldSerializerExtension,
+            "map_serializer_field",
+            "overrides",
+            lambda *args, **kwargs: "NestedPrimaryKeyRelatedFieldSerializerExtension",
+        )
+        hooks = spectacular_settings.POSTPROCESSING_HOOKS
+        self._patches.append((spectacular_settings, "POSTPROCESSING_HOOKS", hooks))
+        spectacular_settings.POSTPROCESSING_HOOKS = [
+            self.timed(hook, "hooks", lambda *args, hook=hook, **kwargs: f"{hook.__module__}.{hook.__qualname__}")
+            for hook in hooks
+        ]
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        for owner, attribute, original in reversed(self._patches):
+            if original is None:  # It was inherited
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, original)
+        self._patches.clear()
+
+    def get_report(self, category: str, limit: Optional[int] = None) -> list[tuple[str, ProfileEntry]]:
+        """Get the category's entries, the slowest first."""
+        return sorted(self.entries[category].items(), key=lambda item: item[1].total, reverse=True)[:limit]
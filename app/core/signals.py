@@ -0,0 +1,37 @@
+from typing import Any, Optional
+from django.dispatch import receiver
+from constance.signals import config_updated  # type: ignore[import-untyped]
+from core.backends import invalidate_backends
+from core.config import get_config
+from core.openapi import build_schema_files, get_schema_file, schema_files_outdated
+from extensions.utilities.invalidation import invalidation_bus
+
+
+@receiver(config_updated)
+def remove_schema_files(sender: Any, key: str, **kwargs: Any) -> None:
+    """
+    Remove the pre-built schema files (see the `build_schema` command) right away when the schema becomes admin only,
+    so the web server doesn't keep serving it. The other containers remove theirs through `sync_schema_files`.
+    """
+    if key == "OPENAPI_ADMIN_ONLY" and get_schema_file().parent.exists() and get_config().OPENAPI_ADMIN_ONLY:
+        build_schema_files()
+
+
+def sync_schema_files(key: Optional[str]) -> None:
+    """
+    Rebuild (or remove) the pre-built schema files when they don't match the OpenAPI configs anymore, so the web server
+    doesn't keep serving an outdated schema (or a schema that's now admin only).
+
+    Runs in every process on the Constance changes, through the `InvalidationBus` (and whenever its listener
+    reconnects, for the changes it may have missed); only the first process of each container to see a change
+    rebuilds the files. Only applies if the schema was pre-built in this environment.
+    """
+    if (key is not None and not key.startswith("OPENAPI_")) or not get_schema_file().parent.exists():
+        return
+    # This can run before the backends' own handler; make sure the new values are read
+    invalidate_backends(key)
+    if schema_files_outdated():
+        build_schema_files()
+
+
+invalidation_bus.subscribe("constance", sync_schema_files)
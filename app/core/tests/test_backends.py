@@ -0,0 +1,57 @@
+from unittest.mock import patch
+from django.test import TestCase, override_settings
+from constance.models import Constance  # type: ignore[import-untyped]
+from core.backends import CachedDatabaseBackend
+from extensions.utilities.invalidation import invalidation_bus
+
+
+class TestCachedDatabaseBackend(TestCase):
+    """Test the CachedDatabaseBackend for Constance."""
+
+    def test_get(self) -> None:
+        """Test that values are read from memory after the first read."""
+        backend = CachedDatabaseBackend()
+        backend.set("OPENAPI_TITLE", "_title")
+        with self.assertNumQueries(2):  # The version stamp and the values
+            self.assertEqual("_title", backend.get("OPENAPI_TITLE"))
+        with self.assertNumQueries(0):
+            self.assertEqual("_title", backend.get("OPENAPI_TITLE"))
+            self.assertEqual({"OPENAPI_TITLE": "_title"}, dict(backend.mget(["OPENAPI_TITLE", "OPENAPI_VERSION"])))
+            self.assertIsNone(backend.get("OPENAPI_VERSION"))  # Not stored; Constance falls back to the default
+
+    def test_set_other_process(self) -> None:
+        """Test that a change made by another process is picked up once the interval elapses."""
+        backend, other_backend = CachedDatabaseBackend(), CachedDatabaseBackend()
+        backend.set("OPENAPI_TITLE", "_title")
+        self.assertEqual("_title", backend.get("OPENAPI_TITLE"))
+        # Another process' change doesn't reach this one through the bus if it's not listening
+        with patch.object(invalidation_bus, "publish"):
+            other_backend.set("OPENAPI_TITLE", "_other_title")
+        # Still within the interval
+        self.assertEqual("_title", backend.get("OPENAPI_TITLE"))
+        # Once the interval elapses
+        backend._checked_at -= backend.check_interval
+        self.assertEqual("_other_title", backend.get("OPENAPI_TITLE"))
+
+    @override_settings(CORE_CONSTANCE_CHECK_INTERVAL=0)
+    def test_unchanged_version(self) -> None:
+        """Test that only the version stamp is queried while it doesn't change."""
+        backend = CachedDatabaseBackend()
+        backend.set("OPENAPI_TITLE", "_title")
+        backend.get("OPENAPI_TITLE")
+        with self.assertNumQueries(1):
+            self.assertEqual("_title", backend.get("OPENAPI_TITLE"))
+        # A new version stamp reloads the values
+        Constance.objects.filter(key=backend.version_key).update(value="_version")
+        with self.assertNumQueries(2):
+            backend.get("OPENAPI_TITLE")
+
+    def test_invalidation_bus(self) -> None:
+        """Test that the bus events drop the values of every backend, through a single subscription."""
+        handlers = list(invalidation_bus._handlers["constance"])
+        backend, other_backend = CachedDatabaseBackend(), CachedDatabaseBackend()
+        self.assertEqual(handlers, invalidation_bus._handlers["constance"])
+        backend.set("OPENAPI_TITLE", "_title")
+        self.assertEqual("_title", other_backend.get("OPENAPI_TITLE"))
+        other_backend.set("OPENAPI_TITLE", "_other_title")
+        self.assertEqual("_other_title", backend.get("OPENAPI_TITLE"))
@@ -1,13 +1,23 @@
+import gzip
+import json
 from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase as UnitTest
 from unittest.mock import MagicMock, patch
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
 from django.core.management import call_command
 from django.db.utils import OperationalError
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from constance.signals import config_updated  # type: ignore[import-untyped]
+from constance.test import override_config  # type: ignore[import-untyped]
+from core.management.commands.benchmark_exception_handler import Command as BenchmarkExceptionHandlerCommand
 from core.management.commands.setup import Command as SetupCommand
 from core.management.commands.startapp import Command as StartAppCommand
 from core.management.commands.startapp import StartAppCommand as OriginalStartAppCommand
 from core.management.commands.wait_for_db import Command as WaitForDBCommand
+from core.openapi import AutoSchema
+from core.signals import sync_schema_files
 from extensions.utilities.test import clear_colors
 
 
@@ -86,6 +96,120 @@ class TestWaitForDBCommand(TestCase):
         self.assertEqual(self.MAX_RETRIES + 1, cursor_mock.call_count)
 
 
+@override_settings(
+    PASSWORD_HASHERS=["users.hashers.PBKDF2PasswordHasher", "django.contrib.auth.hashers.MD5PasswordHasher"],
+    PASSWORD_HASHERS_CALIBRATION_FILE="/_uncalibrated.json",
+)
+class TestCalibrateHashersCommand(TestCase):
+    """Test the calibrate_hashers command."""
+
+    def call(self, *args: str) -> dict[str, dict[str, int]]:
+        """Call the command with a hash taking twice the target, and return the written work factors."""
+        with TemporaryDirectory() as directory, patch("users.hashers.CalibratedHasherMixin.time_hash") as time_mock:
+            time_mock.return_value = 0.1
+            output = Path(directory) / "hashers.json"
+            output_buffer = StringIO()
+            call_command(
+                "calibrate_hashers", "--target-ms", "50", "--output", str(output), *args, stdout=output_buffer
+            )
+            self.assertIn(f"Wrote the work factors to {output}.", clear_colors(output_buffer.getvalue()))
+            return json.loads(output.read_text())  # type: ignore[no-any-return]
+
+    def test_default(self) -> None:
+        """Test that the work factors are never lower than Django's defaults, and uncalibrated hashers are skipped."""
+        self.assertEqual({"pbkdf2_sha256": {"iterations": PBKDF2PasswordHasher.iterations}}, self.call())
+
+    def test_allow_weaker(self) -> None:
+        """Test that the work factors are scaled to the target with `--allow-weaker`."""
+        self.assertEqual(
+            {"pbkdf2_sha256": {"iterations": PBKDF2PasswordHasher.iterations // 2}},
+            self.call("--allow-weaker"),
+        )
+
+
+class TestBuildSchemaCommand(TestCase):
+    """Test the build_schema command."""
+
+    def test_public(self) -> None:
+        """Test that the schema is written with its compressed variants."""
+        with (
+            TemporaryDirectory() as directory,
+            override_settings(STATIC_ROOT=directory),
+            override_config(OPENAPI_ADMIN_ONLY=False, OPENAPI_TITLE="_title"),
+        ):
+            call_command("build_schema", stdout=StringIO())
+            schema_file = Path(directory) / "schema" / "schema.json"
+            self.assertEqual("_title", json.loads(schema_file.read_bytes())["info"]["title"])
+            gzip_file = schema_file.with_name("schema.json.gz")
+            self.assertEqual(schema_file.read_bytes(), gzip.decompress(gzip_file.read_bytes()))
+
+    def test_admin_only(self) -> None:
+        """Test that the pre-built files are removed when the schema is admin only."""
+        with (
+            TemporaryDirectory() as directory,
+            override_settings(STATIC_ROOT=directory),
+            override_config(OPENAPI_ADMIN_ONLY=False),
+        ):
+            call_command("build_schema", stdout=StringIO())
+            schema_directory = Path(directory) / "schema"
+            self.assertTrue((schema_directory / "schema.json").exists())
+            # Changing the config rebuilds the files, through the `config_updated` signal
+            with override_config(OPENAPI_ADMIN_ONLY=True):
+                self.assertEqual([], list(schema_directory.iterdir()))
+                error_buffer = StringIO()
+                call_command("build_schema", stdout=StringIO(), stderr=error_buffer)
+                self.assertIn("The schema is admin only", clear_colors(error_buffer.getvalue()))
+                self.assertEqual([], list(schema_directory.iterdir()))
+
+    def test_sync_other_container(self) -> None:
+        """Test that the files built with outdated configs are rebuilt (or removed) by the bus handler."""
+        with (
+            TemporaryDirectory() as directory,
+            override_settings(STATIC_ROOT=directory),
+            override_config(OPENAPI_ADMIN_ONLY=False, OPENAPI_TITLE="_title"),
+        ):
+            schema_file = Path(directory) / "schema" / "schema.json"
+            schema_file.parent.mkdir()
+            # Built by a container that missed the changes
+            schema_file.write_text(json.dumps({"info": {"title": "_old_title", "version": "_old_version"}}))
+            sync_schema_files(None)
+            self.assertEqual("_title", json.loads(schema_file.read_bytes())["info"]["title"])
+            with patch("core.signals.build_schema_files") as build_mock:
+                sync_schema_files("OPENAPI_TITLE")  # Up to date
+                build_mock.assert_not_called()
+            # Without the `config_updated` signal, like in the other containers
+            with patch.object(config_updated, "send"), override_config(OPENAPI_ADMIN_ONLY=True):
+                self.assertFalse(schema_file.exists())
+
+
+class TestProfileSchemaCommand(TestCase):
+    """Test the profile_schema command."""
+
+    def test_default(self) -> None:
+        """Test that the report is printed, and that everything is restored afterwards."""
+        output_buffer = StringIO()
+        call_command("profile_schema", "--limit", "1", stdout=output_buffer)
+        output = clear_colors(output_buffer.getvalue())
+        for title in ("Endpoints:", "Serializers:", "Overrides:", "Postprocessing hooks:", "Generated the schema in"):
+            self.assertIn(title, output)
+        self.assertEqual(1, output.count("/ping/") + output.count("/users/"))  # Only the slowest endpoint
+        self.assertNotIn("get_operation", AutoSchema.__dict__)
+        self.assertNotIn("__wrapped__", AutoSchema.__dict__["_should_add_error_response"].__dict__)
+
+
+class TestBenchmarkExceptionHandlerCommand(TestCase):
+    """Test the benchmark_exception_handler command."""
+
+    def test_default(self) -> None:
+        """Test that every exception is benchmarked, and renders the same body in both paths."""
+        output_buffer, error_buffer = StringIO(), StringIO()
+        call_command("benchmark_exception_handler", "--iterations", "1", stdout=output_buffer, stderr=error_buffer)
+        output = clear_colors(output_buffer.getvalue())
+        for exc_class in BenchmarkExceptionHandlerCommand.EXCEPTIONS:
+            self.assertIn(f"{exc_class.__name__}: regular", output)
+        self.assertEqual("", error_buffer.getvalue())
+
+
 class TestSetupCommand(UnitTest):
     """Test the setup command."""
 
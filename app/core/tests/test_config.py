@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock, patch
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase
+from constance.test import override_config  # type: ignore[import-untyped]
+import core.config
+from core import context_processors
+from core.config import ConfigSnapshot, get_config
+from core.middleware import ConfigSnapshotMiddleware
+
+
+class TestConfigSnapshot(TestCase):
+    """Test the ConfigSnapshot."""
+
+    @override_config(OPENAPI_TITLE="_title")
+    def test_values_loaded_once(self) -> None:
+        """Test that the values are loaded only once, on first access."""
+        with patch("core.config.get_values", wraps=core.config.get_values) as get_values_mock:
+            snapshot = ConfigSnapshot()
+            get_values_mock.assert_not_called()
+            self.assertEqual("_title", snapshot.OPENAPI_TITLE)
+            self.assertEqual("_title", snapshot.OPENAPI_TITLE)
+            self.assertTrue(snapshot.OPENAPI_ADMIN_ONLY)
+            get_values_mock.assert_called_once()
+
+    def test_missing_key(self) -> None:
+        """Test that keys not in `CONSTANCE_CONFIG` raise an AttributeError."""
+        with self.assertRaises(AttributeError):
+            _ = ConfigSnapshot()._MISSING_KEY
+
+    def test_middleware(self) -> None:
+        """Test that the middleware sets the snapshot in the request, and that `get_config` returns it."""
+        request = RequestFactory().get("/")
+        get_response = MagicMock()
+        ConfigSnapshotMiddleware(get_response)(request)
+        get_response.assert_called_once_with(request)
+        self.assertIsInstance(request.config, ConfigSnapshot)  # type: ignore[attr-defined]
+        self.assertIs(request.config, get_config(request))  # type: ignore[attr-defined]
+
+    @override_config(OPENAPI_TITLE="_title")
+    def test_context_processor(self) -> None:
+        """Test that the context processor exposes the snapshot, only loading it when a template uses it."""
+        request = RequestFactory().get("/")
+        ConfigSnapshotMiddleware(MagicMock())(request)
+        with patch("core.config.get_values", wraps=core.config.get_values) as get_values_mock:
+            context = Context(context_processors.config(request))
+            self.assertEqual("", Template("{% if False %}{{ config.OPENAPI_TITLE }}{% endif %}").render(context))
+            get_values_mock.assert_not_called()
+            self.assertEqual("_title", Template("{{ config.OPENAPI_TITLE }}").render(context))
+            get_values_mock.assert_called_once()
+
+    def test_get_config_no_request(self) -> None:
+        """Test that `get_config` returns a new snapshot when there's no request snapshot."""
+        self.assertIsInstance(get_config(), ConfigSnapshot)
+        self.assertIsInstance(get_config(RequestFactory().get("/")), ConfigSnapshot)
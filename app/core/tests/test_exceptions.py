@@ -1,13 +1,26 @@
 from unittest.mock import MagicMock, patch
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
 from django.urls import reverse
+from django.utils.timezone import now
 from rest_framework import status
+from rest_framework.exceptions import ErrorDetail, NotFound, ValidationError
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from core.exceptions import ExceptionHandler, rendered_errors
+from extensions.utilities import uuid
+from extensions.utilities.metrics import metrics_registry
 from extensions.utilities.test import APITestCase
+from users.models import User
+from users.tests import sample_user
 
 
 class TestExceptionHandler(APITestCase):
     """Test the ExceptionHandler."""
 
+    def setUp(self) -> None:
+        rendered_errors.clear()
+        metrics_registry.clear()
+
     @patch("core.views.PingView.get")
     def test_validation_error(self, view_mock: MagicMock) -> None:
         """Test that Django ValidationErrors are correctly converted to DRF ValidationErrors."""
@@ -25,3 +38,103 @@ class TestExceptionHandler(APITestCase):
             },
             res.json(),
         )
+
+    def test_fast_path(self) -> None:
+        """Test that common errors are rendered once, and served identically afterwards."""
+        with patch.object(
+            ExceptionHandler, "format_exception", autospec=True, side_effect=ExceptionHandler.format_exception
+        ) as mock:
+            first_res = self.client.get(reverse("users:whoami"))
+            second_res = self.client.get(reverse("users:whoami"))
+        mock.assert_called_once()
+        self.assertEqual(1, len(rendered_errors))
+        for res in (first_res, second_res):
+            self.assertResponseStatusCode(status.HTTP_401_UNAUTHORIZED, res)
+            self.assertEqual("application/json", res["Content-Type"])
+            self.assertIn("WWW-Authenticate", res)
+            self.assertEqual(
+                {
+                    "type": "client_error",
+                    "errors": [
+                        {
+                            "code": "not_authenticated",
+                            "detail": "Authentication credentials were not provided.",
+                            "attr": None,
+                        }
+                    ],
+                },
+                res.json(),
+            )
+        self.assertEqual(first_res.content, second_res.content)
+
+    @patch("core.views.PingView.get")
+    def test_converted_once(self, view_mock: MagicMock) -> None:
+        """Test that the exception is converted only once, in and out of the fast path."""
+        for exc in (NotFound(), DjangoValidationError("_message")):
+            view_mock.side_effect = exc
+            with patch.object(
+                ExceptionHandler,
+                "convert_known_exceptions",
+                autospec=True,
+                side_effect=ExceptionHandler.convert_known_exceptions,
+            ) as mock:
+                self.client.get(reverse("ping"))
+            mock.assert_called_once()
+
+    @patch("core.views.PingView.get")
+    def test_fast_path_message(self, view_mock: MagicMock) -> None:
+        """Test that errors with different messages are rendered separately."""
+        for message in ("_message_1", "_message_2"):
+            view_mock.side_effect = NotFound(message)
+            res = self.client.get(reverse("ping"))
+            self.assertResponseStatusCode(status.HTTP_404_NOT_FOUND, res)
+            self.assertEqual(message, res.json()["errors"][0]["detail"])
+        self.assertEqual(2, len(rendered_errors))
+
+    @patch("core.views.PingView.get")
+    def test_fast_path_skipped(self, view_mock: MagicMock) -> None:
+        """Test that validation errors don't take the fast path."""
+        view_mock.side_effect = DjangoValidationError("_message", code="_code")
+        self.client.get(reverse("ping"))
+        self.assertEqual(0, len(rendered_errors))
+
+    @patch("core.views.PingView.get")
+    def test_metrics(self, view_mock: MagicMock) -> None:
+        """Test that the handled exceptions are recorded in the metrics registry."""
+        view_mock.side_effect = DjangoValidationError("_message", code="_code")
+        self.client.get(reverse("ping"))
+        self.client.get(reverse("ping"))
+        self.client.get(reverse("users:whoami"))
+        timings = {
+            tuple(timing["labels"].values()): timing["count"] for timing in metrics_registry.snapshot()["timings"]
+        }
+        self.assertEqual(
+            {
+                ("invalid", "django.core.exceptions.ValidationError", "400", "PingView"): 2,
+                ("not_authenticated", "rest_framework.exceptions.NotAuthenticated", "401", "UserWhoamiView"): 1,
+            },
+            timings,
+        )
+
+    def test_unique_violation(self) -> None:
+        """Test that unique violation IntegrityErrors are converted to the field's ValidationError."""
+        user = sample_user()
+        with self.assertRaises(IntegrityError) as ctx, transaction.atomic():
+            User.objects.create_user(username=user.username)
+        exc = ExceptionHandler(ctx.exception, {}).convert_known_exceptions(ctx.exception)
+        self.assertIsInstance(exc, ValidationError)
+        assert isinstance(exc, ValidationError)
+        self.assertEqual({"username": [ErrorDetail("user with this username already exists.", "unique")]}, exc.detail)
+
+    def test_unique_violation_not_enforced(self) -> None:
+        """Test that unique violations of models without `enforce_unique_in_db` aren't converted."""
+        token = OutstandingToken.objects.create(jti=uuid(), token="_token", expires_at=now())
+        with self.assertRaises(IntegrityError) as ctx, transaction.atomic():
+            OutstandingToken.objects.create(jti=token.jti, token="_token", expires_at=now())
+        self.assertIsNone(ExceptionHandler(ctx.exception, {}).convert_unique_violation(ctx.exception))
+        self.assertIs(ctx.exception, ExceptionHandler(ctx.exception, {}).convert_known_exceptions(ctx.exception))
+
+    def test_other_integrity_error(self) -> None:
+        """Test that other IntegrityErrors aren't converted."""
+        exc = IntegrityError()
+        self.assertIs(exc, ExceptionHandler(exc, {}).convert_known_exceptions(exc))
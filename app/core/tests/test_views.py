@@ -1,6 +1,11 @@
+from unittest.mock import patch
 from django.urls import reverse
 from rest_framework import status
+from constance.test import override_config  # type: ignore[import-untyped]
+from drf_spectacular.generators import SchemaGenerator
+from core.view_mixins import rendered_responses
 from extensions.utilities.test import APITestCase
+from users.tests import sample_user
 
 
 class TestCoreAPI(APITestCase):
@@ -11,3 +16,65 @@ class TestCoreAPI(APITestCase):
         res = self.client.get(reverse("ping"))
         self.assertResponseStatusCode(status.HTTP_200_OK, res)
         self.assertEqual("pong", res.json())
+
+    def test_metrics(self) -> None:
+        """Test the metrics endpoint."""
+        res = self.client.get(reverse("metrics"))
+        self.assertResponseStatusCode(status.HTTP_401_UNAUTHORIZED, res)
+        self.client.force_authenticate(sample_user(is_staff=True))
+        res = self.client.get(reverse("metrics"))
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        for key in ("counters", "timings", "password_hashing"):
+            self.assertIn(key, res.json())
+
+
+@override_config(OPENAPI_ADMIN_ONLY=False)
+class TestSchemaViews(APITestCase):
+    """Test the caching of the schema and Swagger UI endpoints."""
+
+    def setUp(self) -> None:
+        rendered_responses.clear()
+
+    def test_schema_cached(self) -> None:
+        """Test that the schema is only generated once."""
+        with patch.object(
+            SchemaGenerator, "get_schema", autospec=True, side_effect=SchemaGenerator.get_schema
+        ) as mock:
+            first_res = self.client.get(reverse("schema"), HTTP_ACCEPT="application/json")
+            second_res = self.client.get(reverse("schema"), HTTP_ACCEPT="application/json")
+        self.assertResponseStatusCode(status.HTTP_200_OK, first_res)
+        self.assertResponseStatusCode(status.HTTP_200_OK, second_res)
+        mock.assert_called_once()
+        self.assertEqual(first_res.content, second_res.content)
+        self.assertEqual(first_res["ETag"], second_res["ETag"])
+        self.assertEqual(first_res["Content-Type"], second_res["Content-Type"])
+
+    def test_schema_config_changed(self) -> None:
+        """Test that changing the OpenAPI configs generates a new schema."""
+        first_res = self.client.get(reverse("schema"), HTTP_ACCEPT="application/json")
+        with override_config(OPENAPI_TITLE="_title"):
+            second_res = self.client.get(reverse("schema"), HTTP_ACCEPT="application/json")
+        self.assertEqual("_title", second_res.json()["info"]["title"])
+        self.assertNotEqual(first_res["ETag"], second_res["ETag"])
+
+    def test_schema_language(self) -> None:
+        """Test that the schema is cached per language."""
+        with patch.object(
+            SchemaGenerator, "get_schema", autospec=True, side_effect=SchemaGenerator.get_schema
+        ) as mock:
+            for language in ("en-gb", "pt", "en-gb"):
+                res = self.client.get(reverse("schema"), HTTP_ACCEPT="application/json", HTTP_ACCEPT_LANGUAGE=language)
+                self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        self.assertEqual(2, mock.call_count)
+
+    def test_not_modified(self) -> None:
+        """Test that conditional requests with a matching ETag are answered with a 304."""
+        for url in (reverse("schema"), reverse("schema-swagger")):
+            with self.subTest(url=url):
+                res = self.client.get(url)
+                self.assertResponseStatusCode(status.HTTP_200_OK, res)
+                res = self.client.get(url, HTTP_IF_NONE_MATCH=res["ETag"])
+                self.assertResponseStatusCode(status.HTTP_304_NOT_MODIFIED, res)
+                self.assertEqual(b"", res.content)
+                res = self.client.get(url, HTTP_IF_NONE_MATCH='"_other"')
+                self.assertResponseStatusCode(status.HTTP_200_OK, res)
@@ -20,4 +20,5 @@ urlpatterns: URLPatternsList = [
         ),
     ),
     path("ping/", views.PingView.as_view(), name="ping"),
+    path("metrics/", views.MetricsView.as_view(), name="metrics"),
 ]
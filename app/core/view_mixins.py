@@ -0,0 +1,60 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.translation import get_language
+from rest_framework.request import Request
+from rest_framework.views import APIView
+from extensions.utilities.cache import TTLCache
+
+
+@dataclass(frozen=True)
+class RenderedResponse:
+    """A rendered response, as kept by the `RenderedResponseCacheMixin`."""
+
+    content: bytes
+    headers: dict[str, str]
+    etag: str
+
+
+rendered_responses = TTLCache[tuple[Hashable, ...], RenderedResponse](
+    max_size=settings.CORE_RENDERED_RESPONSES_CACHE_MAX_SIZE,
+    timeout=settings.CORE_RENDERED_RESPONSES_CACHE_TIMEOUT,
+)
+"""Per-process cache of the responses rendered by the views using the `RenderedResponseCacheMixin`."""
+
+
+class RenderedResponseCacheMixin(APIView):
+    """
+    Mixin for expensive GET views whose response only depends on what `get_render_cache_key` returns.
+
+    The rendered response is kept in a per-process cache, so it's only generated (and rendered) once per key. Responses
+    carry a strong `ETag` (a hash of the content), and conditional requests (`If-None-Match`) are answered with a 304.
+    **Note**: the cache lives as long as the process, which is what ties it to the code version.
+    """
+
+    def get_render_cache_key(self, request: Request) -> Optional[tuple[Hashable, ...]]:
+        """Get the cache key for the response, or `None` to skip the cache."""
+        # The active language (see `LocaleMiddleware`), for the translated strings in the response
+        return (type(self).__qualname__, request.accepted_media_type, request.get_full_path(), get_language())
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """Override this method to serve the response from the cache, generating it on a miss."""
+        key = self.get_render_cache_key(request)
+        rendered = rendered_responses.get(key) if key is not None else None
+        if rendered is None:
+            response = super().get(request, *args, **kwargs)  # type: ignore[misc]
+            response = self.finalize_response(request, response, *args, **kwargs)
+            response.render()  # type: ignore[attr-defined]
+            if key is None or response.status_code != 200:
+                return response
+            rendered = RenderedResponse(
+                content=response.content,  # type: ignore[attr-defined]
+                headers=dict(response.headers),
+                etag=f'"{hashlib.sha256(response.content).hexdigest()}"',  # type: ignore[attr-defined]
+            )
+            rendered_responses.set(key, rendered)
+        response = HttpResponse(rendered.content, headers={**rendered.headers, "ETag": rendered.etag})
+        return get_conditional_response(request._request, etag=rendered.etag, response=response) or response
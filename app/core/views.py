@@ -1,12 +1,16 @@
-from typing import Any
+from typing import Any, Hashable, Optional
 from rest_framework import status
-from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.permissions import AllowAny, BasePermission, IsAdminUser
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from constance import config  # type: ignore[import-untyped]
 from drf_spectacular.utils import extend_schema
 from drf_spectacular.views import SpectacularAPIView as BaseSpectacularAPIView
 from drf_spectacular.views import SpectacularSwaggerView as BaseSpectacularSwaggerView
+from core.config import get_config
+from core.openapi import get_openapi_config
+from core.view_mixins import RenderedResponseCacheMixin
+from extensions.utilities.metrics import metrics_registry
 
 
 @extend_schema(tags=["Core"])
@@ -23,17 +27,49 @@ class PingView(APIView):
         return Response("pong", status=status.HTTP_200_OK)
 
 
-class SpectacularAPIView(BaseSpectacularAPIView):
-    """Custom SpectacularAPIView so that we can configure the permissions from the Constance config."""
+@extend_schema(tags=["Core"])
+class MetricsView(APIView):
+    """View that replies with the metrics of the process that serves the request."""
+
+    permission_classes = (IsAdminUser,)
+    http_method_names = ("get",)
+
+    @extend_schema(operation_id="metrics")
+    @extend_schema(summary="Metrics")
+    @extend_schema(responses={status.HTTP_200_OK: {"type": "object"}})
+    def get(self, *args: Any, **kwargs: Any) -> Response:
+        return Response(metrics_registry.snapshot(), status=status.HTTP_200_OK)
+
+
+class SpectacularAPIView(RenderedResponseCacheMixin, BaseSpectacularAPIView):
+    """
+    Custom SpectacularAPIView so that we can configure the permissions from the Constance config, and cache the
+    rendered schema.
+    """
+
+    def get_render_cache_key(self, request: Request) -> Optional[tuple[Hashable, ...]]:
+        """Override this method so that the cache is keyed by the OpenAPI configs, and skipped for non public schemas."""
+        key = super().get_render_cache_key(request)
+        if key is None or not self.serve_public:  # The schema depends on the User
+            return None
+        return (*key, *get_openapi_config(request))
+
+    def get_permissions(self) -> list[BasePermission]:  # pragma: no cover
+        """Override this method so that the permissions are read from the request's config."""
+        return [IsAdminUser() if get_config(self.request).OPENAPI_ADMIN_ONLY else AllowAny()]
 
-    def __init__(self, **kwargs: Any) -> None:  # pragma: no cover
-        super().__init__(**kwargs)
-        self.permission_classes = (IsAdminUser,) if config.OPENAPI_ADMIN_ONLY else (AllowAny,)
 
+class SpectacularSwaggerView(RenderedResponseCacheMixin, BaseSpectacularSwaggerView):
+    """
+    Custom SpectacularSwaggerView so that we can configure the permissions from the Constance config, and cache the
+    rendered page.
+    """
 
-class SpectacularSwaggerView(BaseSpectacularSwaggerView):
-    """Custom SpectacularSwaggerView so that we can configure the permissions from the Constance config."""
+    def get_render_cache_key(self, request: Request) -> Optional[tuple[Hashable, ...]]:
+        """Override this method so that the cache is keyed by the OpenAPI configs."""
+        key = super().get_render_cache_key(request)
+        return None if key is None else (*key, *get_openapi_config(request))
 
-    def __init__(self, **kwargs: Any) -> None:  # pragma: no cover
-        super().__init__(**kwargs)
-        self.permission_classes = (IsAdminUser,) if config.OPENAPI_ADMIN_ONLY else (AllowAny,)
+    def get_permissions(self) -> list[BasePermission]:  # pragma: no cover
+        """Override this method so that the permissions are read from the request's config."""
+        return [IsAdminUser() if get_config(self.request).OPENAPI_ADMIN_ONLY else AllowAny()]
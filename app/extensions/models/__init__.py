@@ -1 +1,2 @@
 from .base import AbstractBaseModel as AbstractBaseModel  # re-export
+from .base import ValidationMode as ValidationMode  # re-export
@@ -1,6 +1,19 @@
-from typing import Any
-from django.db.models import Model
+from enum import StrEnum
+from typing import Any, ClassVar, Iterable, Optional, Self
+from django.db.models import Index, Model, UniqueConstraint
 from extensions.models import mixins
+from extensions.models.managers import BaseManager
+
+
+class ValidationMode(StrEnum):
+    """How much validation `AbstractBaseModel.save` runs."""
+
+    FULL = "full"
+    """Validate every field, the uniqueness and the constraints (`full_clean`)."""
+    CHANGED = "changed"
+    """Validate only the fields being saved (the `update_fields`), and the checks involving them."""
+    SKIP_UNIQUE = "skip_unique"
+    """Validate everything but the uniqueness, leaving it to the database."""
 
 
 class AbstractBaseModel(
@@ -16,16 +29,68 @@ class AbstractBaseModel(
     - `created_at` field with the creation datetime;
     - `updated_at` field with the last updated datetime;
     - Extended `repr` method for better debugging;
-    - "Fixed" save method that performs validation.
+    - "Fixed" save method that performs validation;
+    - `BaseManager`, with bulk operations that also perform it (`bulk_create_validated` and `bulk_update_validated`).
+
+    Models can set `enforce_unique_in_db = True` to leave their uniqueness checks (`unique` fields, `unique_together`
+    and `UniqueConstraint`s) to the database: `save` skips the SELECTs that validate them, and a violation raises an
+    `IntegrityError` instead (which the `ExceptionHandler` answers with the same 400 as the validation would). Use the
+    `UniqueInDatabaseSerializerMixin` on their serializers, so those skip their pre-checks as well.
+    **Note**: within a transaction, a failed INSERT / UPDATE aborts it; wrap the save in `atomic()` (a savepoint) if the
+    transaction must go on after a violation.
+
+    The validation run by `save` can be reduced with a `ValidationMode`, set per model (`validation_mode`) or per call
+    (`save(validation_mode=...)`); by default, it's the `full_clean`.
     """
 
-    def save(self, *args: Any, **kwargs: Any) -> None:
+    objects = BaseManager[Self]()
+    enforce_unique_in_db: ClassVar[bool] = False
+    validation_mode: ClassVar[ValidationMode] = ValidationMode.FULL
+    _skip_unique = False
+
+    def get_changed_fields(self, update_fields: Optional[Iterable[str]]) -> Optional[set[str]]:
+        """Get the names of the fields being saved, or `None` if they're not known (all of them are validated)."""
+        if update_fields is None:
+            return None
+        return {self._meta.get_field(name).name for name in update_fields}
+
+    def save(self, *args: Any, validation_mode: Optional[ValidationMode] = None, **kwargs: Any) -> None:
         # Apparently, Django doesn't do a full_clean on every save; only bulk operations
         # Override the save so we can get that full_clean, at a risk of potentially running the validation more than
         # once.
-        self.full_clean()
+        mode = validation_mode or self.validation_mode
+        exclude: Optional[list[str]] = None
+        if mode == ValidationMode.CHANGED:
+            changed_fields = self.get_changed_fields(kwargs.get("update_fields"))
+            if changed_fields is not None:
+                exclude = [field.name for field in self._meta.fields if field.name not in changed_fields]
+        # Expressions (like `F("field") + 1`) are only resolved by the database, so their fields can't be validated
+        expression_fields = [
+            field.name
+            for field in self._meta.concrete_fields
+            if hasattr(self.__dict__.get(field.attname), "resolve_expression")
+        ]
+        if expression_fields:
+            exclude = [*(exclude or []), *expression_fields]
+        self._skip_unique = self.enforce_unique_in_db or mode == ValidationMode.SKIP_UNIQUE
+        try:
+            self.full_clean(exclude=exclude, validate_unique=not self._skip_unique)
+        finally:
+            self._skip_unique = False
         return super().save(*args, **kwargs)
 
+    def get_constraints(self) -> list[tuple[type[Model], list[Any]]]:
+        """Override this method so that `save` leaves the `UniqueConstraint`s to the database, when skipping uniqueness."""
+        constraints: list[tuple[type[Model], list[Any]]] = super().get_constraints()
+        if not self._skip_unique:
+            return constraints
+        return [
+            (model_class, [c for c in model_constraints if not isinstance(c, UniqueConstraint)])
+            for model_class, model_constraints in constraints
+        ]
+
     class Meta:
         abstract = True
         ordering = ("-created_at",)
+        # For the keyset pagination (see `KeysetPagination`); named per model by Django
+        indexes = (Index(fields=("created_at", "id")),)
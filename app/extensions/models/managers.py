@@ -1,8 +1,162 @@
+import operator
+from collections import defaultdict
+from functools import reduce
+from itertools import batched
+from typing import Any, Iterable, Optional, Sequence
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 from django.db import models
 from extensions.models.mixins import SoftDeleteMixin
 
 
-class SoftDeleteManager[T: SoftDeleteMixin](models.Manager[T]):
+class BaseManager[T: models.Model](models.Manager[T]):
+    """
+    Base manager for the `AbstractBaseModel`, with bulk operations that keep the validation `save` does.
+
+    The per-instance validation (`full_clean`) is split: the checks that run in Python (fields and `clean`) still run
+    per instance, while the ones that query the database (foreign keys and uniqueness) run once per field (or field set)
+    for all the instances, with `IN` queries in chunks of `VALIDATION_BATCH_SIZE`.
+    """
+
+    VALIDATION_BATCH_SIZE = 10_000
+
+    def bulk_create_validated(self, objs: Iterable[T], batch_size: Optional[int] = None) -> list[T]:
+        """
+        Validate the instances and insert them with `bulk_create` (which fills the `auto_now` / `auto_now_add` fields,
+        and the primary keys, with `RETURNING`). See `validate_bulk`.
+        """
+        objs = list(objs)
+        self.validate_bulk(objs)
+        return self.bulk_create(objs, batch_size=batch_size)
+
+    def bulk_update_validated(self, objs: Iterable[T], fields: Sequence[str], batch_size: Optional[int] = None) -> int:
+        """
+        Validate the instances' `fields` and update them with `bulk_update`, alongside the `auto_now` fields (which
+        `bulk_update` doesn't fill by itself). See `validate_bulk`.
+        """
+        objs = list(objs)
+        auto_now_fields = [f for f in self.model._meta.concrete_fields if getattr(f, "auto_now", False)]
+        for obj in objs:
+            for field in auto_now_fields:
+                field.pre_save(obj, add=False)
+        update_fields = {self.model._meta.get_field(name).name for name in fields} | {f.name for f in auto_now_fields}
+        self.validate_bulk(objs, update_fields)
+        return self.bulk_update(objs, update_fields, batch_size=batch_size)
+
+    def validate_bulk(self, objs: Sequence[T], fields: Optional[set[str]] = None) -> None:
+        """
+        Validate the instances like `full_clean` would (or only their `fields`, if given), except for the non-unique
+        constraints (left to the database) and the primary key's uniqueness. Raises a single `ValidationError` with the
+        errors of all the instances, under `"<index>.<field>"` keys.
+        """
+        errors: defaultdict[str, list[ValidationError]] = defaultdict(list)
+        concrete_fields = [f for f in self.model._meta.concrete_fields if fields is None or f.name in fields]
+        relations = [f for f in concrete_fields if f.is_relation and not f.remote_field.parent_link]
+        exclude = {f.name for f in self.model._meta.concrete_fields} - {f.name for f in concrete_fields}
+        for index, obj in enumerate(objs):
+            try:
+                # The foreign keys are validated below, without a query per instance
+                obj.full_clean(
+                    exclude=exclude | {f.name for f in relations}, validate_unique=False, validate_constraints=False
+                )
+            except ValidationError as e:
+                self._add_errors(errors, index, e)
+            for field in relations:
+                value = getattr(obj, field.attname)
+                if field.blank and value in field.empty_values:
+                    continue
+                try:
+                    models.Field.validate(field, value, obj)
+                    field.run_validators(value)
+                except ValidationError as e:
+                    errors[f"{index}.{field.name}"].extend(e.error_list)
+        for field in relations:
+            self._validate_relation(objs, field, errors)
+        if objs:
+            unique_checks, _ = objs[0]._get_unique_checks(include_meta_constraints=True)
+            for model_class, unique_check in unique_checks:
+                if unique_check == (model_class._meta.pk.name,) or (
+                    fields is not None and fields.isdisjoint(unique_check)
+                ):
+                    continue
+                self._validate_unique(objs, model_class, unique_check, errors, updating=fields is not None)
+        if errors:
+            raise ValidationError(dict(errors))
+
+    @staticmethod
+    def _add_errors(errors: defaultdict[str, list[ValidationError]], index: int, error: ValidationError) -> None:
+        for field, field_errors in error.update_error_dict({}).items():
+            errors[f"{index}.{field}"].extend(field_errors)
+
+    def _validate_relation(
+        self, objs: Sequence[T], field: Any, errors: defaultdict[str, list[ValidationError]]
+    ) -> None:
+        """Check that all the related instances exist, with one query per chunk (see `ForeignKey.validate`)."""
+        target_field = field.target_field
+        values = {target_field.to_python(getattr(obj, field.attname)) for obj in objs}
+        values.discard(None)
+        existing: set[Any] = set()
+        queryset = field.remote_field.model._base_manager.using(self.db).complex_filter(field.get_limit_choices_to())
+        for chunk in batched(values, self.VALIDATION_BATCH_SIZE, strict=False):
+            lookup = {f"{field.remote_field.field_name}__in": chunk}
+            existing.update(queryset.filter(**lookup).values_list(field.remote_field.field_name, flat=True))
+        for index, obj in enumerate(objs):
+            value = target_field.to_python(getattr(obj, field.attname))
+            if value is not None and value not in existing:
+                errors[f"{index}.{field.name}"].append(
+                    ValidationError(
+                        field.error_messages["invalid"],
+                        code="invalid",
+                        params={
+                            "model": field.remote_field.model._meta.verbose_name,
+                            "pk": value,
+                            "field": field.remote_field.field_name,
+                            "value": value,
+                        },
+                    )
+                )
+
+    def _validate_unique(
+        self,
+        objs: Sequence[T],
+        model_class: type[models.Model],
+        unique_check: tuple[str, ...],
+        errors: defaultdict[str, list[ValidationError]],
+        updating: bool,
+    ) -> None:
+        """
+        Check the uniqueness of the field set among the instances, and against the database with one query per chunk
+        (see `Model._perform_unique_checks`).
+        """
+        attnames = [model_class._meta.get_field(name).attname for name in unique_check]
+        keys: dict[int, tuple[Any, ...]] = {}
+        first_index: dict[tuple[Any, ...], int] = {}
+        duplicates: set[int] = set()
+        for index, obj in enumerate(objs):
+            key = tuple(getattr(obj, attname) for attname in attnames)
+            if any(value is None for value in key):  # NULLs never collide
+                continue
+            keys[index] = key
+            if first_index.setdefault(key, index) != index:
+                duplicates.add(index)
+        queryset = model_class._default_manager.using(self.db)
+        if updating:
+            queryset = queryset.exclude(pk__in=[obj.pk for obj in objs])
+        existing: set[tuple[Any, ...]] = set()
+        for chunk in batched(first_index, self.VALIDATION_BATCH_SIZE, strict=False):
+            if len(attnames) == 1:
+                chunk_filter = models.Q(**{f"{attnames[0]}__in": [key[0] for key in chunk]})
+            else:
+                chunk_filter = reduce(
+                    operator.or_, (models.Q(**dict(zip(attnames, key, strict=True))) for key in chunk)
+                )
+            existing.update(tuple(row) for row in queryset.filter(chunk_filter).values_list(*attnames))
+        error_key = unique_check[0] if len(unique_check) == 1 else NON_FIELD_ERRORS
+        for index, key in keys.items():
+            if index in duplicates or key in existing:
+                errors[f"{index}.{error_key}"].append(objs[index].unique_error_message(model_class, unique_check))
+
+
+class SoftDeleteManager[T: SoftDeleteMixin](BaseManager[T]):
     """
     Custom manager for models that implement the `SoftDeleteMixin`. Includes a method `exclude_deleted` to return the
     queryset with the soft deleted models filtered out.
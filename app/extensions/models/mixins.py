@@ -1,6 +1,9 @@
 import json
-from typing import Any, Iterable, Optional
-from uuid import uuid4
+from copy import deepcopy
+from datetime import date, time, timedelta
+from decimal import Decimal
+from typing import Any, Iterable, Optional, Self, Sequence
+from uuid import UUID, uuid4, uuid7
 from django.conf import settings
 from django.db import models
 from django.db.models.fields.files import FieldFile
@@ -16,6 +19,24 @@ class UUIDPrimaryKeyMixin(models.Model):
         abstract = True
 
 
+class UUID7PrimaryKeyMixin(UUIDPrimaryKeyMixin):
+    """
+    Mixin to use a time-ordered UUID (version 7) as the primary key field, instead of a random one.
+
+    New keys are always "higher" than older ones, so inserts land on the right edge of the primary key's index (instead
+    of scattering across it), and "newest first" can be served by the primary key (`ordering = ("-id",)`). The creation
+    time can be read from the keys with `extensions.utilities.uuid7_datetime`, and filtered by with `uuid7_range`.
+
+    To use it with the `AbstractBaseModel`, list it first: `class MyModel(UUID7PrimaryKeyMixin, AbstractBaseModel)`.
+    **Note**: the keys reveal when the objects were created.
+    """
+
+    id = models.UUIDField(default=uuid7, primary_key=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+
 class CreatedAtMixin(models.Model):
     """Mixin to add a `created_at` DateTimeField that sets the creation time."""
 
@@ -66,7 +87,84 @@ class SoftDeleteMixin(models.Model):
     def soft_delete(self) -> None:
         """Soft delete this instance by marking `is_deleted` as `True`."""
         self.is_deleted = True
-        self.save()
+        # Only write (and, with `ValidationMode.CHANGED`, validate) the flag, and the `auto_now` fields
+        auto_now_fields = [f.name for f in self._meta.concrete_fields if getattr(f, "auto_now", False)]
+        self.save(update_fields=["is_deleted", *auto_now_fields])
+
+
+class DirtyFieldsMixin(models.Model):
+    """
+    Mixin to track which fields changed since the instance was loaded (or last saved), so that `save` only writes
+    those: it passes them as `update_fields` (alongside any `auto_now` field, like `updated_at`), and skips the query
+    entirely (and the `pre_save` / `post_save` signals) when nothing changed.
+
+    Saves with explicit `update_fields`, inserts, and instances that weren't loaded from the database (nor saved yet)
+    behave as usual.
+    """
+
+    IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None), Decimal, UUID, date, time, timedelta)
+    """Types whose values are kept as they are in the snapshot; other values (lists, dicts...) are copied."""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db: Optional[str], field_names: Sequence[str], values: Sequence[Any]) -> Self:
+        """Override this method to take the snapshot of the loaded values."""
+        instance = super().from_db(db, field_names, values)
+        instance._take_snapshot(field_names)
+        return instance
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Override this method so that copies (`copy` restores the instance's state through it, like unpickling) get
+        their own snapshot, instead of sharing the original's.
+        """
+        super().__setstate__(state)
+        if "_loaded_values" in self.__dict__:
+            self.__dict__["_loaded_values"] = self.__dict__["_loaded_values"].copy()
+
+    def _take_snapshot(self, attnames: Iterable[str]) -> None:
+        snapshot: dict[str, Any] = self.__dict__.setdefault("_loaded_values", {})
+        for attname in attnames:
+            if attname in self.__dict__:
+                value = self.__dict__[attname]
+                snapshot[attname] = value if isinstance(value, self.IMMUTABLE_TYPES) else deepcopy(value)
+
+    def get_dirty_fields(self) -> Optional[set[str]]:
+        """Get the names of the fields changed since the last snapshot, or `None` if there's no snapshot."""
+        snapshot: Optional[dict[str, Any]] = self.__dict__.get("_loaded_values")
+        if snapshot is None:
+            return None
+        return {
+            field.name
+            for field in self._meta.concrete_fields
+            # Deferred fields that weren't loaded are not in `__dict__`
+            if field.attname in self.__dict__
+            and (field.attname not in snapshot or snapshot[field.attname] != self.__dict__[field.attname])
+        }
+
+    def refresh_from_db(self, *args: Any, fields: Optional[Sequence[str]] = None, **kwargs: Any) -> None:
+        """Override this method to take the snapshot of the refreshed values."""
+        super().refresh_from_db(*args, fields=fields, **kwargs)
+        refreshed = self._meta.concrete_fields if fields is None else [self._meta.get_field(f) for f in fields]
+        self._take_snapshot(getattr(field, "attname", field.name) for field in refreshed)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Override this method to only write the fields that changed."""
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            dirty_fields = self.get_dirty_fields()
+            if dirty_fields is not None and self._meta.pk.name not in dirty_fields:
+                if not dirty_fields:
+                    return
+                auto_now_fields = {f.name for f in self._meta.concrete_fields if getattr(f, "auto_now", False)}
+                kwargs["update_fields"] = dirty_fields | auto_now_fields
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        saved = (
+            self._meta.concrete_fields if update_fields is None else [self._meta.get_field(f) for f in update_fields]
+        )
+        self._take_snapshot(getattr(field, "attname", field.name) for field in saved)
 
 
 class ExtendedReprMixin(models.Model):
@@ -0,0 +1,97 @@
+import json
+from typing import Any, Optional
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db.models import F, Model, QuerySet
+from django.db.models.fields.tuple_lookups import TupleGreaterThan, TupleLessThan
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+
+class KeysetPagination[_MT: Model](CursorPagination):
+    """
+    CursorPagination that pages with keyset queries: the cursor holds the values of the ordering field and the primary
+    key (the tie-breaker) of the row the page starts after, and the page is fetched with a row comparison, like
+    `WHERE (created_at, id) < (%s, %s) ORDER BY created_at DESC, id DESC LIMIT <page size + 1>`.
+
+    With a composite index on `(<ordering field>, <primary key>)` (the `AbstractBaseModel` has one, for `created_at`),
+    every page costs the same as the first one; there are no offsets, and no `COUNT(*)`.
+
+    The ordering field is `ordering`, or the first one in the model's `Meta.ordering` (`-created_at`, for the
+    `AbstractBaseModel`). It must be a non-nullable field.
+    """
+
+    ordering: Optional[str] = None  # type: ignore[assignment]
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_ordering(self, request: Request, queryset: QuerySet[_MT], view: Optional[APIView]) -> tuple[str, str]:
+        """Override this method to use the model's ordering, with the primary key as the tie-breaker."""
+        ordering = self.ordering or next(iter(queryset.model._meta.ordering), None)
+        if not isinstance(ordering, str):
+            raise ImproperlyConfigured(
+                f"Using {type(self).__name__} requires `ordering`, or a field in {queryset.model.__name__}'s "
+                "`Meta.ordering`."
+            )
+        return ordering, "-pk" if ordering.startswith("-") else "pk"
+
+    def get_position(self, obj: _MT) -> str:
+        """Get the position of the object in the ordering, for the cursors."""
+        return json.dumps([self.field.value_to_string(obj), str(obj.pk)])
+
+    def parse_position(self, position: Optional[str]) -> tuple[Any, Any]:
+        """Get the values of the ordering field and the primary key from a cursor's position."""
+        try:
+            value, pk = json.loads(position or "")
+            return self.field.to_python(value), self.model._meta.pk.to_python(pk)
+        except TypeError, ValueError, ValidationError:
+            raise NotFound(self.invalid_cursor_message) from None
+
+    def paginate_queryset(
+        self, queryset: QuerySet[_MT], request: Request, view: Optional[APIView] = None
+    ) -> Optional[list[_MT]]:
+        """Override this method to fetch the page with a keyset query."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        ordering, _ = self.get_ordering(request, queryset, view)
+        self.model = queryset.model
+        field_name = ordering.removeprefix("-")
+        self.field = self.model._meta.get_field(field_name)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        # Pages before the cursor are fetched in the opposite order, and then reversed
+        descending = ordering.startswith("-") != reverse
+        queryset = queryset.order_by(*((f"-{field_name}", "-pk") if descending else (field_name, "pk")))
+        if self.cursor is not None:
+            lookup = TupleLessThan if descending else TupleGreaterThan
+            queryset = queryset.filter(lookup((F(field_name), F("pk")), self.parse_position(self.cursor.position)))
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if reverse:
+            self.page.reverse()
+        # There's always a page after a page fetched backwards, and before a page fetched with a cursor
+        self.has_next = has_more if not reverse else bool(self.page)
+        self.has_previous = has_more if reverse else self.cursor is not None and bool(self.page)
+        self.display_page_controls = self.has_next or self.has_previous
+        return self.page
+
+    def get_next_link(self) -> Optional[str]:
+        """Override this method to point the cursor after the last object of the page."""
+        if not self.has_next:
+            return None
+        cursor = Cursor(offset=0, reverse=False, position=self.get_position(self.page[-1]))
+        link: str = self.encode_cursor(cursor)
+        return link
+
+    def get_previous_link(self) -> Optional[str]:
+        """Override this method to point the cursor before the first object of the page."""
+        if not self.has_previous:
+            return None
+        cursor = Cursor(offset=0, reverse=True, position=self.get_position(self.page[0]))
+        link: str = self.encode_cursor(cursor)
+        return link
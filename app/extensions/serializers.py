@@ -1,7 +1,9 @@
 from typing import Any, Iterable, Literal, Mapping, Optional, Protocol, overload
 from django.db.models import Model, QuerySet
+from rest_framework.fields import Field
 from rest_framework.relations import PKOnlyObject
 from rest_framework.serializers import ModelSerializer, PrimaryKeyRelatedField
+from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
 from drf_spectacular.extensions import OpenApiSerializerFieldExtension
 from drf_spectacular.openapi import AutoSchema
 
@@ -112,6 +114,33 @@ class InlineSerializer[_MT: Model](ModelSerializer[_MT]):
         return InnerSerializer
 
 
+class UniqueInDatabaseSerializerMixin[_MT: Model](ModelSerializer[_MT]):
+    """
+    ModelSerializer mixin that drops the uniqueness validators (`UniqueValidator` and `UniqueTogetherValidator`) when
+    the model leaves its uniqueness checks to the database (`enforce_unique_in_db`; see `AbstractBaseModel`), sparing
+    a SELECT per check on every write. Violations are then reported by the `ExceptionHandler`, with the same 400.
+    """
+
+    @property
+    def enforce_unique_in_db(self) -> bool:
+        return getattr(self.Meta.model, "enforce_unique_in_db", False)  # type: ignore[attr-defined]
+
+    def get_fields(self) -> dict[str, Field[Any, Any, Any, Any]]:
+        """Override this method to drop the fields' `UniqueValidator`s."""
+        fields = super().get_fields()
+        if self.enforce_unique_in_db:
+            for field in fields.values():
+                field.validators = [v for v in field.validators if not isinstance(v, UniqueValidator)]
+        return fields
+
+    def get_validators(self) -> list[Any]:
+        """Override this method to drop the `UniqueTogetherValidator`s."""
+        validators = list(super().get_validators())
+        if self.enforce_unique_in_db:
+            return [v for v in validators if not isinstance(v, UniqueTogetherValidator)]
+        return validators
+
+
 class FilterFunction[_MT: Model](Protocol):
     def __call__(self, context: Mapping[str, Any], queryset: Optional[QuerySet[_MT]]) -> QuerySet[_MT]: ...
 
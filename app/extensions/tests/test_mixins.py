@@ -1,12 +1,15 @@
 import json
+from copy import copy
 from typing import Any, Self
 from unittest.mock import MagicMock, patch
 from uuid import UUID
-from django.db import models
+from django.db import connection, models
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
 from extensions.models import mixins
 from extensions.models.managers import SoftDeleteManager
-from extensions.utilities import uuid
+from extensions.utilities import uuid, uuid7_range
 from extensions.utilities.test import AbstractModelTestCase, SampleFile
 
 
@@ -27,6 +30,29 @@ class TestUUIDPrimaryKeyMixin(AbstractModelTestCase):
         self.assertIsInstance(obj.id, UUID)
 
 
+class TestUUID7PrimaryKeyMixin(AbstractModelTestCase):
+    """Test the `UUID7PrimaryKeyMixin`."""
+
+    class ConcreteModel(mixins.UUID7PrimaryKeyMixin, models.Model):
+        class Meta:
+            # Because extensions is not an "installed_app"
+            app_label = uuid()
+
+    MODELS = (ConcreteModel,)
+
+    def test_create(self) -> None:
+        """Test that the keys are time-ordered, and can be filtered by creation time."""
+        start = now()
+        first = self.ConcreteModel._default_manager.create()
+        second = self.ConcreteModel._default_manager.create()
+        self.assertEqual(7, first.id.version)
+        self.assertLess(first.id, second.id)
+        self.assertEqual(
+            [second, first],
+            list(self.ConcreteModel._default_manager.filter(pk__range=uuid7_range(start, now())).order_by("-id")),
+        )
+
+
 class TestCreatedAtMixin(AbstractModelTestCase):
     """Test the `CreatedAtMixin`."""
 
@@ -105,6 +131,68 @@ class TestSoftDeleteMixin(AbstractModelTestCase):
         self.assertNotIn(obj, self.ConcreteModel._default_manager.exclude_deleted())  # type: ignore[attr-defined]
 
 
+class TestDirtyFieldsMixin(AbstractModelTestCase):
+    """Test the `DirtyFieldsMixin`."""
+
+    class ConcreteModel(mixins.DirtyFieldsMixin, mixins.UpdatedAtMixin, models.Model):
+        name = models.TextField(default="_name")
+        data = models.JSONField(default=dict)
+
+        class Meta:
+            # Because extensions is not an "installed_app"
+            app_label = uuid()
+
+    MODELS = (ConcreteModel,)
+
+    def setUp(self) -> None:
+        self.obj = self.ConcreteModel._default_manager.get(pk=self.ConcreteModel._default_manager.create().pk)
+
+    def test_dirty_fields(self) -> None:
+        """Test that the changed fields are tracked, including in-place changes."""
+        self.assertEqual(set(), self.obj.get_dirty_fields())
+        self.obj.name = "_other_name"
+        self.obj.data["_key"] = "_value"
+        self.assertEqual({"name", "data"}, self.obj.get_dirty_fields())
+        self.obj.save()
+        self.assertEqual(set(), self.obj.get_dirty_fields())
+        self.assertIsNone(self.ConcreteModel().get_dirty_fields())
+
+    def test_save_changed_fields(self) -> None:
+        """Test that only the changed fields (and the `auto_now` ones) are written."""
+        self.obj.name = "_other_name"
+        with CaptureQueriesContext(connection) as ctx:
+            self.obj.save()
+        self.assertEqual(1, len(ctx.captured_queries))
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertIn('"name"', sql)
+        self.assertIn('"updated_at"', sql)
+        self.assertNotIn('"data"', sql)
+        self.obj.refresh_from_db()
+        self.assertEqual("_other_name", self.obj.name)
+
+    def test_save_unchanged(self) -> None:
+        """Test that saving an unchanged instance doesn't query the database."""
+        with self.assertNumQueries(0):
+            self.obj.save()
+
+    def test_refresh_from_db(self) -> None:
+        """Test that refreshing the instance takes a new snapshot."""
+        self.ConcreteModel._default_manager.update(name="_other_name")
+        self.obj.refresh_from_db(fields=["name"])
+        self.assertEqual(set(), self.obj.get_dirty_fields())
+
+    def test_copy(self) -> None:
+        """Test that copies of an instance track their changes separately."""
+        obj_copy = copy(self.obj)
+        obj_copy.name = "_other_name"
+        obj_copy.save()
+        self.assertEqual(set(), obj_copy.get_dirty_fields())
+        # The original's snapshot is still the loaded values
+        self.assertEqual(set(), self.obj.get_dirty_fields())
+        self.obj.name = "_other_name"
+        self.assertEqual({"name"}, self.obj.get_dirty_fields())
+
+
 @override_settings(DEBUG=True)
 class TestExtendedReprMixin(AbstractModelTestCase):
     """Test the `ExtendedReprMixin`."""
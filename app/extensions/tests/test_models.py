@@ -0,0 +1,140 @@
+from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator
+from django.db import IntegrityError, models, transaction
+from extensions.models import AbstractBaseModel, ValidationMode
+from extensions.utilities import uuid
+from extensions.utilities.test import AbstractModelTestCase
+
+
+class TestAbstractBaseModel(AbstractModelTestCase):
+    """Test the `AbstractBaseModel`."""
+
+    class ConcreteModel(AbstractBaseModel):
+        code = models.TextField(unique=True)
+        number = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+
+        class Meta:
+            # Because extensions is not an "installed_app"
+            app_label = uuid()
+
+    MODELS = (ConcreteModel,)
+
+    def setUp(self) -> None:
+        self.obj = self.ConcreteModel._default_manager.create(code="_code")
+
+    def test_full(self) -> None:
+        """Test that, by default, every field and the uniqueness are validated."""
+        with self.assertRaises(ValidationError) as ctx:
+            self.ConcreteModel._default_manager.create(code="_code", number=-1)
+        self.assertEqual({"code", "number"}, set(ctx.exception.error_dict))
+
+    def test_changed(self) -> None:
+        """Test that only the fields being saved are validated, in the `CHANGED` mode."""
+        self.obj.number = -1
+        self.obj.code = "_other_code"
+        self.obj.save(update_fields=["code"], validation_mode=ValidationMode.CHANGED)
+        with self.assertRaises(ValidationError) as ctx:
+            self.obj.save(update_fields=["number"], validation_mode=ValidationMode.CHANGED)
+        self.assertEqual({"number"}, set(ctx.exception.error_dict))
+        # Without `update_fields`, everything is validated
+        with self.assertRaises(ValidationError):
+            self.obj.save(validation_mode=ValidationMode.CHANGED)
+
+    def test_expression(self) -> None:
+        """Test that fields set to expressions are left out of the validation, in every mode."""
+        for mode in ValidationMode:
+            with self.subTest(mode=mode):
+                number = self.obj.number
+                self.obj.number = models.F("number") + 1  # type: ignore[assignment]
+                self.obj.save(update_fields=["number"], validation_mode=mode)
+                self.obj.refresh_from_db()
+                self.assertEqual(number + 1, self.obj.number)
+
+    def test_skip_unique(self) -> None:
+        """Test that the uniqueness is left to the database, in the `SKIP_UNIQUE` mode."""
+        obj = self.ConcreteModel(code="_code")
+        with self.assertNumQueries(3), self.assertRaises(IntegrityError), transaction.atomic():
+            # SAVEPOINT, INSERT, ROLLBACK TO SAVEPOINT; no SELECT
+            obj.save(validation_mode=ValidationMode.SKIP_UNIQUE)
+
+
+class TestBaseManager(AbstractModelTestCase):
+    """
+    Test the `BaseManager`.
+
+    Because all ConcreteModels need to be unique within "core", we prefix all of them with "TestE".
+    """
+
+    class TestE_ParentConcreteModel(AbstractBaseModel):
+        class Meta:
+            # Because extensions is not an "installed_app", and related name needs a real installed app name.
+            app_label = "core"
+
+    class TestE_ConcreteModel(AbstractBaseModel):
+        code = models.TextField(unique=True)
+        number = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+        parent = models.ForeignKey("TestE_ParentConcreteModel", on_delete=models.CASCADE, null=True)
+
+        class Meta:
+            # Because extensions is not an "installed_app", and related name needs a real installed app name.
+            app_label = "core"
+            constraints = (models.UniqueConstraint(fields=("parent", "number"), name="teste_unique_parent_number"),)
+
+    MODELS = (TestE_ParentConcreteModel, TestE_ConcreteModel)
+
+    def setUp(self) -> None:
+        self.parent = self.TestE_ParentConcreteModel._default_manager.create()
+        self.manager = self.TestE_ConcreteModel._default_manager
+        self.manager.create(code="_existing", number=0, parent=self.parent)
+
+    def test_bulk_create_validated(self) -> None:
+        """Test that valid instances are inserted, with a query per check instead of per instance."""
+        objs = [self.TestE_ConcreteModel(code=f"_code_{i}", number=i + 1, parent=self.parent) for i in range(10)]
+        # Parent, code, (parent, number) and the INSERT
+        with self.assertNumQueries(4):
+            created = self.manager.bulk_create_validated(objs)  # type: ignore[attr-defined]
+        self.assertEqual(10, len(created))
+        for obj in created:
+            self.assertIsNotNone(obj.created_at)
+            self.assertIsNotNone(obj.updated_at)
+        self.assertEqual(11, self.manager.count())
+
+    def test_bulk_create_validated_fails(self) -> None:
+        """Test that the errors of all instances are reported, and nothing is inserted."""
+        missing_parent = self.TestE_ParentConcreteModel(id=uuid())
+        objs = [
+            self.TestE_ConcreteModel(code="_existing", number=1),  # Taken code
+            self.TestE_ConcreteModel(code="_code", number=-1),  # Invalid number
+            self.TestE_ConcreteModel(code="_code", number=2),  # Duplicate code in the batch
+            self.TestE_ConcreteModel(code="_other_code", number=0, parent=self.parent),  # Taken (parent, number)
+            self.TestE_ConcreteModel(code="_another_code", number=3, parent=missing_parent),  # Missing parent
+        ]
+        with self.assertRaises(ValidationError) as ctx:
+            self.manager.bulk_create_validated(objs)  # type: ignore[attr-defined]
+        self.assertEqual(
+            {
+                "0.code": ["unique"],
+                "1.number": ["min_value"],
+                "2.code": ["unique"],
+                "3.__all__": ["unique_together"],
+                "4.parent": ["invalid"],
+            },
+            {key: [e.code for e in errors] for key, errors in ctx.exception.error_dict.items()},
+        )
+        self.assertEqual(1, self.manager.count())
+
+    def test_bulk_update_validated(self) -> None:
+        """Test that the updated fields are validated, and `updated_at` is set."""
+        objs = [self.manager.create(code=f"_code_{i}", number=i + 1) for i in range(3)]
+        original_updated_at = objs[0].updated_at
+        for obj in objs:
+            obj.number += 10
+        self.assertEqual(3, self.manager.bulk_update_validated(objs, ["number"]))  # type: ignore[attr-defined]
+        objs[0].refresh_from_db()
+        self.assertEqual(11, objs[0].number)
+        self.assertGreater(objs[0].updated_at, original_updated_at)
+        # Swapping to a taken code fails
+        objs[0].code = "_existing"
+        with self.assertRaises(ValidationError) as ctx:
+            self.manager.bulk_update_validated(objs, ["code"])  # type: ignore[attr-defined]
+        self.assertEqual({"0.code"}, set(ctx.exception.error_dict))
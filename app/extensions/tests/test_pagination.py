@@ -0,0 +1,78 @@
+from datetime import timedelta
+from typing import Any, Optional
+from django.db import models
+from django.utils.timezone import now
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from extensions.models import AbstractBaseModel
+from extensions.pagination import KeysetPagination
+from extensions.utilities import uuid
+from extensions.utilities.test import AbstractModelTestCase
+
+
+class TestKeysetPagination(AbstractModelTestCase):
+    """Test the `KeysetPagination`."""
+
+    class ConcreteModel(AbstractBaseModel):
+        number = models.IntegerField()
+
+        class Meta(AbstractBaseModel.Meta):
+            # Because extensions is not an "installed_app"
+            app_label = uuid()
+
+    MODELS = (ConcreteModel,)
+
+    def setUp(self) -> None:
+        manager = self.ConcreteModel._default_manager
+        objs = [manager.create(number=i) for i in range(7)]
+        # Two objects share the `created_at`, so the primary key breaks the tie
+        start = now()
+        for i, obj in enumerate(objs):
+            manager.filter(pk=obj.pk).update(created_at=start + timedelta(seconds=min(i, 5)))
+        self.queryset = manager.all()
+        self.expected = list(manager.order_by("-created_at", "-pk").values_list("number", flat=True))
+
+    def paginate(self, url: Optional[str] = None) -> tuple[list[Any], KeysetPagination[Any]]:
+        paginator: KeysetPagination[Any] = KeysetPagination()
+        paginator.page_size = 2
+        request = Request(APIRequestFactory().get(url or "/"))
+        page = paginator.paginate_queryset(self.queryset, request)
+        assert page is not None
+        return [obj.number for obj in page], paginator
+
+    def test_walk(self) -> None:
+        """Test walking all the pages forwards, and then backwards, with a single query per page."""
+        pages: list[list[Any]] = []
+        url: Optional[str] = None
+        while True:
+            with self.assertNumQueries(1):
+                page, paginator = self.paginate(url)
+            pages.append(page)
+            url = paginator.get_next_link()
+            if url is None:
+                break
+        self.assertEqual(self.expected, [number for page in pages for number in page])
+        self.assertEqual([2, 2, 2, 1], [len(page) for page in pages])
+        self.assertIsNone(self.paginate()[1].get_previous_link())
+        # Backwards, from the last page
+        url = paginator.get_previous_link()
+        for expected_page in reversed(pages[:-1]):
+            assert url is not None
+            page, paginator = self.paginate(url)
+            self.assertEqual(expected_page, page)
+            url = paginator.get_previous_link()
+        self.assertIsNone(url)
+
+    def test_paginated_response(self) -> None:
+        """Test that the response has the links, and no count."""
+        page, paginator = self.paginate()
+        response = paginator.get_paginated_response(page)
+        self.assertEqual({"next", "previous", "results"}, set(response.data))
+        self.assertIsNotNone(response.data["next"])
+        self.assertIsNone(response.data["previous"])
+
+    def test_invalid_cursor(self) -> None:
+        """Test that an invalid cursor raises `NotFound`."""
+        with self.assertRaises(NotFound):
+            self.paginate("/?cursor=invalid")
@@ -1,9 +1,15 @@
 from typing import Any, Mapping, Optional
-from django.db import models
+from unittest.mock import patch
+from django.db import IntegrityError, models, transaction
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from extensions.models import AbstractBaseModel
-from extensions.serializers import FilteredPrimaryKeyRelatedField, InlineSerializer, NestedPrimaryKeyRelatedField
+from extensions.serializers import (
+    FilteredPrimaryKeyRelatedField,
+    InlineSerializer,
+    NestedPrimaryKeyRelatedField,
+    UniqueInDatabaseSerializerMixin,
+)
 from extensions.utilities import uuid
 from extensions.utilities.test import AbstractModelTestCase
 
@@ -227,3 +233,52 @@ class TestNestedPrimaryKeyRelatedField(AbstractModelTestCase):
         serialized_parent = self.ParentSerializer(parent)
         data = serialized_parent.data
         self.assertEqual(self.ChildSerializer(child).data, data["child"])
+
+
+class TestUniqueInDatabaseSerializerMixin(AbstractModelTestCase):
+    """
+    Test the UniqueInDatabaseSerializerMixin (and `AbstractBaseModel.enforce_unique_in_db`).
+
+    Because all ConcreteModels need to be unique within "core", we prefix all of them with "TestD".
+    """
+
+    class TestD_ConcreteModel(AbstractBaseModel):
+        enforce_unique_in_db = True
+        code = models.TextField(unique=True)
+        field_a = models.TextField(default="_field_a")
+        field_b = models.TextField(default="_field_b")
+
+        class Meta:
+            # Because extensions is not an "installed_app", and related name needs a real installed app name.
+            app_label = "core"
+            constraints = (models.UniqueConstraint(fields=("field_a", "field_b"), name="testd_unique_fields"),)
+
+    MODELS = (TestD_ConcreteModel,)
+
+    def setUp(self) -> None:
+        class Serializer(
+            UniqueInDatabaseSerializerMixin[TestUniqueInDatabaseSerializerMixin.TestD_ConcreteModel],
+            serializers.ModelSerializer[TestUniqueInDatabaseSerializerMixin.TestD_ConcreteModel],
+        ):
+            class Meta:
+                model = self.TestD_ConcreteModel
+                fields = ("code", "field_a", "field_b")
+
+        self.Serializer = Serializer
+        self.instance = self.TestD_ConcreteModel._default_manager.create(code="_code")
+
+    def test_validators_dropped(self) -> None:
+        """Test that the serializer doesn't check uniqueness."""
+        serializer = self.Serializer(data={"code": "_code", "field_a": "_field_a", "field_b": "_field_b"})
+        with self.assertNumQueries(0):
+            self.assertTrue(serializer.is_valid())
+        with patch.object(self.TestD_ConcreteModel, "enforce_unique_in_db", False):
+            serializer = self.Serializer(data={"code": "_code", "field_a": "_field_a", "field_b": "_field_b"})
+            self.assertFalse(serializer.is_valid())
+
+    def test_save_unique_in_db(self) -> None:
+        """Test that saving doesn't check uniqueness, leaving it to the database."""
+        for kwargs in ({"code": "_code"}, {"code": "_other_code", "field_a": "_field_a", "field_b": "_field_b"}):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(IntegrityError), transaction.atomic():
+                    self.TestD_ConcreteModel._default_manager.create(**kwargs)
@@ -1,14 +1,28 @@
+import json
+from datetime import UTC, datetime
 from pathlib import Path
 from random import shuffle
+from threading import Event
 from typing import overload
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
+from uuid import uuid7
+from django.db import connection
+from django.test import TestCase as DatabaseTestCase
+from django.test import TransactionTestCase
 from django.utils.timezone import now
 import extensions.utilities as utils
 from extensions.models.mixins import CreatedAtMixin, UpdatedAtMixin
 from extensions.utilities import env, uuid
+from extensions.utilities.bloom import BloomFilter
+from extensions.utilities.cache import TTLCache
+from extensions.utilities.invalidation import InvalidationBus
 from extensions.utilities.logging import LoggingConfigurationBuilder
+from extensions.utilities.metrics import MetricsRegistry
 from extensions.utilities.test import AbstractModelTestCase, MockResponse, SampleFile, override_auto_now
+from extensions.utilities.transactions import CommitMode, commit_mode
+from users.models import User
+from users.tests import sample_user
 
 
 class TestUtilities(TestCase):
@@ -36,6 +50,21 @@ class TestUtilities(TestCase):
             utils.clear_Undefined(_key1="_value1", _key2=None, _key3=utils.Undefined),
         )
 
+    def test_uuid7_range(self) -> None:
+        """Test the `uuid7_range` and `uuid7_datetime` functions."""
+        before = datetime.now(UTC)
+        value = uuid7()
+        after = datetime.now(UTC)
+        lowest, highest = utils.uuid7_range(before, after)
+        self.assertLessEqual(lowest, value)
+        self.assertLessEqual(value, highest)
+        self.assertEqual(7, lowest.version)
+        self.assertEqual(7, highest.version)
+        self.assertLessEqual(
+            before.replace(microsecond=before.microsecond // 1000 * 1000), utils.uuid7_datetime(value)
+        )
+        self.assertLessEqual(utils.uuid7_datetime(str(value)), after)
+
     def test_ext(self) -> None:
         """Test the `ext` function."""
         cases = [
@@ -73,6 +102,212 @@ class TestUtilities(TestCase):
             self.assertEqual([{"item": int(n)} for n in mapped_ordering_list], mapped_result)
 
 
+class TestCacheUtilities(TestCase):
+    """Test the cache utilities provided."""
+
+    def test_TTLCache(self) -> None:
+        """Test the TTLCache get, set and delete operations."""
+        cache = TTLCache[str, str](max_size=10, timeout=60)
+        self.assertIsNone(cache.get("_key"))
+        cache.set("_key", "_value")
+        self.assertEqual("_value", cache.get("_key"))
+        self.assertIn("_key", cache)
+        cache.delete("_key")
+        self.assertIsNone(cache.get("_key"))
+        self.assertNotIn("_key", cache)
+
+    def test_TTLCache_max_size(self) -> None:
+        """Test the TTLCache evicts the least recently used entries when full."""
+        cache = TTLCache[str, int](max_size=2, timeout=60)
+        cache.set("_first", 1)
+        cache.set("_second", 2)
+        cache.get("_first")  # Mark it as recently used
+        cache.set("_third", 3)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.get("_first"))
+        self.assertIsNone(cache.get("_second"))
+        self.assertEqual(3, cache.get("_third"))
+
+    @patch("extensions.utilities.cache.time.monotonic")
+    def test_TTLCache_timeout(self, monotonic_mock: MagicMock) -> None:
+        """Test the TTLCache entries expire after the timeout."""
+        monotonic_mock.return_value = 0
+        cache = TTLCache[str, str](max_size=10, timeout=60)
+        cache.set("_key", "_value")
+        monotonic_mock.return_value = 59
+        self.assertEqual("_value", cache.get("_key"))
+        monotonic_mock.return_value = 60
+        self.assertIsNone(cache.get("_key"))
+        self.assertEqual(0, len(cache))
+
+    def test_TTLCache_disabled(self) -> None:
+        """Test the TTLCache doesn't store anything with a size or timeout of 0."""
+        for cache in (TTLCache[str, str](max_size=0, timeout=60), TTLCache[str, str](max_size=10, timeout=0)):
+            cache.set("_key", "_value")
+            self.assertIsNone(cache.get("_key"))
+
+    def test_TTLCache_clear(self) -> None:
+        """Test the TTLCache clear method."""
+        cache = TTLCache[str, str](max_size=10, timeout=60)
+        cache.set("_key", "_value")
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+
+class TestBloomFilter(TestCase):
+    """Test the BloomFilter."""
+
+    def test_membership(self) -> None:
+        """Test that added items are always found."""
+        bloom = BloomFilter(capacity=1000)
+        items = [uuid() for _ in range(1000)]
+        for item in items:
+            bloom.add(item)
+        self.assertEqual(len(items), len(bloom))
+        for item in items:
+            self.assertIn(item, bloom)
+
+    def test_error_rate(self) -> None:
+        """Test that the false positive rate stays around the configured error rate."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for _ in range(1000):
+            bloom.add(uuid())
+        false_positives = sum(uuid() in bloom for _ in range(10000))
+        self.assertLess(false_positives, 300)  # Generous margin over the expected ~100
+
+    def test_is_full(self) -> None:
+        """Test the `is_full` property."""
+        bloom = BloomFilter(capacity=1)
+        bloom.add("_first")
+        self.assertFalse(bloom.is_full)
+        bloom.add("_second")
+        self.assertTrue(bloom.is_full)
+
+
+class TestMetricsRegistry(TestCase):
+    """Test the MetricsRegistry."""
+
+    def test_snapshot(self) -> None:
+        """Test that counters and timings are aggregated by name and labels."""
+        registry = MetricsRegistry()
+        registry.increment("_counter", a="1", b="2")
+        registry.increment("_counter", 2, b="2", a="1")
+        registry.increment("_counter", a="_other")
+        registry.observe("_timing", 1)
+        registry.observe("_timing", 3)
+        registry.register_collector("_collector", lambda: {"_key": "_value"})
+        snapshot = registry.snapshot()
+        self.assertEqual(
+            [
+                {"name": "_counter", "labels": {"a": "1", "b": "2"}, "value": 3},
+                {"name": "_counter", "labels": {"a": "_other"}, "value": 1},
+            ],
+            snapshot["counters"],
+        )
+        self.assertEqual([{"name": "_timing", "labels": {}, "count": 2, "total": 4, "max": 3}], snapshot["timings"])
+        self.assertEqual({"_key": "_value"}, snapshot["_collector"])
+        json.dumps(snapshot)  # Serializable
+        registry.clear()
+        self.assertEqual([], registry.snapshot()["counters"])
+        self.assertEqual([], registry.snapshot()["timings"])
+
+
+class TestTransactionsUtilities(DatabaseTestCase):
+    """Test the transaction utilities."""
+
+    def get_synchronous_commit(self) -> str:
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW synchronous_commit")
+            row = cursor.fetchone()
+            assert row is not None
+            return str(row[0])
+
+    def test_commit_mode(self) -> None:
+        """Test that only the `ASYNC_COMMIT` mode turns off `synchronous_commit`."""
+        for mode in (None, CommitMode.AUTOCOMMIT, CommitMode.ATOMIC):
+            with self.subTest(mode=mode), commit_mode(mode):
+                self.assertEqual("on", self.get_synchronous_commit())
+        with commit_mode(CommitMode.ASYNC_COMMIT):
+            self.assertEqual("off", self.get_synchronous_commit())
+
+    def test_commit_mode_rollback(self) -> None:
+        """Test that the writes in a transactional mode are rolled back together on errors."""
+        user = sample_user()
+        for mode in ("atomic", "async_commit"):
+            with self.subTest(mode=mode), self.assertRaises(RuntimeError), commit_mode(mode):
+                User.objects.filter(id=user.id).update(username="_changed")
+                raise RuntimeError
+            self.assertFalse(User.objects.filter(username="_changed").exists())
+
+    def test_commit_mode_invalid(self) -> None:
+        """Test that an unknown mode fails."""
+        with self.assertRaises(ValueError), commit_mode("_invalid"):
+            pass  # pragma: no cover
+
+
+class TestInvalidationBus(DatabaseTestCase):
+    """Test the InvalidationBus."""
+
+    def test_publish(self) -> None:
+        """Test that publishing runs the topic's handlers right away, and again (notifying the others) on commit."""
+        bus = InvalidationBus("_channel")
+        handler, other_handler = MagicMock(), MagicMock()
+        bus.subscribe("_topic", handler)
+        bus.subscribe("_other_topic", other_handler)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            bus.publish("_topic", "_key")
+            handler.assert_called_once_with("_key")
+        self.assertEqual(1, len(callbacks))
+        self.assertEqual(2, handler.call_count)
+        other_handler.assert_not_called()
+
+    def test_publish_not_immediate(self) -> None:
+        """Test that, without `immediate`, the handlers only run on commit."""
+        bus = InvalidationBus("_channel")
+        handler = MagicMock()
+        bus.subscribe("_topic", handler)
+        with self.captureOnCommitCallbacks() as callbacks:
+            bus.publish("_topic", "_key", immediate=False)
+        handler.assert_not_called()
+        # Once committed
+        for callback in callbacks:
+            callback()
+        handler.assert_called_once_with("_key")
+
+    def test_handle(self) -> None:
+        """Test that only the events published by other processes are handled."""
+        bus = InvalidationBus("_channel")
+        handler = MagicMock()
+        bus.subscribe("_topic", handler)
+        bus.handle(json.dumps({"origin": bus.origin, "topic": "_topic", "key": "_key"}))
+        handler.assert_not_called()
+        bus.handle(json.dumps({"origin": "_other_origin", "topic": "_topic", "key": "_key"}))
+        handler.assert_called_once_with("_key")
+
+    def test_handle_invalid_payload(self) -> None:
+        """Test that invalid payloads are logged and ignored."""
+        bus = InvalidationBus("_channel")
+        with self.assertLogs("extensions.utilities.invalidation", "ERROR"):
+            bus.handle("_invalid")
+
+
+class TestInvalidationBusListener(TransactionTestCase):
+    """Test the InvalidationBus listener against the database."""
+
+    def test_listen(self) -> None:
+        """Test that the events published by another process reach the listener."""
+        bus, other_bus = InvalidationBus("_channel", reconnect_interval=0.1), InvalidationBus("_channel")
+        connected, received = Event(), Event()
+        bus.subscribe("_topic", lambda key: (received if key == "_key" else connected).set())
+        bus.start()
+        try:
+            self.assertTrue(connected.wait(5))  # Everything is invalidated once connected
+            other_bus.publish("_topic", "_key")
+            self.assertTrue(received.wait(5))
+        finally:
+            bus.stop()
+
+
 class TestTestUtilities(AbstractModelTestCase):
     """Test the test utilities provided."""
 
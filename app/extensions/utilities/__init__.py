@@ -1,7 +1,8 @@
 from __future__ import annotations
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Callable, Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 
 def uuid() -> str:
@@ -9,6 +10,24 @@ def uuid() -> str:
     return str(uuid4())
 
 
+def uuid7_datetime(value: UUID | str) -> datetime:
+    """Get the (millisecond precision) time a UUIDv7 was generated at, from its leading 48 bits."""
+    return datetime.fromtimestamp((UUID(str(value)).int >> 80) / 1000, tz=UTC)
+
+
+def uuid7_range(start: datetime, end: datetime) -> tuple[UUID, UUID]:
+    """
+    Get the lowest UUIDv7 generated at `start` and the highest generated at `end`, so that UUIDv7 keys can be filtered
+    by creation time (`filter(pk__range=uuid7_range(start, end))`) with the primary key's index.
+    """
+    # 48 bits of timestamp (ms), 4 of version, 12 random, 2 of variant and 62 random
+    version_and_variant = (0x7 << 76) | (0b10 << 62)
+    random_bits = (0xFFF << 64) | ((1 << 62) - 1)
+    lowest = (int(start.timestamp() * 1000) << 80) | version_and_variant
+    highest = (int(end.timestamp() * 1000) << 80) | version_and_variant | random_bits
+    return UUID(int=lowest), UUID(int=highest)
+
+
 class Singleton[T](type):
     """A metaclass to apply the Singleton pattern."""
 
@@ -0,0 +1,45 @@
+import hashlib
+from math import ceil, log
+from typing import Iterator
+
+
+class BloomFilter:
+    """
+    A compact, probabilistic set of strings.
+
+    Membership tests can return false positives (with a probability of roughly `error_rate` when holding `capacity`
+    items), but never false negatives. Items can't be removed; rebuild the filter instead.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = ceil(-self.capacity * log(error_rate) / (log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * log(2)))
+        self.count = 0
+        self._bits = bytearray(ceil(self.size / 8))
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """Generate the bit positions for the item, using double hashing over a single digest."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        """Add the item to the filter."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the filter holds more items than it was sized for (and the error rate is no longer guaranteed)."""
+        return self.count > self.capacity
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,60 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+
+class TTLCache[K, V]:
+    """
+    A bounded, thread-safe, in-process cache where every entry expires after `timeout` seconds.
+
+    When the cache is full, the least recently used entry is evicted to make room for new ones. This is meant for
+    small per-worker caches in front of hot database lookups; it's not shared between processes, so any invalidation
+    has to happen in every worker.
+    """
+
+    def __init__(self, max_size: int, timeout: float) -> None:
+        self.max_size = max_size
+        self.timeout = timeout
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the value stored for the key, or `None` if it's missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store the value for the key, evicting the least recently used entries if the cache is full."""
+        if self.max_size <= 0 or self.timeout <= 0:
+            # Caching is disabled
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """Remove the key from the cache, if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
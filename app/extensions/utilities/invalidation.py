@@ -0,0 +1,130 @@
+import json
+import logging
+import os
+import select
+from collections import defaultdict
+from threading import Event, Lock, Thread
+from typing import Callable, Optional
+from django.conf import settings
+from django.db import connections, transaction
+from extensions.utilities import uuid
+
+
+logger = logging.getLogger(__name__)
+
+type InvalidationHandler = Callable[[Optional[str]], None]
+"""Handler for the invalidation events of a topic: takes the invalidated key, or `None` to invalidate everything."""
+
+
+class InvalidationBus:
+    """
+    Bus to keep process-local caches coherent across processes (workers and containers), over Postgres
+    `LISTEN`/`NOTIFY`; no broker needed besides the database.
+
+    Each cache subscribes a handler to a topic. Publishing an event for a key runs the topic's handlers once the current
+    transaction commits, in this process and (with a `NOTIFY`) in the others, so nothing reloads the data before the
+    change is visible; by default, the handlers also run in this process right away, so the publishing code doesn't
+    read its own stale entries before then. In each process that calls `start`, a background thread `LISTEN`s on its
+    own connection and runs the handlers for the events published elsewhere.
+
+    Events published while a listener is disconnected are lost; so, whenever it (re)connects, every handler is called
+    with `None` to drop everything.
+    """
+
+    def __init__(self, channel: str, using: str = "default", reconnect_interval: float = 5) -> None:
+        self.channel = channel
+        self.using = using
+        self.reconnect_interval = reconnect_interval
+        self.origin = uuid()
+        self._handlers: defaultdict[str, list[InvalidationHandler]] = defaultdict(list)
+        self._lock = Lock()
+        self._pid: Optional[int] = None
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+
+    def subscribe(self, topic: str, handler: InvalidationHandler) -> None:
+        """Subscribe the handler to the topic's events."""
+        self._handlers[topic].append(handler)
+
+    def dispatch(self, topic: str, key: Optional[str]) -> None:
+        """Run the topic's handlers for the key in this process."""
+        for handler in self._handlers[topic]:
+            handler(key)
+
+    def dispatch_all(self) -> None:
+        """Run every handler with `None`, invalidating everything."""
+        for topic in list(self._handlers):
+            self.dispatch(topic, None)
+
+    def publish(self, topic: str, key: Optional[str] = None, immediate: bool = True) -> None:
+        """
+        Invalidate the key (or everything, with `None`) for the topic, in this process and all the others, once the
+        current transaction commits. With `immediate`, the handlers also run in this process right away; turn it off
+        for handlers that add data (instead of dropping it), which must not run if the transaction rolls back.
+        """
+        if immediate:
+            self.dispatch(topic, key)
+        payload = json.dumps({"origin": self.origin, "topic": topic, "key": key})
+
+        def on_commit() -> None:
+            # Again, in case other threads cached the data (as it was before the commit) in the meantime
+            self.dispatch(topic, key)
+            if connections[self.using].vendor == "postgresql":
+                with connections[self.using].cursor() as cursor:
+                    cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, payload])
+
+        transaction.on_commit(on_commit, using=self.using)
+
+    def handle(self, payload: str) -> None:
+        """Handle a notification received by the listener."""
+        try:
+            event = json.loads(payload)
+            if event["origin"] == self.origin:  # Already handled on commit, when published
+                return
+            self.dispatch(event["topic"], event["key"])
+        except Exception:
+            logger.exception("Failed to handle the invalidation event %r.", payload)
+
+    def start(self) -> None:
+        """Start the listener thread for this process, if it's not running yet."""
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # A listener started in a parent process doesn't survive forking; start a new one
+            self._pid = os.getpid()
+            self._stopped = Event()
+            self._thread = Thread(target=self._listen, args=(self._stopped,), name="invalidation-bus", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the listener thread, waiting for it to close its connection."""
+        with self._lock:
+            self._stopped.set()
+            if self._thread is not None and self._pid == os.getpid():
+                self._thread.join()
+            self._pid, self._thread = None, None
+
+    def _listen(self, stopped: Event) -> None:
+        while not stopped.is_set():
+            # A dedicated connection, outside of Django's per-thread connections
+            connection = connections.create_connection(self.using)
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {connection.ops.quote_name(self.channel)}")
+                self.dispatch_all()
+                raw_connection = connection.connection
+                while not stopped.is_set():
+                    if not select.select([raw_connection], [], [], self.reconnect_interval)[0]:
+                        continue
+                    raw_connection.poll()
+                    while raw_connection.notifies:
+                        self.handle(raw_connection.notifies.pop(0).payload)
+            except Exception:
+                logger.exception("The invalidation bus listener lost its connection; reconnecting.")
+                stopped.wait(self.reconnect_interval)
+            finally:
+                connection.close()
+
+
+invalidation_bus = InvalidationBus(settings.INVALIDATION_BUS_CHANNEL)
+"""Process-wide `InvalidationBus`; its listener is started in each worker (see `app.gunicorn`)."""
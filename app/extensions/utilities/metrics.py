@@ -0,0 +1,81 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable
+
+
+type Labels = tuple[tuple[str, str], ...]
+"""The labels of a metric, as sorted `(name, value)` pairs."""
+
+
+@dataclass
+class Timing:
+    """The aggregated observations of a timing metric, in seconds."""
+
+    count: int = 0
+    total: float = 0
+    max: float = 0
+
+
+class MetricsRegistry:
+    """
+    Low-overhead, in-process registry of counters and timings, broken down by labels.
+
+    Recording a value only takes a lock and a dictionary update; aggregation is left to whoever reads the `snapshot`
+    (a metrics endpoint, a log flusher...). Collectors can also be registered, to include the state of other components
+    (pools, caches...) in the snapshots.
+
+    **Note**: the values are per-process; with multiple workers, each one holds (and reports) its own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counters: defaultdict[tuple[str, Labels], int] = defaultdict(int)
+        self._timings: defaultdict[tuple[str, Labels], Timing] = defaultdict(Timing)
+        self._collectors: dict[str, Callable[[], Any]] = {}
+
+    def increment(self, name: str, value: int = 1, **labels: str) -> None:
+        """Increment the counter for the labels."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] += value
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """Record an observation of the timing for the labels."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            timing = self._timings[key]
+            timing.count += 1
+            timing.total += seconds
+            timing.max = max(timing.max, seconds)
+
+    def register_collector(self, name: str, collector: Callable[[], Any]) -> None:
+        """Register a callable whose result is included in the snapshots, under the name."""
+        self._collectors[name] = collector
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the current values of all the metrics (and collectors), in a JSON serializable format."""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in self._counters.items()
+            ]
+            timings = [
+                {"name": name, "labels": dict(labels), "count": t.count, "total": t.total, "max": t.max}
+                for (name, labels), t in self._timings.items()
+            ]
+        return {
+            "counters": counters,
+            "timings": timings,
+            **{name: collector() for name, collector in self._collectors.items()},
+        }
+
+    def clear(self) -> None:
+        """Reset all the counters and timings."""
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+
+metrics_registry = MetricsRegistry()
+"""Process-wide `MetricsRegistry`."""
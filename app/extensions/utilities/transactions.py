@@ -0,0 +1,38 @@
+from contextlib import contextmanager
+from enum import StrEnum
+from typing import Iterator, Optional
+from django.db import connections, transaction
+
+
+class CommitMode(StrEnum):
+    """How a block of writes is committed."""
+
+    AUTOCOMMIT = "autocommit"
+    """Each write commits on its own (Django's default)."""
+    ATOMIC = "atomic"
+    """All the writes are committed together, in one transaction."""
+    ASYNC_COMMIT = "async_commit"
+    """
+    Like `ATOMIC`, but the commit doesn't wait for the WAL to be flushed to disk (`synchronous_commit = off`), which
+    takes the fsync out of the request. A crash may lose the last commits (but never corrupt the database), so only
+    use it for writes that can be lost or regenerated.
+    """
+
+
+@contextmanager
+def commit_mode(mode: Optional[CommitMode | str], using: Optional[str] = None) -> Iterator[None]:
+    """
+    Context manager to run a block of writes with the given `CommitMode` (`None` means `AUTOCOMMIT`).
+
+    **Note**: if the block runs inside an outer transaction, `ASYNC_COMMIT` applies to the outer transaction.
+    """
+    mode = CommitMode(mode or CommitMode.AUTOCOMMIT)
+    if mode == CommitMode.AUTOCOMMIT:
+        yield
+        return
+    with transaction.atomic(using=using):
+        connection = connections[using or "default"]
+        if mode == CommitMode.ASYNC_COMMIT and connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL synchronous_commit = off")
+        yield
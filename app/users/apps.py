@@ -5,3 +5,7 @@ from django.utils.translation import gettext_lazy as _
 class UsersConfig(AppConfig):
     name = "users"
     verbose_name = _("users")
+
+    def ready(self) -> None:
+        # Connect the signal receivers
+        from users import signals  # noqa: F401
@@ -0,0 +1,137 @@
+from copy import copy
+from typing import Any, Optional
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from extensions.utilities.cache import TTLCache
+from extensions.utilities.invalidation import invalidation_bus
+from users.models import User
+
+
+user_cache = TTLCache[str, User](
+    max_size=settings.USERS_AUTH_CACHE_MAX_SIZE,
+    # An access token can't outlive its lifetime, so there's no point in caching the user for longer than that.
+    timeout=min(settings.USERS_AUTH_CACHE_TIMEOUT, api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()),
+)
+"""
+Per-process cache of the Users loaded by the `CachedJWTAuthentication`, keyed by the token's user id.
+
+Entries are invalidated by the signals in `users.signals` whenever a User is saved or deleted, in every process.
+"""
+
+
+token_version_cache = TTLCache[str, int](max_size=settings.USERS_AUTH_CACHE_MAX_SIZE, timeout=user_cache.timeout)
+"""Per-process cache of the Users' `token_version`, keyed by the token's user id. Invalidated with the `user_cache`."""
+
+TOKEN_VERSION_CLAIM = "ver"
+
+
+def drop_cached_user(user_id: Optional[str]) -> None:
+    """Drop the User with the given id (or all of them, with `None`) from this process' authentication caches."""
+    if user_id is None:
+        user_cache.clear()
+        token_version_cache.clear()
+        return
+    user_cache.delete(user_id)
+    token_version_cache.delete(user_id)
+
+
+invalidation_bus.subscribe("users", drop_cached_user)
+
+
+def invalidate_cached_user(user_id: Any) -> None:
+    """Drop the User with the given id from the authentication caches, in every process (see `InvalidationBus`)."""
+    invalidation_bus.publish("users", str(user_id))
+
+
+def get_token_version(user_id: Any) -> int:
+    """Get the User's current `token_version`, from the caches if possible."""
+    user_id = str(user_id)
+    version = token_version_cache.get(user_id)
+    if version is not None:
+        return version
+    user = user_cache.get(user_id)
+    if user is not None:
+        version = user.token_version
+    else:
+        try:
+            version = User.objects.values_list("token_version", flat=True).get(**{api_settings.USER_ID_FIELD: user_id})
+        except User.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+    token_version_cache.set(user_id, version)
+    return version
+
+
+def check_token_version(validated_token: Token, version: int) -> None:
+    """Check that the token was issued with the User's current `token_version`; tokens without one count as 0."""
+    if validated_token.get(TOKEN_VERSION_CLAIM, 0) != version:
+        raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that keeps the authenticated Users in a per-process cache, so that authenticated requests don't
+    have to query the database for the User every time.
+    """
+
+    def get_user(self, validated_token: Token) -> User:  # type: ignore[override]
+        """Override this method to look the User up in the cache before hitting the database."""
+        try:
+            user_id = str(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        user = user_cache.get(user_id)
+        if user is None:
+            try:
+                user = User.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+            except User.DoesNotExist as e:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+            user_cache.set(user_id, user)
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        check_token_version(validated_token, user.token_version)
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        # Hand out a copy so that changes made during the request don't leak into the cached instance
+        return copy(user)
+
+
+class ClaimsJWTAuthentication(CachedJWTAuthentication):
+    """
+    JWTAuthentication for read-only endpoints that builds a lightweight `TokenUser` from the access token's claims
+    (see `UserLoginSerializer.get_token`), without touching the database. Tokens that don't carry the profile claims
+    (issued before they were added) fall back to loading the User. Revoked tokens are still rejected, through the
+    cached `token_version`.
+
+    **Note**: the User's status is only checked when the token is issued or refreshed, and the claims are a snapshot
+    from that moment; only use this for endpoints where that's acceptable for the access token's lifetime.
+    """
+
+    def get_user(self, validated_token: Token) -> User | TokenUser:  # type: ignore[override]
+        """Override this method to build the User from the claims when possible."""
+        if api_settings.USER_ID_CLAIM not in validated_token or User.USERNAME_FIELD not in validated_token:
+            return super().get_user(validated_token)
+        check_token_version(validated_token, get_token_version(validated_token[api_settings.USER_ID_CLAIM]))
+        return api_settings.TOKEN_USER_CLASS(validated_token)  # type: ignore[no-any-return]
+
+
+class JWTAuthenticationScheme(SimpleJWTScheme):  # pragma: no cover
+    """
+    DRF Spectacular extension so that the subclasses of simplejwt's `JWTAuthentication` defined here are documented
+    the same way as the original.
+    """
+
+    target_class = "rest_framework_simplejwt.authentication.JWTAuthentication"
+    match_subclasses = True
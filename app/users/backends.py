@@ -5,7 +5,12 @@ from users.models import User
 
 
 class AuthenticationBackend(ModelBackend):
-    """Custom authentication backend that also checks for the User's `is_deleted` status."""
+    """
+    Custom authentication backend that also checks for the User's `is_deleted` status.
+
+    Successful logins transparently upgrade password hashes made with outdated hasher parameters (for example, after
+    running `calibrate_hashers`), through `User.check_password`.
+    """
 
     def user_can_authenticate(self, user: Optional[User | AnonymousUser]) -> bool:
         """Override this method so that we can check for the `is_deleted` status."""
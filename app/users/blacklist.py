@@ -0,0 +1,181 @@
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from threading import Lock
+from typing import Optional
+from django.conf import settings
+from django.db.models import Q
+from django.utils.timezone import now
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from extensions.utilities.bloom import BloomFilter
+from extensions.utilities.invalidation import invalidation_bus
+
+
+class BlacklistIndex:
+    """
+    In-memory index of the blacklisted token JTIs, so that checking a token against the blacklist doesn't need to
+    search the (ever growing) `token_blacklist` tables.
+
+    The index is made of:
+    - a Bloom filter with every blacklisted JTI whose token hasn't expired yet; a miss there means the token is
+    definitely not blacklisted;
+    - an exact, bounded set of the most recently blacklisted JTIs, which are the ones most likely to be checked again
+    (e.g. a rotated refresh token being reused).
+
+    A hit on the Bloom filter that's not in the exact set falls back to the database.
+
+    Tokens blacklisted through any worker are added to the index as soon as they're committed, through the
+    `InvalidationBus`. On top of that, the index reads the `BlacklistedToken` rows created since the last sync, at most
+    once every `sync_interval` seconds, in case a notification was missed. The queries run outside of the lock, so
+    checks aren't held back by them; until the index is first built, checks go to the database.
+
+    Because concurrent transactions can commit a row after rows with higher ids, the ids skipped by a sync (the gaps)
+    are looked up again by the next syncs, for up to `sync_overlap` seconds. It must be longer than the longest
+    transaction that blacklists tokens.
+    """
+
+    def __init__(
+        self, capacity: int, recent_size: int, sync_interval: float, sync_overlap: float = 60, error_rate: float = 0.01
+    ) -> None:
+        self.capacity = capacity
+        self.recent_size = recent_size
+        self.sync_interval = sync_interval
+        self.sync_overlap = sync_overlap
+        self.error_rate = error_rate
+        self._lock = Lock()
+        self._generation = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop the index; it will be rebuilt from the database on the next check."""
+        with self._lock:
+            self._bloom = BloomFilter(self.capacity, self.error_rate)
+            self._recent: OrderedDict[str, None] = OrderedDict()
+            self._last_id: Optional[int] = None
+            self._gaps: dict[int, float] = {}
+            self._last_sync = 0.0
+            self._rebuild_adds: Optional[list[str]] = None
+            # Syncs that were running are discarded
+            self._generation += 1
+
+    def _remember(
+        self, jti: str, bloom: Optional[BloomFilter] = None, recent: Optional[OrderedDict[str, None]] = None
+    ) -> None:
+        """Add the JTI to both the Bloom filter and the recent set (the index's, unless others are given)."""
+        bloom = self._bloom if bloom is None else bloom
+        recent = self._recent if recent is None else recent
+        bloom.add(jti)
+        recent[jti] = None
+        recent.move_to_end(jti)
+        while len(recent) > self.recent_size:
+            recent.popitem(last=False)
+
+    def _rebuild(self, generation: int) -> None:
+        """Rebuild the index from scratch with the blacklisted tokens that have not expired yet."""
+        started_at, current_time = now(), time.monotonic()
+        # The highest id created before the overlap window; the ids skipped after it are tracked as gaps
+        floor_id = (
+            BlacklistedToken.objects.filter(blacklisted_at__lt=started_at - timedelta(seconds=self.sync_overlap))
+            .order_by("-id")
+            .values_list("id", flat=True)
+            .first()
+        ) or 0
+        queryset = BlacklistedToken.objects.filter(Q(token__expires_at__gt=started_at) | Q(id__gt=floor_id))
+        bloom = BloomFilter(max(self.capacity, queryset.count() * 2), self.error_rate)
+        recent: OrderedDict[str, None] = OrderedDict()
+        last_id = floor_id
+        gaps: dict[int, float] = {}
+        for row_id, jti in queryset.order_by("id").values_list("id", "token__jti").iterator():
+            self._remember(jti, bloom, recent)
+            if row_id > last_id:
+                gaps.update(dict.fromkeys(range(last_id + 1, row_id), current_time))
+                last_id = row_id
+        with self._lock:
+            if generation != self._generation:
+                return
+            for jti in self._rebuild_adds or ():
+                self._remember(jti, bloom, recent)
+            self._bloom, self._recent, self._last_id, self._gaps = bloom, recent, last_id, gaps
+            self._rebuild_adds = None
+            self._generation += 1
+
+    def _merge(self, rows: list[tuple[int, str]], last_id: int, current_time: float) -> None:
+        """Add the rows read by an incremental sync from `last_id`, and track the ids they skipped. Hold the lock."""
+        previous_id = last_id
+        for row_id, jti in rows:
+            self._remember(jti)
+            self._gaps.pop(row_id, None)
+            if row_id > previous_id:
+                self._gaps.update(dict.fromkeys(range(previous_id + 1, row_id), current_time))
+                previous_id = row_id
+        self._last_id = max(self._last_id or 0, previous_id)
+        self._gaps = {gap_id: t for gap_id, t in self._gaps.items() if current_time - t < self.sync_overlap}
+
+    def sync(self, force: bool = False) -> None:
+        """Bring the index up to date with the database, if the sync interval has passed (or `force` is set)."""
+        with self._lock:
+            current_time = time.monotonic()
+            if self._rebuild_adds is not None:  # Already being rebuilt
+                return
+            if not force and self._last_id is not None and current_time - self._last_sync < self.sync_interval:
+                return
+            self._last_sync = current_time
+            generation = self._generation
+            last_id, gap_ids = self._last_id, list(self._gaps)
+            rebuild = last_id is None or self._bloom.is_full
+            if rebuild:
+                self._rebuild_adds = []
+        if rebuild:
+            try:
+                self._rebuild(generation)
+            except Exception:
+                with self._lock:
+                    if generation == self._generation:  # The next sync tries again
+                        self._rebuild_adds = None
+                raise
+            return
+        assert last_id is not None
+        # Rows created after the last one seen, and the ones skipped by the previous syncs
+        new_rows = BlacklistedToken.objects.filter(Q(id__gt=last_id) | Q(id__in=gap_ids)).order_by("id")
+        rows = list(new_rows.values_list("id", "token__jti"))
+        with self._lock:
+            if generation == self._generation:
+                self._merge(rows, last_id, current_time)
+
+    def add(self, jti: str) -> None:
+        """Register a JTI that was just blacklisted."""
+        with self._lock:
+            self._remember(jti)
+            if self._rebuild_adds is not None:
+                self._rebuild_adds.append(jti)
+
+    def is_blacklisted(self, jti: str) -> bool:
+        """Check if the JTI is blacklisted, only going to the database if the in-memory index can't tell."""
+        self.sync()
+        with self._lock:
+            if self._last_id is not None:
+                if jti in self._recent:
+                    return True
+                if jti not in self._bloom:
+                    return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+blacklist_index = BlacklistIndex(
+    capacity=settings.USERS_BLACKLIST_INDEX_CAPACITY,
+    recent_size=settings.USERS_BLACKLIST_INDEX_RECENT_SIZE,
+    sync_interval=settings.USERS_BLACKLIST_INDEX_SYNC_INTERVAL,
+    sync_overlap=settings.USERS_BLACKLIST_INDEX_SYNC_OVERLAP,
+)
+"""Per-process `BlacklistIndex` used by the `users.tokens.RefreshToken`."""
+
+
+def add_blacklisted_token(jti: Optional[str]) -> None:
+    """Add a JTI blacklisted by any process to this process' index (or drop the whole index, with `None`)."""
+    if jti is None:
+        blacklist_index.reset()
+    else:
+        blacklist_index.add(jti)
+
+
+invalidation_bus.subscribe("blacklist", add_blacklisted_token)
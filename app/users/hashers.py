@@ -0,0 +1,132 @@
+import json
+import statistics
+import time
+from abc import ABC, abstractmethod
+from functools import cache
+from math import log2
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+@cache
+def get_work_factors() -> dict[str, dict[str, Any]]:
+    """
+    Load the work factors written by the `calibrate_hashers` command, keyed by algorithm. Returns an empty dictionary
+    if the hashers were never calibrated.
+    """
+    try:
+        return json.loads(Path(settings.PASSWORD_HASHERS_CALIBRATION_FILE).read_text())  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        return {}
+
+
+class CalibratedHasherMixin(ABC):
+    """
+    Mixin for password hashers whose work factors are calibrated to the host.
+
+    On creation, the hasher takes the work factors in `WORK_FACTORS` from the calibration file (see
+    `get_work_factors`), falling back to Django's defaults. Since the algorithm names are unchanged, existing hashes
+    are still verified, and the ones made with other parameters are upgraded on the next successful login (see
+    `User.check_password`).
+
+    Subclasses implement `_calibrate`, which derives the work factors that take `target` seconds per hash from a
+    measurement with the current ones.
+    """
+
+    algorithm: str
+    WORK_FACTORS: ClassVar[tuple[str, ...]] = ()
+    CALIBRATION_PASSWORD = "calibration-password"
+
+    def __init__(self) -> None:
+        super().__init__()
+        for name, value in get_work_factors().get(self.algorithm, {}).items():
+            if name in self.WORK_FACTORS:
+                setattr(self, name, value)
+
+    if TYPE_CHECKING:
+
+        def encode(self, password: str, salt: str) -> str: ...
+
+        def salt(self) -> str: ...
+
+    def time_hash(self, repeat: int = 3) -> float:
+        """Return the median time, in seconds, that hashing a password takes with the current work factors."""
+        salt = self.salt()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            self.encode(self.CALIBRATION_PASSWORD, salt)
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings)
+
+    @abstractmethod
+    def _calibrate(self, target: float) -> dict[str, Any]:
+        """Get the work factors that make a hash take about `target` seconds, whatever Django's defaults are."""
+
+    def calibrate(self, target: float, allow_weaker: bool = False) -> dict[str, Any]:
+        """
+        Return the work factors that make a hash take about `target` seconds on this host. Unless `allow_weaker` is
+        set, they're clamped to the hasher's defaults (the class attributes, which the calibration file doesn't change),
+        so a fast host never gets a weaker hash than Django would make.
+        """
+        work_factors = self._calibrate(target)
+        if not allow_weaker:
+            for name in self.WORK_FACTORS:
+                work_factors[name] = max(work_factors[name], getattr(type(self), name))
+        return work_factors
+
+
+class PBKDF2PasswordHasher(CalibratedHasherMixin, hashers.PBKDF2PasswordHasher):
+    """Calibrated `PBKDF2PasswordHasher`; the time scales linearly with the iterations."""
+
+    WORK_FACTORS = ("iterations",)
+    MIN_ITERATIONS = 1000
+    """The lowest iterations calibrated, with `allow_weaker`; otherwise, `calibrate` never goes below the default."""
+
+    def _calibrate(self, target: float) -> dict[str, Any]:
+        iterations = round(self.iterations * target / self.time_hash(), -3)
+        return {"iterations": max(int(iterations), self.MIN_ITERATIONS)}
+
+
+class PBKDF2SHA1PasswordHasher(PBKDF2PasswordHasher):
+    """Calibrated `PBKDF2SHA1PasswordHasher`."""
+
+    algorithm = "pbkdf2_sha1"
+    digest = hashers.PBKDF2SHA1PasswordHasher.digest
+
+
+class Argon2PasswordHasher(CalibratedHasherMixin, hashers.Argon2PasswordHasher):
+    """Calibrated `Argon2PasswordHasher`; only the time cost is calibrated, the memory cost is left as is."""
+
+    WORK_FACTORS = ("time_cost", "memory_cost", "parallelism")
+
+    def _calibrate(self, target: float) -> dict[str, Any]:
+        time_cost = max(round(self.time_cost * target / self.time_hash()), 1)
+        return {"time_cost": time_cost, "memory_cost": self.memory_cost, "parallelism": self.parallelism}
+
+
+class BCryptSHA256PasswordHasher(CalibratedHasherMixin, hashers.BCryptSHA256PasswordHasher):
+    """Calibrated `BCryptSHA256PasswordHasher`; each extra round doubles the time."""
+
+    WORK_FACTORS = ("rounds",)
+
+    def _calibrate(self, target: float) -> dict[str, Any]:
+        rounds = self.rounds + round(log2(target / self.time_hash()))
+        return {"rounds": min(max(rounds, 4), 31)}
+
+
+class ScryptPasswordHasher(CalibratedHasherMixin, hashers.ScryptPasswordHasher):
+    """
+    Calibrated `ScryptPasswordHasher`; the time (and memory) scales linearly with the work factor, which must be a
+    power of 2.
+    """
+
+    WORK_FACTORS = ("work_factor", "maxmem")
+
+    def _calibrate(self, target: float) -> dict[str, Any]:
+        work_factor = 2 ** max(round(log2(self.work_factor * target / self.time_hash())), 1)
+        # Scrypt needs 128 * N * r bytes; past OpenSSL's default 32 MiB limit, it has to be raised explicitly
+        maxmem = 0 if work_factor <= 2**14 else 2 * 128 * work_factor * self.block_size
+        return {"work_factor": work_factor, "maxmem": maxmem}
@@ -0,0 +1,128 @@
+import asyncio
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Optional
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from extensions.utilities.metrics import metrics_registry
+
+
+class HashingBacklogFull(APIException):
+    """Raised when there are too many password hashing jobs waiting; sheds load with a 503."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _("The server is too busy, please try again later.")
+    default_code = "service_unavailable"
+
+
+class PasswordHashingService:
+    """
+    Bounded worker pool for the CPU-bound password hashing (`make_password` / `verify_password`).
+
+    A thread pool is used because the hashers' heavy lifting (`hashlib.pbkdf2_hmac`, `scrypt`, `argon2`, `bcrypt`)
+    releases the GIL, so the hashes run in parallel without the cost of shipping passwords to other processes. The
+    pool caps how many hashes run at once per process; up to `max_backlog` more jobs may wait for a free worker, and
+    anything beyond that is rejected with `HashingBacklogFull` (503) instead of piling up.
+
+    With `max_workers` set to 0, hashing runs inline in the calling thread (and is never rejected).
+
+    The async methods allow async views to await the hashes without blocking the event loop.
+    """
+
+    def __init__(self, max_workers: int, max_backlog: int) -> None:
+        self.max_workers = max_workers
+        self.max_backlog = max_backlog
+        self._lock = Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor for this process, creating it if necessary (executors don't survive a fork)."""
+        if self._executor is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._pending = 0
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hashing")
+        return self._executor
+
+    def _done(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+
+    def submit[T](self, fn: Callable[..., T], *args: Any) -> Future[T]:
+        """Submit a job to the pool. Raises `HashingBacklogFull` if the backlog is full."""
+        future: Future[T]
+        if self.max_workers <= 0:
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+            with self._lock:
+                self._submitted += 1
+                self._completed += 1
+            return future
+        with self._lock:
+            executor = self._get_executor()
+            if self._pending >= self.max_workers + self.max_backlog:
+                self._rejected += 1
+                raise HashingBacklogFull()
+            self._pending += 1
+            self._submitted += 1
+            future = executor.submit(fn, *args)
+        future.add_done_callback(self._done)
+        return future
+
+    def make_password(self, password: Optional[str]) -> str:
+        """Hash the password with the preferred hasher. See `django.contrib.auth.hashers.make_password`."""
+        return self.submit(hashers.make_password, password).result()
+
+    async def amake_password(self, password: Optional[str]) -> str:
+        """See `make_password()`."""
+        return await asyncio.wrap_future(self.submit(hashers.make_password, password))
+
+    def verify_password(self, password: Optional[str], encoded: str) -> tuple[bool, bool]:
+        """
+        Check the password against the encoded hash. Returns `(is_correct, must_update)`, where `must_update` means the
+        hash should be regenerated with the current hasher settings. See `django.contrib.auth.hashers.verify_password`.
+        """
+        if password is None or not hashers.is_password_usable(encoded):
+            return False, False
+        return self.submit(hashers.verify_password, password, encoded).result()
+
+    async def averify_password(self, password: Optional[str], encoded: str) -> tuple[bool, bool]:
+        """See `verify_password()`."""
+        if password is None or not hashers.is_password_usable(encoded):
+            return False, False
+        return await asyncio.wrap_future(self.submit(hashers.verify_password, password, encoded))
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Queue depth and counters for this process."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_backlog": self.max_backlog,
+                "in_flight": self._pending,
+                "queued": max(0, self._pending - self.max_workers),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+
+password_hashing = PasswordHashingService(
+    max_workers=settings.USERS_PASSWORD_HASHING_WORKERS,
+    max_backlog=settings.USERS_PASSWORD_HASHING_MAX_BACKLOG,
+)
+"""Per-process `PasswordHashingService` used by the `User` model."""
+
+metrics_registry.register_collector("password_hashing", lambda: password_hashing.metrics)
@@ -0,0 +1,133 @@
+import atexit
+import logging
+import os
+from datetime import datetime
+from threading import Event, Lock, Thread
+from typing import Any, Optional
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.utils.timezone import now
+from extensions.utilities.transactions import commit_mode
+from users.models import User
+
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginBuffer:
+    """
+    Write-behind buffer for the Users' `last_login` timestamps.
+
+    Instead of issuing an `UPDATE` per login inside the request, logins are recorded in memory (keeping only the
+    latest timestamp per User) and written in a single bulk `UPDATE ... FROM (VALUES ...)` statement, either every
+    `flush_interval` seconds or as soon as `flush_size` Users are pending, by a background thread. The buffer is also
+    flushed when the process exits.
+
+    **Note**: the bulk update doesn't send `post_save` signals, so cached copies of the Users may carry an outdated
+    `last_login` until they expire.
+    """
+
+    def __init__(self, flush_interval: float, flush_size: int) -> None:
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._pending: dict[Any, datetime] = {}
+        self._lock = Lock()
+        self._wakeup = Event()
+        self._thread: Optional[Thread] = None
+        self._pid: Optional[int] = None
+
+    def _ensure_started(self) -> None:
+        """Start the flushing thread, if it's not running in this process yet."""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            # Another thread may have started it while this one waited for the lock
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = Thread(target=self._run, name="last-login-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Flushing thread loop."""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                # This thread gets its own connection; don't keep it open between flushes
+                connection.close()
+
+    def record(self, user: User, timestamp: Optional[datetime] = None) -> None:
+        """Record a login for the User; it will be written to the database on the next flush."""
+        timestamp = timestamp or now()
+        user.last_login = timestamp
+        with self._lock:
+            self._merge({user.pk: timestamp})
+            pending_count = len(self._pending)
+        if self.flush_interval <= 0:
+            # No background flushing
+            if pending_count >= self.flush_size:
+                self.flush()
+            return
+        self._ensure_started()
+        if pending_count >= self.flush_size:
+            self._wakeup.set()
+
+    def _merge(self, timestamps: dict[Any, datetime]) -> None:
+        """Merge the timestamps into the pending ones, keeping the latest per User. Must be called with the lock."""
+        for pk, timestamp in timestamps.items():
+            previous = self._pending.get(pk)
+            if previous is None or previous < timestamp:
+                self._pending[pk] = timestamp
+
+    def flush(self) -> int:
+        """Write all the pending timestamps to the database. Returns the number of Users updated."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        table = connection.ops.quote_name(User._meta.db_table)
+        pk_field = User._meta.pk
+        assert pk_field is not None
+        pk_column = connection.ops.quote_name(pk_field.column)
+        last_login_field = User._meta.get_field("last_login")
+        last_login_column = connection.ops.quote_name(last_login_field.column)
+        pk_type, last_login_type = pk_field.db_type(connection), last_login_field.db_type(connection)
+        values = ", ".join([f"(%s::{pk_type}, %s::{last_login_type})"] * len(pending))
+        params: list[Any] = []
+        # In primary key order, so that workers flushing overlapping Users lock their rows in the same order (instead
+        # of deadlocking)
+        for pk, timestamp in sorted(pending.items()):
+            params += [pk, timestamp]
+        # Never move a last_login backwards, in case a newer one was written in the meantime
+        sql = (
+            f"UPDATE {table} SET {last_login_column} = v.last_login "
+            f"FROM (VALUES {values}) AS v(pk, last_login) "
+            f"WHERE {table}.{pk_column} = v.pk "
+            f"AND ({table}.{last_login_column} IS NULL OR {table}.{last_login_column} < v.last_login)"
+        )
+        try:
+            with commit_mode(settings.USERS_BOOKKEEPING_COMMIT_MODES.get("last_login")), connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                return cursor.rowcount
+        except DatabaseError:
+            logger.exception(f"Failed to flush {len(pending)} last_login update(s); they'll be retried.")
+            # Put them back for the next flush, unless newer logins were recorded in the meantime
+            with self._lock:
+                self._merge(pending)
+            return 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+last_login_buffer = LastLoginBuffer(
+    flush_interval=settings.USERS_LAST_LOGIN_FLUSH_INTERVAL,
+    flush_size=settings.USERS_LAST_LOGIN_FLUSH_SIZE,
+)
+"""Per-process `LastLoginBuffer` used by the `UserLoginSerializer`."""
+
+# Make sure nothing is lost when the worker exits
+atexit.register(last_login_buffer.flush)
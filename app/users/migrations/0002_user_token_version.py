@@ -0,0 +1,18 @@
+# Generated by Django 6.0.5 on 2026-10-17 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text="Embedded in the user's tokens; incrementing it revokes all of them.", verbose_name='token version'),
+        ),
+    ]
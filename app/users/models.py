@@ -1,12 +1,14 @@
+from typing import Optional
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from extensions.models import AbstractBaseModel
-from extensions.models.mixins import SoftDeleteMixin
+from extensions.models import AbstractBaseModel, ValidationMode
+from extensions.models.mixins import DirtyFieldsMixin, SoftDeleteMixin
+from users.hashing import password_hashing
 from users.managers import UserManager
 
 
-class User(AbstractBaseUser, PermissionsMixin, SoftDeleteMixin, AbstractBaseModel):
+class User(AbstractBaseUser, PermissionsMixin, SoftDeleteMixin, DirtyFieldsMixin, AbstractBaseModel):
     """
     The concrete user class that will be used in the database.
 
@@ -25,9 +27,17 @@ class User(AbstractBaseUser, PermissionsMixin, SoftDeleteMixin, AbstractBaseMode
         verbose_name=_("staff status"),
         help_text=_("Designates this user as a staff member."),
     )
+    token_version = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("token version"),
+        help_text=_("Embedded in the user's tokens; incrementing it revokes all of them."),
+    )
 
     objects = UserManager()
     USERNAME_FIELD = "username"
+    enforce_unique_in_db = True
+    validation_mode = ValidationMode.CHANGED
 
     class Meta(AbstractBaseModel.Meta):
         verbose_name = _("user")
@@ -35,3 +45,37 @@ class User(AbstractBaseUser, PermissionsMixin, SoftDeleteMixin, AbstractBaseMode
 
     def __str__(self) -> str:
         return self.get_username()
+
+    def set_password(self, raw_password: Optional[str]) -> None:
+        """Override this method so that the password is hashed in the `PasswordHashingService` pool."""
+        self.password = password_hashing.make_password(raw_password)
+        self._password = raw_password
+
+    async def aset_password(self, raw_password: Optional[str]) -> None:
+        """See `set_password()`."""
+        self.password = await password_hashing.amake_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password: Optional[str]) -> bool:
+        """
+        Override this method so that the password is verified in the `PasswordHashingService` pool.
+
+        Like Django's implementation, the hash is upgraded when it was made with outdated hasher settings.
+        """
+        is_correct, must_update = password_hashing.verify_password(raw_password, self.password)
+        if is_correct and must_update:
+            self.set_password(raw_password)
+            # Password hash upgrades shouldn't be considered password changes.
+            self._password = None
+            self.save(update_fields=["password"])
+        return is_correct
+
+    async def acheck_password(self, raw_password: Optional[str]) -> bool:
+        """See `check_password()`."""
+        is_correct, must_update = await password_hashing.averify_password(raw_password, self.password)
+        if is_correct and must_update:
+            await self.aset_password(raw_password)
+            # Password hash upgrades shouldn't be considered password changes.
+            self._password = None
+            await self.asave(update_fields=["password"])
+        return is_correct
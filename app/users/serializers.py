@@ -1,9 +1,20 @@
 from typing import Any
+from django.conf import settings
 from rest_framework import serializers
-from users import models
+from drf_spectacular.contrib.rest_framework_simplejwt import (
+    TokenObtainPairSerializerExtension,
+    TokenRefreshSerializerExtension,
+)
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt import tokens as jwt_tokens
+from rest_framework_simplejwt.settings import api_settings
+from extensions.serializers import UniqueInDatabaseSerializerMixin
+from users import models, tokens
+from users.authentication import token_version_cache
+from users.last_login import last_login_buffer
 
 
-class UserRegisterSerializer(serializers.ModelSerializer[models.User]):
+class UserRegisterSerializer(UniqueInDatabaseSerializerMixin[models.User], serializers.ModelSerializer[models.User]):
     """Serializer for creating users."""
 
     class Meta:
@@ -41,3 +52,65 @@ class UserProfileSerializer(serializers.ModelSerializer[models.User]):
         model = models.User
         fields = ("id", "username", "created_at")
         extra_kwargs = {"username": {"read_only": True}}
+
+
+class UserLoginSerializer(jwt_serializers.TokenObtainPairSerializer):
+    """Serializer to obtain a pair of `(access_token, refresh_token)`, using our custom RefreshToken."""
+
+    token_class = tokens.RefreshToken
+
+    @classmethod
+    def get_token(cls, user: models.User) -> jwt_tokens.Token:  # type: ignore[override]
+        """
+        Override this method to embed the User's `USERNAME_FIELD` and the whitelisted `USERS_TOKEN_PROFILE_CLAIMS` in
+        the tokens, so that read-only endpoints can answer from the claims alone (see `ClaimsJWTAuthentication`).
+        """
+        token = super().get_token(user)
+        for claim in (models.User.USERNAME_FIELD, *settings.USERS_TOKEN_PROFILE_CLAIMS):
+            token[claim] = getattr(user, claim)
+        # The version is known at this point; spare the first authenticated request from looking it up
+        token_version_cache.set(str(getattr(user, api_settings.USER_ID_FIELD)), user.token_version)
+        return token
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, str]:
+        """
+        Override this method so that the `last_login` update goes through the `LastLoginBuffer` instead of being
+        written synchronously in the request.
+        """
+        data = jwt_serializers.TokenObtainSerializer.validate(self, attrs)
+        refresh = self.get_token(self.user)
+        data["refresh"] = str(refresh)
+        data["access"] = str(refresh.access_token)
+        if api_settings.UPDATE_LAST_LOGIN:
+            last_login_buffer.record(self.user)  # type: ignore[arg-type]
+        return data
+
+
+class UserLoginRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    """Serializer to refresh the tokens, using our custom RefreshToken."""
+
+    token_class = tokens.RefreshToken
+
+
+class UserLogoutSerializer(jwt_serializers.TokenBlacklistSerializer):
+    """Serializer to logout, revoking all of the User's tokens by incrementing its `token_version`."""
+
+    token_class = tokens.RefreshToken
+
+    def validate(self, attrs: dict[str, Any]) -> dict[Any, Any]:
+        """Override this method to revoke the tokens instead of blacklisting the given one."""
+        refresh = self.token_class(attrs["refresh"])
+        tokens.revoke_tokens(refresh[api_settings.USER_ID_CLAIM])
+        return {}
+
+
+class UserLoginSerializerExtension(TokenObtainPairSerializerExtension):  # pragma: no cover
+    """DRF Spectacular extension so that the `UserLoginSerializer` is documented like simplejwt's serializer."""
+
+    target_class = "users.serializers.UserLoginSerializer"
+
+
+class UserLoginRefreshSerializerExtension(TokenRefreshSerializerExtension):  # pragma: no cover
+    """DRF Spectacular extension so that the `UserLoginRefreshSerializer` is documented like simplejwt's serializer."""
+
+    target_class = "users.serializers.UserLoginRefreshSerializer"
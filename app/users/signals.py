@@ -0,0 +1,30 @@
+from typing import Any
+from django.contrib.auth.hashers import get_hashers, get_hashers_by_algorithm
+from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.settings import api_settings
+from users.authentication import invalidate_cached_user
+from users.hashers import get_work_factors
+from users.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_caches(sender: type[User], instance: User, **kwargs: Any) -> None:
+    """
+    Invalidate the cached authentication data for the User whenever it changes.
+
+    This covers regular saves, soft deletion, deactivation and password changes, since all of them go through `save`.
+    **Note**: queryset `update` calls do not send signals; code using them must invalidate the cache itself.
+    """
+    invalidate_cached_user(getattr(instance, api_settings.USER_ID_FIELD))
+
+
+@receiver(setting_changed)
+def reset_calibrated_hashers(setting: str, **kwargs: Any) -> None:
+    """Reload the calibrated work factors (and the hashers using them) when the calibration file changes."""
+    if setting == "PASSWORD_HASHERS_CALIBRATION_FILE":
+        get_work_factors.cache_clear()
+        get_hashers.cache_clear()
+        get_hashers_by_algorithm.cache_clear()
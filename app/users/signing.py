@@ -0,0 +1,123 @@
+import base64
+import hashlib
+import json
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Optional
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend as default_token_backend
+from rest_framework_simplejwt.tokens import Token
+import jwt
+from jwt import algorithms
+
+
+# Members of each key type that make up the RFC 7638 thumbprint
+THUMBPRINT_MEMBERS = {"RSA": ("e", "kty", "n"), "EC": ("crv", "kty", "x", "y"), "OKP": ("crv", "kty", "x")}
+
+
+class KeyRotationTokenBackend(TokenBackend):
+    """
+    TokenBackend that signs tokens with asymmetric keys, supporting key rotation.
+
+    Takes the private keys (PEM) in order: the first one signs new tokens, while the others are only kept to verify the
+    tokens they signed until those expire. Every token carries the `kid` (the key's RFC 7638 thumbprint) of the key
+    that signed it in its header, which is how the verifying key is picked. The public keys are published as a JWK
+    set, so other services can verify the tokens locally.
+
+    The keys are parsed once and kept for the lifetime of the process.
+    """
+
+    def __init__(self, algorithm: str, private_keys: list[str], **kwargs: Any) -> None:
+        if algorithm.startswith("HS"):
+            raise ImproperlyConfigured(f"Asymmetric JWT signing needs an asymmetric algorithm, got {algorithm}.")
+        if not algorithms.has_crypto:
+            raise ImproperlyConfigured("Asymmetric JWT signing requires the `cryptography` package to be installed.")
+        if not private_keys:
+            raise ImproperlyConfigured("Asymmetric JWT signing requires at least one private key.")
+        super().__init__(algorithm, **kwargs)
+        # The prepared private keys by `kid`, in the same order as the `private_keys`
+        jws_algorithm = jwt.PyJWS().get_algorithm_by_name(self.algorithm)
+        self.keys: dict[str, Any] = {}
+        for pem in private_keys:
+            key = jws_algorithm.prepare_key(pem)
+            self.keys[self.get_kid(jws_algorithm.to_jwk(key.public_key(), as_dict=True))] = key
+        self.signing_kid = next(iter(self.keys))
+        self.verifying_keys = {kid: key.public_key() for kid, key in self.keys.items()}
+
+    @cached_property
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """The public keys, as a JWK set."""
+        jws_algorithm = jwt.PyJWS().get_algorithm_by_name(self.algorithm)
+        return {
+            "keys": [
+                {**jws_algorithm.to_jwk(key, as_dict=True), "kid": kid, "alg": self.algorithm, "use": "sig"}
+                for kid, key in self.verifying_keys.items()
+            ]
+        }
+
+    @staticmethod
+    def get_kid(jwk: dict[str, Any]) -> str:
+        """Get the RFC 7638 thumbprint of the public JWK."""
+        members = {name: jwk[name] for name in THUMBPRINT_MEMBERS[jwk["kty"]]}
+        digest = hashlib.sha256(json.dumps(members, separators=(",", ":"), sort_keys=True).encode()).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+    def get_verifying_key(self, token: Token) -> Any:
+        """Override this method to pick the verifying key from the token's `kid` header."""
+        try:
+            # simplejwt passes the encoded token here, despite the annotation
+            kid = jwt.get_unverified_header(token).get("kid")  # type: ignore[arg-type]
+        except jwt.InvalidTokenError as e:
+            raise TokenBackendError(_("Token is invalid")) from e
+        if kid not in self.verifying_keys:
+            raise TokenBackendError(_("Token is invalid"))
+        return self.verifying_keys[kid]
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        """Override this method to sign with the active key, adding its `kid` to the header."""
+        jwt_payload = payload.copy()
+        if self.audience is not None:
+            jwt_payload["aud"] = self.audience
+        if self.issuer is not None:
+            jwt_payload["iss"] = self.issuer
+        return jwt.encode(
+            jwt_payload,
+            self.keys[self.signing_kid],
+            algorithm=self.algorithm,
+            headers={"kid": self.signing_kid},
+            json_encoder=self.json_encoder,
+        )
+
+
+def get_token_backend() -> TokenBackend:
+    """
+    Get the TokenBackend for the configured signing: a `KeyRotationTokenBackend` if private keys are set in
+    `USERS_JWT_PRIVATE_KEY_FILES`, or simplejwt's default (`SIMPLE_JWT` settings) otherwise.
+    """
+    key_files: list[str] = settings.USERS_JWT_PRIVATE_KEY_FILES
+    if not key_files:
+        return default_token_backend
+    return KeyRotationTokenBackend(
+        settings.USERS_JWT_ALGORITHM,
+        [Path(key_file).read_text() for key_file in key_files],
+        audience=api_settings.AUDIENCE,
+        issuer=api_settings.ISSUER,
+        leeway=api_settings.LEEWAY,
+        json_encoder=api_settings.JSON_ENCODER,
+    )
+
+
+token_backend = get_token_backend()
+"""Per-process TokenBackend used by the `users.tokens` token classes."""
+
+
+def get_jwks() -> Optional[dict[str, list[dict[str, Any]]]]:
+    """Get the published JWK set, or `None` if the tokens are signed with a (secret) symmetric key."""
+    if isinstance(token_backend, KeyRotationTokenBackend):
+        return token_backend.jwks
+    return None
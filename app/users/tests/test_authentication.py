@@ -0,0 +1,157 @@
+from django.urls import reverse
+from rest_framework import status
+from extensions.utilities.test import APITestCase
+from users import serializers
+from users.authentication import token_version_cache, user_cache
+from users.models import User
+from users.tests import VALID_PASSWORD, sample_user
+from users.throttling import throttle_counters
+from users.tokens import AccessToken, revoke_tokens
+
+
+class TestCachedJWTAuthentication(APITestCase):
+    """Test the CachedJWTAuthentication."""
+
+    URL = reverse("users:whoami")
+
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.user = sample_user(password=VALID_PASSWORD)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+    def test_cached(self) -> None:
+        """Test that the User is only fetched from the database once."""
+        with self.assertNumQueries(1):
+            res = self.client.get(self.URL)
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        with self.assertNumQueries(0):
+            res = self.client.get(self.URL)
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        self.assertResponseData(self.user, serializers.UserWhoamiSerializer, res)
+
+    def test_cached_instance_is_not_shared(self) -> None:
+        """Test that changes to the authenticated User don't leak into the cached instance."""
+        self.client.get(self.URL)
+        cached = user_cache.get(str(self.user.id))
+        assert cached is not None
+        cached_username = cached.username
+        res = self.client.get(self.URL)
+        res.wsgi_request.user.username = "_changed"
+        self.assertEqual(cached_username, cached.username)
+
+    def test_invalidated_on_save(self) -> None:
+        """Test that saving the User invalidates the cache."""
+        self.client.get(self.URL)
+        self.user.username = "_username_updated"
+        self.user.save()
+        self.assertNotIn(str(self.user.id), user_cache)
+        with self.assertNumQueries(1):
+            res = self.client.get(self.URL)
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        self.assertEqual(self.user.username, res.json()["username"])
+
+    def test_invalidated_on_deactivation(self) -> None:
+        """Test that deactivating the User invalidates the cache."""
+        self.client.get(self.URL)
+        self.user.is_active = False
+        self.user.save()
+        res = self.client.get(self.URL)
+        self.assertResponseStatusCode(status.HTTP_401_UNAUTHORIZED, res)
+
+    def test_invalidated_on_soft_delete(self) -> None:
+        """Test that soft deleting the User invalidates the cache."""
+        self.client.get(self.URL)
+        self.user.soft_delete()
+        self.assertNotIn(str(self.user.id), user_cache)
+
+    def test_invalidated_on_password_change(self) -> None:
+        """Test that changing the User's password invalidates the cache."""
+        self.client.get(self.URL)
+        self.user.set_password(VALID_PASSWORD + "_updated")
+        self.user.save()
+        self.assertNotIn(str(self.user.id), user_cache)
+
+    def test_invalidated_on_delete(self) -> None:
+        """Test that deleting the User invalidates the cache."""
+        self.client.get(self.URL)
+        User.objects.filter(id=self.user.id).delete()
+        res = self.client.get(self.URL)
+        self.assertResponseStatusCode(status.HTTP_401_UNAUTHORIZED, res)
+
+
+class TestClaimsJWTAuthentication(APITestCase):
+    """Test the ClaimsJWTAuthentication, through the UserWhoamiView."""
+
+    URL = reverse("users:whoami")
+
+    def setUp(self) -> None:
+        user_cache.clear()
+        throttle_counters.clear()
+        self.user = sample_user(password=VALID_PASSWORD)
+
+    def test_no_queries(self) -> None:
+        """Test that the tokens obtained by logging in are answered from their claims."""
+        res = self.client.post(reverse("users:login"), {"username": self.user.username, "password": VALID_PASSWORD})
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {res.json()['access']}")
+        with self.assertNumQueries(0):
+            res = self.client.get(self.URL)
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        self.assertResponseData(self.user, serializers.UserWhoamiSerializer, res)
+
+    def test_fallback(self) -> None:
+        """Test that tokens without the profile claims fall back to loading the User."""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        with self.assertNumQueries(1):
+            res = self.client.get(self.URL)
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        self.assertResponseData(self.user, serializers.UserWhoamiSerializer, res)
+
+
+class TestTokenVersion(APITestCase):
+    """Test revoking the tokens through the User's `token_version`."""
+
+    def setUp(self) -> None:
+        user_cache.clear()
+        token_version_cache.clear()
+        throttle_counters.clear()
+        self.user = sample_user(password=VALID_PASSWORD)
+        res = self.client.post(reverse("users:login"), {"username": self.user.username, "password": VALID_PASSWORD})
+        self.tokens = res.json()
+
+    def assertRevoked(self) -> None:
+        """Assert that the tokens obtained on login no longer work."""
+        res = self.client.get(reverse("users:whoami"), HTTP_AUTHORIZATION=f"Bearer {self.tokens['access']}")
+        self.assertResponseStatusCode(status.HTTP_401_UNAUTHORIZED, res)
+        res = self.client.get(reverse("users:profile"), HTTP_AUTHORIZATION=f"Bearer {self.tokens['access']}")
+        self.assertResponseStatusCode(status.HTTP_401_UNAUTHORIZED, res)
+        res = self.client.post(reverse("users:login-refresh"), {"refresh": self.tokens["refresh"]})
+        self.assertResponseStatusCode(status.HTTP_401_UNAUTHORIZED, res)
+
+    def test_revoke_tokens(self) -> None:
+        """Test that revoking the tokens takes a single query, and invalidates all of them."""
+        with self.assertNumQueries(1):
+            revoke_tokens(self.user.id)
+        self.user.refresh_from_db()
+        self.assertEqual(1, self.user.token_version)
+        self.assertRevoked()
+        # New tokens carry the new version
+        token = AccessToken.for_user(self.user)
+        res = self.client.get(reverse("users:profile"), HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+
+    def test_logout(self) -> None:
+        """Test that logging out revokes all of the User's tokens."""
+        res = self.client.post(reverse("users:logout"), {"refresh": self.tokens["refresh"]})
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        self.assertRevoked()
+
+    def test_change_password(self) -> None:
+        """Test that changing the password revokes all of the User's tokens."""
+        res = self.client.post(
+            reverse("users:change-password"),
+            {"password": VALID_PASSWORD, "new_password": VALID_PASSWORD + "_updated"},
+            HTTP_AUTHORIZATION=f"Bearer {self.tokens['access']}",
+        )
+        self.assertResponseStatusCode(status.HTTP_204_NO_CONTENT, res)
+        self.assertRevoked()
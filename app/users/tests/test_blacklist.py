@@ -0,0 +1,130 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from django.test import TestCase
+from django.utils.timezone import now
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from extensions.utilities import uuid
+from users.blacklist import BlacklistIndex, blacklist_index
+from users.tests import sample_user
+from users.tokens import RefreshToken
+
+
+class TestBlacklistIndex(TestCase):
+    """Test the BlacklistIndex."""
+
+    def setUp(self) -> None:
+        self.index = BlacklistIndex(capacity=100, recent_size=10, sync_interval=0)
+
+    def sample_blacklisted_jti(self, expired: bool = False) -> str:
+        """Insert a blacklisted token directly in the database and return its JTI."""
+        jti = uuid()
+        expires_at = now() + (timedelta(hours=-1) if expired else timedelta(hours=1))
+        token = OutstandingToken.objects.create(jti=jti, token="_token", expires_at=expires_at)
+        BlacklistedToken.objects.create(token=token)
+        return jti
+
+    def test_initial_build(self) -> None:
+        """Test that the index is built from the database on the first check."""
+        jti = self.sample_blacklisted_jti()
+        self.assertTrue(self.index.is_blacklisted(jti))
+        self.assertFalse(self.index.is_blacklisted(uuid()))
+
+    def test_expired_tokens_skipped(self) -> None:
+        """Test that the blacklisted tokens that already expired are not loaded into the index."""
+        jti = self.sample_blacklisted_jti(expired=True)
+        self.index.sync()
+        self.assertNotIn(jti, self.index._bloom)
+
+    def test_incremental_sync(self) -> None:
+        """Test that the tokens blacklisted after the index was built are picked up."""
+        self.index.sync()
+        jti = self.sample_blacklisted_jti()
+        with self.assertNumQueries(1):
+            self.assertTrue(self.index.is_blacklisted(jti))
+
+    def test_incremental_sync_out_of_order(self) -> None:
+        """Test that rows committed after rows with higher ids (by concurrent transactions) are picked up."""
+        late_jti = self.sample_blacklisted_jti()
+        self.sample_blacklisted_jti()
+        late_row = BlacklistedToken.objects.get(token__jti=late_jti)
+        late_row.delete()
+        self.index.sync()
+        # Commit the row with the lower id only after the index has seen the higher one
+        BlacklistedToken.objects.create(id=late_row.id, token=late_row.token)
+        self.assertTrue(self.index.is_blacklisted(late_jti))
+
+    @patch("users.blacklist.time.monotonic")
+    def test_gaps_expire(self, monotonic_mock: MagicMock) -> None:
+        """Test that the ids skipped by a sync are only looked up again until the overlap passes."""
+        monotonic_mock.return_value = 1000.0
+        late_jti = self.sample_blacklisted_jti()
+        self.sample_blacklisted_jti()
+        late_row = BlacklistedToken.objects.get(token__jti=late_jti)
+        late_row.delete()
+        self.index.sync()
+        self.assertIn(late_row.id, self.index._gaps)
+        # Still missing; looked up again
+        self.index.sync()
+        self.assertIn(late_row.id, self.index._gaps)
+        monotonic_mock.return_value += 60
+        self.index.sync()
+        self.assertNotIn(late_row.id, self.index._gaps)
+
+    def test_not_built_fallback(self) -> None:
+        """Test that, until the index is built, the checks go to the database."""
+        jti = self.sample_blacklisted_jti()
+        with patch.object(self.index, "sync"):
+            self.assertTrue(self.index.is_blacklisted(jti))
+            self.assertFalse(self.index.is_blacklisted(uuid()))
+
+    def test_not_blacklisted_no_lookup(self) -> None:
+        """Test that a token that's not blacklisted is answered without looking up the blacklist."""
+        self.index.sync()
+        # Only the incremental sync query
+        with self.assertNumQueries(1):
+            self.assertFalse(self.index.is_blacklisted(uuid()))
+
+    def test_sync_interval(self) -> None:
+        """Test that the index doesn't sync again before the interval passes."""
+        index = BlacklistIndex(capacity=100, recent_size=10, sync_interval=3600)
+        index.sync()
+        with self.assertNumQueries(0):
+            self.assertFalse(index.is_blacklisted(uuid()))
+
+    def test_database_fallback(self) -> None:
+        """Test that Bloom filter hits outside of the recent set are confirmed in the database."""
+        index = BlacklistIndex(capacity=100, recent_size=1, sync_interval=0)
+        first_jti = self.sample_blacklisted_jti()
+        self.sample_blacklisted_jti()  # Pushes the first one out of the recent set
+        index.sync()
+        self.assertNotIn(first_jti, index._recent)
+        # Incremental sync and the fallback lookup
+        with self.assertNumQueries(2):
+            self.assertTrue(index.is_blacklisted(first_jti))
+
+    def test_rebuild_when_full(self) -> None:
+        """Test that the index is rebuilt once it holds more tokens than it was sized for."""
+        index = BlacklistIndex(capacity=1, recent_size=10, sync_interval=0)
+        jtis = [self.sample_blacklisted_jti() for _ in range(3)]
+        index.sync()
+        self.assertTrue(index._bloom.capacity >= len(jtis))
+        for jti in jtis:
+            self.assertTrue(index.is_blacklisted(jti))
+
+
+class TestRefreshToken(TestCase):
+    """Test the custom RefreshToken."""
+
+    def test_blacklist(self) -> None:
+        """Test that blacklisting a token registers it in the index, and makes it invalid."""
+        token = RefreshToken.for_user(sample_user())
+        with self.captureOnCommitCallbacks() as callbacks:
+            token.blacklist()
+        # Only once committed
+        self.assertNotIn(token["jti"], blacklist_index._recent)
+        for callback in callbacks:
+            callback()
+        self.assertIn(token["jti"], blacklist_index._recent)
+        with self.assertRaises(TokenError):
+            RefreshToken(str(token))  # type: ignore[arg-type]
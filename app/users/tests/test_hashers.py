@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import BasePasswordHasher, get_hasher, make_password
+from django.test import TestCase, override_settings
+from users.hashers import CalibratedHasherMixin, PBKDF2PasswordHasher
+from users.tests import VALID_PASSWORD, sample_user
+
+
+class TestCalibratedHashers(TestCase):
+    """Test the calibrated password hashers."""
+
+    def setUp(self) -> None:
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.calibration_file = Path(directory.name) / "hashers.json"
+        self.calibration_file.write_text(json.dumps({"pbkdf2_sha256": {"iterations": 2000, "_unknown": 1}}))
+
+    def test_defaults(self) -> None:
+        """Test that the hashers use Django's defaults when they were never calibrated."""
+        with override_settings(PASSWORD_HASHERS_CALIBRATION_FILE=str(self.calibration_file.with_suffix(".missing"))):
+            self.assertEqual(PBKDF2PasswordHasher.iterations, get_hasher().iterations)  # type: ignore[attr-defined]
+
+    def test_calibrated(self) -> None:
+        """Test that the hashers use the calibrated work factors, ignoring unknown ones."""
+        with override_settings(PASSWORD_HASHERS_CALIBRATION_FILE=str(self.calibration_file)):
+            hasher = get_hasher()
+            self.assertEqual(2000, hasher.iterations)  # type: ignore[attr-defined]
+            self.assertFalse(hasattr(hasher, "_unknown"))
+
+    def test_rehash_on_login(self) -> None:
+        """Test that logging in upgrades a hash made with outdated work factors."""
+        user = sample_user(password=VALID_PASSWORD)
+        with override_settings(PASSWORD_HASHERS_CALIBRATION_FILE=str(self.calibration_file)):
+            self.assertTrue(get_hasher().must_update(user.password))
+            self.assertEqual(user, authenticate(username=user.username, password=VALID_PASSWORD))
+            user.refresh_from_db()
+            self.assertFalse(get_hasher().must_update(user.password))
+            self.assertTrue(user.check_password(VALID_PASSWORD))
+
+    def test_calibrate(self) -> None:
+        """Test that the iterations scale with the measured time."""
+        with override_settings(PASSWORD_HASHERS_CALIBRATION_FILE=str(self.calibration_file)):
+            hasher = PBKDF2PasswordHasher()
+            hasher.time_hash = lambda repeat=3: 0.001  # type: ignore[method-assign]
+            self.assertEqual({"iterations": 100_000}, hasher.calibrate(0.05, allow_weaker=True))
+            self.assertEqual({"iterations": PBKDF2PasswordHasher.iterations}, hasher.calibrate(0.05))
+            self.assertTrue(hasher.verify(VALID_PASSWORD, make_password(VALID_PASSWORD)))
+
+    def test_calibrate_slow_host(self) -> None:
+        """Test that a slow host only gets weaker work factors than Django's defaults with `allow_weaker`."""
+        with override_settings(PASSWORD_HASHERS_CALIBRATION_FILE=str(self.calibration_file)):
+            hasher = PBKDF2PasswordHasher()
+            hasher.time_hash = lambda repeat=3: 100.0  # type: ignore[method-assign]
+            self.assertEqual({"iterations": PBKDF2PasswordHasher.iterations}, hasher.calibrate(0.05))
+            self.assertEqual(
+                {"iterations": PBKDF2PasswordHasher.MIN_ITERATIONS}, hasher.calibrate(0.05, allow_weaker=True)
+            )
+
+    def test_calibrate_required(self) -> None:
+        """Test that the calibrated hashers must implement `_calibrate`."""
+
+        class UncalibratedHasher(CalibratedHasherMixin, BasePasswordHasher):
+            algorithm = "_uncalibrated"
+
+        with self.assertRaises(TypeError):
+            UncalibratedHasher()  # type: ignore[abstract]
@@ -0,0 +1,118 @@
+import asyncio
+import time
+from threading import Event, Thread
+from unittest.mock import patch
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from app import gunicorn
+from extensions.utilities.test import APITestCase
+from users.hashing import HashingBacklogFull, PasswordHashingService
+from users.tests import VALID_PASSWORD, sample_user
+from users.throttling import throttle_counters
+
+
+class TestPasswordHashingService(TestCase):
+    """Test the PasswordHashingService."""
+
+    def setUp(self) -> None:
+        self.service = PasswordHashingService(max_workers=1, max_backlog=1)
+
+    def test_make_and_verify(self) -> None:
+        """Test hashing and verifying a password in the pool."""
+        encoded = self.service.make_password(VALID_PASSWORD)
+        self.assertEqual((True, False), self.service.verify_password(VALID_PASSWORD, encoded))
+        self.assertEqual((False, False), self.service.verify_password("_wrong", encoded))
+        self.assertEqual(3, self.service.metrics["completed"])
+
+    def test_async(self) -> None:
+        """Test the async methods."""
+        encoded = asyncio.run(self.service.amake_password(VALID_PASSWORD))
+        self.assertEqual((True, False), asyncio.run(self.service.averify_password(VALID_PASSWORD, encoded)))
+
+    def test_unusable_password_skips_pool(self) -> None:
+        """Test that unusable passwords are rejected without submitting a job."""
+        self.assertEqual((False, False), self.service.verify_password(VALID_PASSWORD, make_password(None)))
+        self.assertEqual((False, False), self.service.verify_password(None, make_password(VALID_PASSWORD)))
+        self.assertEqual(0, self.service.metrics["submitted"])
+
+    def test_inline(self) -> None:
+        """Test that with no workers the hashing runs inline."""
+        service = PasswordHashingService(max_workers=0, max_backlog=0)
+        encoded = service.make_password(VALID_PASSWORD)
+        self.assertTrue(service.verify_password(VALID_PASSWORD, encoded)[0])
+        self.assertEqual(0, service.metrics["in_flight"])
+
+    def test_backlog_full(self) -> None:
+        """Test that jobs beyond the backlog are rejected."""
+        release = Event()
+        try:
+            running = self.service.submit(release.wait)
+            queued = self.service.submit(release.wait)
+            self.assertEqual(1, self.service.metrics["queued"])
+            with self.assertRaises(HashingBacklogFull):
+                self.service.submit(release.wait)
+            self.assertEqual(1, self.service.metrics["rejected"])
+        finally:
+            release.set()
+        running.result()
+        queued.result()
+        self.assertEqual(0, self.service.metrics["in_flight"])
+
+    def test_concurrent_callers(self) -> None:
+        """
+        Test that, with the shipped configuration, a gunicorn worker's threads all hashing at once fill the backlog,
+        and the callers beyond it are shed with a 503.
+        """
+        service = PasswordHashingService(
+            max_workers=settings.USERS_PASSWORD_HASHING_WORKERS,
+            max_backlog=settings.USERS_PASSWORD_HASHING_MAX_BACKLOG,
+        )
+        capacity = service.max_workers + service.max_backlog
+        self.assertLess(capacity, gunicorn.threads)
+        release = Event()
+
+        def slow_make_password(password: str) -> str:
+            release.wait()
+            return password
+
+        with patch("users.hashing.hashers.make_password", slow_make_password):
+            callers = [Thread(target=service.make_password, args=(VALID_PASSWORD,)) for _ in range(capacity)]
+            try:
+                for caller in callers:
+                    caller.start()
+                while service.metrics["in_flight"] < capacity:
+                    time.sleep(0.01)
+                for _ in range(gunicorn.threads - capacity):
+                    with self.assertRaises(HashingBacklogFull) as ctx:
+                        service.make_password(VALID_PASSWORD)
+                    self.assertEqual(status.HTTP_503_SERVICE_UNAVAILABLE, ctx.exception.status_code)
+            finally:
+                release.set()
+                for caller in callers:
+                    caller.join()
+        self.assertEqual(gunicorn.threads - capacity, service.metrics["rejected"])
+
+
+class TestPasswordHashingBacklog(APITestCase):
+    """Test that the authentication endpoints shed load when the hashing backlog is full."""
+
+    URL = reverse("users:login")
+
+    def setUp(self) -> None:
+        throttle_counters.clear()
+
+    def test_login_503(self) -> None:
+        """Test that logging in returns a 503 when the backlog is full."""
+        user = sample_user(password=VALID_PASSWORD)
+        service = PasswordHashingService(max_workers=1, max_backlog=0)
+        release = Event()
+        with patch("users.models.password_hashing", service):
+            try:
+                service.submit(release.wait)
+                res = self.client.post(self.URL, {"username": user.username, "password": VALID_PASSWORD})
+            finally:
+                release.set()
+        self.assertResponseStatusCode(status.HTTP_503_SERVICE_UNAVAILABLE, res)
@@ -0,0 +1,139 @@
+from datetime import timedelta
+from threading import Thread
+from typing import Any
+from unittest.mock import patch
+from django.db import DatabaseError, connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework import status
+from extensions.utilities.test import APITestCase
+from users.last_login import LastLoginBuffer
+from users.models import User
+from users.tests import VALID_PASSWORD, sample_user
+from users.throttling import throttle_counters
+
+
+class TestLastLoginBuffer(TestCase):
+    """Test the LastLoginBuffer."""
+
+    def setUp(self) -> None:
+        self.buffer = LastLoginBuffer(flush_interval=0, flush_size=100)
+
+    def test_flush(self) -> None:
+        """Test that the recorded logins are written in a single query on flush."""
+        users = [sample_user() for _ in range(3)]
+        timestamp = now()
+        for user in users:
+            self.buffer.record(user, timestamp)
+        self.assertEqual(3, len(self.buffer))
+        with self.assertNumQueries(1):
+            self.assertEqual(3, self.buffer.flush())
+        self.assertEqual(0, len(self.buffer))
+        for user in users:
+            user.refresh_from_db()
+            self.assertEqual(timestamp, user.last_login)
+
+    def test_flush_ordered(self) -> None:
+        """Test that the Users are written in primary key order, so that concurrent flushes lock them in one order."""
+        users = sorted((sample_user() for _ in range(3)), key=lambda user: user.pk, reverse=True)
+        for user in users:
+            self.buffer.record(user)
+        with CaptureQueriesContext(connection) as ctx:
+            self.buffer.flush()
+        sql = next(query["sql"] for query in ctx.captured_queries if query["sql"].startswith("UPDATE"))
+        positions = [sql.index(str(user.pk)) for user in users]
+        self.assertEqual(sorted(positions, reverse=True), positions)
+
+    def test_keeps_latest(self) -> None:
+        """Test that only the latest login is kept for each User."""
+        user = sample_user()
+        timestamp = now()
+        self.buffer.record(user, timestamp)
+        self.buffer.record(user, timestamp - timedelta(minutes=1))
+        self.assertEqual(1, len(self.buffer))
+        self.buffer.flush()
+        user.refresh_from_db()
+        self.assertEqual(timestamp, user.last_login)
+
+    def test_never_moves_backwards(self) -> None:
+        """Test that a newer `last_login` in the database isn't overwritten by an older one."""
+        timestamp = now()
+        user = sample_user()
+        User.objects.filter(id=user.id).update(last_login=timestamp)
+        self.buffer.record(user, timestamp - timedelta(minutes=1))
+        self.assertEqual(0, self.buffer.flush())
+        user.refresh_from_db()
+        self.assertEqual(timestamp, user.last_login)
+
+    def test_flush_size(self) -> None:
+        """Test that the buffer is flushed once it reaches the size threshold."""
+        buffer = LastLoginBuffer(flush_interval=0, flush_size=2)
+        first_user, second_user = sample_user(), sample_user()
+        buffer.record(first_user)
+        self.assertEqual(1, len(buffer))
+        buffer.record(second_user)
+        self.assertEqual(0, len(buffer))
+        second_user.refresh_from_db()
+        self.assertIsNotNone(second_user.last_login)
+
+    def test_flush_failed(self) -> None:
+        """Test that a batch that fails to be written is put back, keeping any newer login recorded in the meantime."""
+        first_user, second_user = sample_user(), sample_user()
+        timestamp = now()
+        self.buffer.record(first_user, timestamp)
+        self.buffer.record(second_user, timestamp)
+
+        def commit_mode(*args: Any) -> None:
+            # Logins recorded while the batch is being written
+            self.buffer.record(first_user, timestamp + timedelta(minutes=1))
+            self.buffer.record(second_user, timestamp - timedelta(minutes=1))
+            raise DatabaseError
+
+        with patch("users.last_login.commit_mode", side_effect=commit_mode):
+            self.assertEqual(0, self.buffer.flush())
+        self.assertEqual(2, len(self.buffer))
+        self.assertEqual(2, self.buffer.flush())
+        first_user.refresh_from_db()
+        second_user.refresh_from_db()
+        self.assertEqual(timestamp + timedelta(minutes=1), first_user.last_login)
+        self.assertEqual(timestamp, second_user.last_login)
+
+    def test_start_once(self) -> None:
+        """Test that concurrent logins start a single flushing thread."""
+        buffer = LastLoginBuffer(flush_interval=3600, flush_size=100)
+        with patch("users.last_login.Thread") as thread_mock:
+            threads = [Thread(target=buffer.record, args=(sample_user(),)) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        thread_mock.assert_called_once()
+
+    def test_flush_empty(self) -> None:
+        """Test that flushing an empty buffer doesn't query the database."""
+        with self.assertNumQueries(0):
+            self.assertEqual(0, self.buffer.flush())
+
+
+class TestLoginLastLogin(APITestCase):
+    """Test that logging in goes through the LastLoginBuffer."""
+
+    URL = reverse("users:login")
+
+    def setUp(self) -> None:
+        throttle_counters.clear()
+
+    def test_login_buffered(self) -> None:
+        """Test that the `last_login` is only written when the buffer is flushed."""
+        user = sample_user(password=VALID_PASSWORD)
+        buffer = LastLoginBuffer(flush_interval=0, flush_size=100)
+        with patch("users.serializers.last_login_buffer", buffer):
+            res = self.client.post(self.URL, {"username": user.username, "password": VALID_PASSWORD})
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        user.refresh_from_db()
+        self.assertIsNone(user.last_login)
+        buffer.flush()
+        user.refresh_from_db()
+        self.assertIsNotNone(user.last_login)
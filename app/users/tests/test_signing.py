@@ -0,0 +1,87 @@
+from typing import Any
+from unittest.mock import patch
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from extensions.utilities.test import APITestCase
+from users.signing import KeyRotationTokenBackend
+from users.tests import sample_user
+from users.tokens import AccessToken
+
+
+def sample_private_key() -> str:
+    """Generate an Ed25519 private key in PEM format."""
+    return (
+        Ed25519PrivateKey.generate()
+        .private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+        .decode()
+    )
+
+
+class TestKeyRotationTokenBackend(TestCase):
+    """Test the KeyRotationTokenBackend."""
+
+    def setUp(self) -> None:
+        self.old_key, self.new_key = sample_private_key(), sample_private_key()
+        self.backend = KeyRotationTokenBackend("EdDSA", [self.new_key, self.old_key])
+        self.payload: dict[str, Any] = {"_claim": "_value"}
+
+    def test_encode_decode(self) -> None:
+        """Test that tokens are signed with the first key and can be verified."""
+        token = self.backend.encode(self.payload)
+        self.assertEqual(self.payload, self.backend.decode(token))  # type: ignore[arg-type]
+
+    def test_rotation(self) -> None:
+        """Test that tokens signed with a previous key are still verified."""
+        old_backend = KeyRotationTokenBackend("EdDSA", [self.old_key])
+        token = old_backend.encode(self.payload)
+        self.assertNotEqual(old_backend.signing_kid, self.backend.signing_kid)
+        self.assertEqual(self.payload, self.backend.decode(token))  # type: ignore[arg-type]
+
+    def test_unknown_key(self) -> None:
+        """Test that tokens signed with an unknown key are rejected."""
+        token = KeyRotationTokenBackend("EdDSA", [sample_private_key()]).encode(self.payload)
+        with self.assertRaises(TokenBackendError):
+            self.backend.decode(token)  # type: ignore[arg-type]
+
+    def test_jwks(self) -> None:
+        """Test that the JWK set holds the public keys only."""
+        jwks = self.backend.jwks
+        self.assertEqual(list(self.backend.keys), [key["kid"] for key in jwks["keys"]])
+        for key in jwks["keys"]:
+            self.assertEqual("OKP", key["kty"])
+            self.assertNotIn("d", key)
+
+    def test_symmetric_algorithm(self) -> None:
+        """Test that symmetric algorithms are rejected."""
+        with self.assertRaises(ImproperlyConfigured):
+            KeyRotationTokenBackend("HS256", [self.new_key])
+
+
+class TestUserJWKSView(APITestCase):
+    """Test the UserJWKSView."""
+
+    URL = reverse("users:jwks")
+
+    def test_symmetric(self) -> None:
+        """Test that no keys are published when the tokens are signed with a secret key."""
+        res = self.client.get(self.URL)
+        self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        self.assertEqual({"keys": []}, res.json())
+        self.assertIn("max-age", res["Cache-Control"])
+
+    def test_asymmetric(self) -> None:
+        """Test that the public keys are published, and the tokens they sign are accepted."""
+        backend = KeyRotationTokenBackend("EdDSA", [sample_private_key()])
+        with patch("users.signing.token_backend", backend):
+            res = self.client.get(self.URL)
+            self.assertResponseStatusCode(status.HTTP_200_OK, res)
+            self.assertEqual(backend.jwks, res.json())
+            token = AccessToken.for_user(sample_user())
+            self.assertEqual(backend.signing_kid, token.token_backend.signing_kid)  # type: ignore[attr-defined]
+            res = self.client.get(reverse("users:whoami"), HTTP_AUTHORIZATION=f"Bearer {token}")
+            self.assertResponseStatusCode(status.HTTP_200_OK, res)
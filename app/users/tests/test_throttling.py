@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock, patch
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from constance.test import override_config  # type: ignore[import-untyped]
+from extensions.utilities.test import APITestCase
+from users.tests import VALID_PASSWORD, sample_user
+from users.throttling import LoginRateThrottle, RegisterRateThrottle, SlidingWindowCounters, throttle_counters
+
+
+class TestSlidingWindowCounters(TestCase):
+    """Test the SlidingWindowCounters."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.counters = SlidingWindowCounters(max_keys=10, sync_interval=3600)
+
+    @patch("users.throttling.time.time")
+    def test_limit(self, time_mock: MagicMock) -> None:
+        """Test that hits over the limit are rejected until the window slides."""
+        time_mock.return_value = 600.0  # Start of a window
+        for _ in range(2):
+            self.assertEqual(0, self.counters.hit(["_key"], 60, 2))
+        self.assertEqual(60, self.counters.hit(["_key"], 60, 2))
+        # Halfway through the next window, half of the previous hits still count
+        time_mock.return_value = 690.0
+        self.assertEqual(0, self.counters.hit(["_key"], 60, 2))
+        self.assertLess(0, self.counters.hit(["_key"], 60, 2))
+        # Two windows later, nothing counts
+        time_mock.return_value = 780.0
+        self.assertEqual(0, self.counters.hit(["_key"], 60, 2))
+
+    def test_all_keys(self) -> None:
+        """Test that a hit is rejected if any key is over the limit, and not counted on the others."""
+        self.counters.hit(["_key1"], 60, 1)
+        self.assertLess(0, self.counters.hit(["_key1", "_key2"], 60, 1))
+        self.assertEqual(0, self.counters.hit(["_key2"], 60, 1))
+
+    def test_max_keys(self) -> None:
+        """Test that the least recently used keys are dropped."""
+        counters = SlidingWindowCounters(max_keys=1, sync_interval=3600)
+        counters.hit(["_key1"], 60, 1)
+        counters.hit(["_key2"], 60, 1)
+        self.assertEqual(0, counters.hit(["_key1"], 60, 1))
+
+    def test_check_keys(self) -> None:
+        """Test that the `check_keys` are checked but not counted, until `count` is called."""
+        for _ in range(2):
+            self.assertEqual(0, self.counters.hit(["_key"], 60, 5, check_keys=["_checked_key"]))
+        self.counters.count(["_checked_key"], 60)
+        self.assertLess(0, self.counters.hit(["_other_key"], 60, 1, check_keys=["_checked_key"]))
+
+    def test_sync(self) -> None:
+        """Test that the hits of other processes are picked up when syncing through the cache."""
+        other_process = SlidingWindowCounters(max_keys=10, sync_interval=0)
+        counters = SlidingWindowCounters(max_keys=10, sync_interval=0)
+        with patch("users.throttling.time.time", return_value=600.0):
+            other_process.hit(["_key"], 60, 2)
+            other_process.hit(["_key"], 60, 2)
+            self.assertEqual(0, counters.hit(["_key"], 60, 2))
+            self.assertLess(0, counters.hit(["_key"], 60, 2))
+
+
+class TestCredentialsRateThrottle(APITestCase):
+    """Test the throttling of the login and register endpoints."""
+
+    def setUp(self) -> None:
+        throttle_counters.clear()
+
+    @patch.object(LoginRateThrottle, "THROTTLE_RATES", {"login": "2/min"})
+    def test_login_by_username(self) -> None:
+        """Test that logins are throttled by username after failed attempts, before hashing the password."""
+        user = sample_user(password=VALID_PASSWORD)
+        # Successful logins don't count on the username
+        for i in range(3):
+            res = self.client.post(
+                reverse("users:login"),
+                {"username": user.username, "password": VALID_PASSWORD},
+                REMOTE_ADDR=f"10.0.0.{i}",
+            )
+            self.assertResponseStatusCode(status.HTTP_200_OK, res)
+        for i in range(2):
+            res = self.client.post(
+                reverse("users:login"),
+                {"username": user.username, "password": "_wrong_password"},
+                REMOTE_ADDR=f"10.0.1.{i}",
+            )
+            self.assertResponseStatusCode(status.HTTP_401_UNAUTHORIZED, res)
+        with self.assertNumQueries(0), patch("users.models.password_hashing") as hashing_mock:
+            res = self.client.post(
+                reverse("users:login"),
+                {"username": user.username.upper(), "password": VALID_PASSWORD},
+                REMOTE_ADDR="10.0.2.0",
+            )
+        self.assertResponseStatusCode(status.HTTP_429_TOO_MANY_REQUESTS, res)
+        hashing_mock.verify_password.assert_not_called()
+
+    @patch.object(RegisterRateThrottle, "THROTTLE_RATES", {"register": "1/min"})
+    @override_config(AUTH_USER_REGISTRATION_ENABLED=True)
+    def test_register_by_ip(self) -> None:
+        """Test that registrations are throttled by IP."""
+        res = self.client.post(reverse("users:register"), {"username": "_username1", "password": VALID_PASSWORD})
+        self.assertResponseStatusCode(status.HTTP_201_CREATED, res)
+        res = self.client.post(reverse("users:register"), {"username": "_username2", "password": VALID_PASSWORD})
+        self.assertResponseStatusCode(status.HTTP_429_TOO_MANY_REQUESTS, res)
+
+    @patch.object(RegisterRateThrottle, "THROTTLE_RATES", {"register": "1/min"})
+    @override_config(AUTH_USER_REGISTRATION_ENABLED=True)
+    def test_spoofed_forwarded_for(self) -> None:
+        """Test that spoofing the X-Forwarded-For header doesn't get a client a fresh limit."""
+        for i, expected_status in enumerate((status.HTTP_201_CREATED, status.HTTP_429_TOO_MANY_REQUESTS)):
+            res = self.client.post(
+                reverse("users:register"),
+                {"username": f"_username{i}", "password": VALID_PASSWORD},
+                # As forwarded by NGINX, that appends the client's address to the header it sent
+                HTTP_X_FORWARDED_FOR=f"10.0.0.{i}, 10.0.1.0",
+            )
+            self.assertResponseStatusCode(expected_status, res)
@@ -1,11 +1,18 @@
 from typing import Any
+from unittest.mock import patch
+from django.contrib.auth.hashers import make_password
+from django.db import DatabaseError, connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from constance.test import override_config  # type: ignore[import-untyped]
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
 from extensions.utilities.test import APITestCase, UpdateFunction, subTest_patch_and_put
 from users import serializers
 from users.models import User
 from users.tests import VALID_PASSWORD, sample_user
+from users.throttling import throttle_counters
 
 
 class TestUserRegisterView(APITestCase):
@@ -13,6 +20,9 @@ class TestUserRegisterView(APITestCase):
 
     URL = reverse("users:register")
 
+    def setUp(self) -> None:
+        throttle_counters.clear()
+
     @override_config(AUTH_USER_REGISTRATION_ENABLED=True)
     def test_success(self) -> None:
         """Test successfully creating a User."""
@@ -30,6 +40,39 @@ class TestUserRegisterView(APITestCase):
         self.assertEqual(created_user.username, payload["username"])
         self.assertTrue(created_user.check_password(payload["password"]))
 
+    @override_config(AUTH_USER_REGISTRATION_ENABLED=True)
+    def test_uniqueness_left_to_database(self) -> None:
+        """Test that creating a User doesn't check the username's uniqueness before the INSERT."""
+        payload = {"username": "_username", "password": VALID_PASSWORD}
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.post(self.URL, data=payload)
+        self.assertResponseStatusCode(status.HTTP_201_CREATED, res)
+        table = User._meta.db_table
+        self.assertEqual(
+            [], [q for q in ctx.captured_queries if q["sql"].startswith(f'SELECT 1 AS "a" FROM "{table}"')]
+        )
+
+    @override_config(AUTH_USER_REGISTRATION_ENABLED=True)
+    def test_duplicate_username_fails(self) -> None:
+        """Test creating a User with a taken username fails, with the same error as the validation."""
+        user = sample_user()
+        payload = {"username": user.username, "password": VALID_PASSWORD}
+        original_count = User.objects.count()
+        # The failed INSERT aborts the transaction; keep the test's transaction usable
+        with transaction.atomic():
+            res = self.client.post(self.URL, data=payload, HTTP_ACCEPT_LANGUAGE="en-gb")
+        self.assertResponseStatusCode(status.HTTP_400_BAD_REQUEST, res)
+        self.assertEqual(
+            {
+                "type": "validation_error",
+                "errors": [
+                    {"code": "unique", "detail": "user with this username already exists.", "attr": "username"}
+                ],
+            },
+            res.json(),
+        )
+        self.assertEqual(original_count, User.objects.count())
+
     @override_config(AUTH_USER_REGISTRATION_ENABLED=False)
     def test_registration_disabled_fails(self) -> None:
         """Test creating a User with the registration disabled fails."""
@@ -64,6 +107,9 @@ class TestAuthentication(APITestCase):
 
     LOGIN_URL = reverse("users:login")
 
+    def setUp(self) -> None:
+        throttle_counters.clear()
+
     def test_auth_flow(self) -> None:
         """Test the complete login flow."""
         password = VALID_PASSWORD
@@ -83,8 +129,11 @@ class TestAuthentication(APITestCase):
         self.assertResponseStatusCode(status.HTTP_200_OK, whoami_res)
         self.assertResponseData(user, serializers.UserWhoamiSerializer, whoami_res)
 
-        # Refresh the tokens
-        refresh_res = self.client.post(reverse("users:login-refresh"), data={"refresh": login_token_dict["refresh"]})
+        # Refresh the tokens; the rotated token reaches the blacklist index on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh_res = self.client.post(
+                reverse("users:login-refresh"), data={"refresh": login_token_dict["refresh"]}
+            )
         self.assertResponseStatusCode(status.HTTP_200_OK, refresh_res)
         refresh_token_dict = refresh_res.json()
         self.assertTrue(refresh_token_dict["refresh"])  # Not empty
@@ -105,6 +154,24 @@ class TestAuthentication(APITestCase):
         refresh_res = self.client.post(reverse("users:login-refresh"), data={"refresh": login_token_dict["refresh"]})
         self.assertResponseStatusCode(status.HTTP_401_UNAUTHORIZED, refresh_res)
 
+    @override_settings(USERS_BOOKKEEPING_COMMIT_MODES={"login": "atomic"})
+    def test_login_bookkeeping_rolled_back(self) -> None:
+        """Test that the login's bookkeeping writes are rolled back together when the request fails."""
+        password = VALID_PASSWORD
+        user = sample_user(password=password)
+        validate = serializers.UserLoginSerializer.validate
+
+        def validate_and_fail(serializer: serializers.UserLoginSerializer, attrs: dict[str, Any]) -> None:
+            validate(serializer, attrs)  # Creates the OutstandingToken
+            raise DatabaseError
+
+        with (
+            patch.object(serializers.UserLoginSerializer, "validate", validate_and_fail),
+            self.assertRaises(DatabaseError),
+        ):
+            self.client.post(self.LOGIN_URL, data={"username": user.username, "password": password})
+        self.assertFalse(OutstandingToken.objects.filter(user=user).exists())
+
     def test_invalid_token(self) -> None:
         """Test making a request with an invalid token (as opposed to no token at all)."""
         # Make the call
@@ -231,6 +298,15 @@ class TestUserChangePasswordView(APITestCase):
         self.assertFalse(self.user.check_password(self.password))
         self.assertTrue(self.user.check_password(new_password))
 
+    def test_stale_authenticated_user(self) -> None:
+        """Test that the User is loaded again, instead of trusting a (possibly stale) authenticated instance."""
+        # Changed elsewhere since the instance was loaded
+        User.objects.filter(id=self.user.id).update(password=make_password(VALID_PASSWORD + "_other"))
+        res = self.client.post(self.URL, data={"password": self.password, "new_password": VALID_PASSWORD + "_new"})
+        self.assertResponseStatusCode(status.HTTP_401_UNAUTHORIZED, res)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password(VALID_PASSWORD + "_other"))
+
     def test_wrong_password(self) -> None:
         """Test that using the wrong password fails."""
         new_password = VALID_PASSWORD + "_updated"
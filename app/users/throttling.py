@@ -0,0 +1,194 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Optional, Sequence
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.request import Request
+from rest_framework.throttling import SimpleRateThrottle
+from rest_framework.views import APIView
+from users.models import User
+
+
+@dataclass
+class _Window:
+    index: int
+    previous: int = 0
+    current: int = 0
+    unsynced: int = 0
+    synced_at: float = 0.0
+
+
+class SlidingWindowCounters:
+    """
+    In-process sliding window counters.
+
+    Each key keeps the hit counts of the current and the previous fixed window; the sliding window count is the
+    current count plus the previous one weighted by how much of it still overlaps the sliding window. Checking a key
+    is a dictionary lookup and some arithmetic, so rejecting a request costs next to nothing.
+
+    Every `sync_interval` seconds (per key), the local hits are pushed to the Django cache and the totals from the
+    other processes are pulled back, so the limits hold across workers (when the cache is shared), give or take one
+    interval's worth of hits. At most `max_keys` keys are kept, dropping the least recently used.
+
+    **Note**: the limits are soft. Unless the cache's `incr` is atomic (it isn't for the `DatabaseCache`, where it's a
+    read and a write), the pushes of workers syncing the same key at the same time can overwrite each other.
+    """
+
+    def __init__(self, max_keys: int, sync_interval: float) -> None:
+        self.max_keys = max_keys
+        self.sync_interval = sync_interval
+        self._lock = Lock()
+        self._windows: OrderedDict[str, _Window] = OrderedDict()
+
+    def _get_window(self, key: str, index: int, current_time: float) -> _Window:
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = _Window(index, synced_at=current_time)
+            while len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+        else:
+            self._windows.move_to_end(key)
+            if window.index != index:
+                window.previous = window.current if window.index == index - 1 else 0
+                window.current = window.unsynced = 0
+                window.index = index
+        return window
+
+    def hit(self, keys: list[str], duration: int, limit: int, check_keys: Sequence[str] = ()) -> float:
+        """
+        Count a hit on all the keys, unless any of them (or of the `check_keys`, which are checked but not counted) is
+        over the limit. Returns 0 if the hit was allowed, or the number of seconds to wait otherwise.
+        """
+        current_time = time.time()
+        index = int(current_time // duration)
+        elapsed = (current_time % duration) / duration
+        with self._lock:
+            windows = [(key, self._get_window(key, index, current_time)) for key in (*keys, *check_keys)]
+            rejected, wait = False, 0.0
+            for _, window in windows:
+                if window.previous * (1 - elapsed) + window.current < limit:
+                    continue
+                rejected = True
+                if window.current >= limit or window.previous == 0:
+                    # Can only go through in the next window
+                    wait = max(wait, duration * (1 - elapsed))
+                else:
+                    # Wait until enough of the previous window slides out
+                    wait = max(wait, duration * ((1 - (limit - window.current) / window.previous) - elapsed))
+            if rejected:
+                return max(wait, 0.001)
+            to_sync = self._add(windows[: len(keys)], current_time)
+        for key, window, unsynced in to_sync:
+            self._sync(key, window, index, duration, unsynced)
+        return 0.0
+
+    def count(self, keys: list[str], duration: int) -> None:
+        """Count a hit on all the keys, without checking the limit (for hits only known to count after the fact)."""
+        current_time = time.time()
+        index = int(current_time // duration)
+        with self._lock:
+            to_sync = self._add([(key, self._get_window(key, index, current_time)) for key in keys], current_time)
+        for key, window, unsynced in to_sync:
+            self._sync(key, window, index, duration, unsynced)
+
+    def _add(self, windows: list[tuple[str, _Window]], current_time: float) -> list[tuple[str, _Window, int]]:
+        """Count a hit on the windows; returns the ones due for a sync, with their unsynced hits. Hold the lock."""
+        to_sync: list[tuple[str, _Window, int]] = []
+        for key, window in windows:
+            window.current += 1
+            window.unsynced += 1
+            if current_time - window.synced_at >= self.sync_interval:
+                window.synced_at = current_time
+                to_sync.append((key, window, window.unsynced))
+                window.unsynced = 0
+        return to_sync
+
+    def _sync(self, key: str, window: _Window, index: int, duration: int, unsynced: int) -> None:
+        """Push the local hits to the cache, and pull the totals of all processes."""
+        current_key, previous_key = f"{key}:{index}", f"{key}:{index - 1}"
+        cache.add(current_key, 0, timeout=duration * 2)
+        try:
+            current = cache.incr(current_key, unsynced)
+        except ValueError:  # Expired in the meantime
+            cache.add(current_key, unsynced, timeout=duration * 2)
+            current = unsynced
+        previous = cache.get(previous_key, 0)
+        with self._lock:
+            if window.index == index:
+                window.current = max(window.current, current)
+                window.previous = max(window.previous, previous)
+
+    def clear(self) -> None:
+        """Drop all the counters."""
+        with self._lock:
+            self._windows.clear()
+
+
+throttle_counters = SlidingWindowCounters(
+    max_keys=settings.USERS_THROTTLE_MAX_KEYS,
+    sync_interval=settings.USERS_THROTTLE_SYNC_INTERVAL,
+)
+"""Per-process `SlidingWindowCounters` used by the `CredentialsRateThrottle`."""
+
+
+class CredentialsRateThrottle(SimpleRateThrottle):
+    """
+    Throttle for the endpoints that receive credentials, keyed by both the client's IP and the username sent.
+
+    It runs before any hashing or database work, counting hits in the in-process `SlidingWindowCounters`. Every
+    request counts on the IP, but only the failed attempts (see `count_failure`) count on the username, so that
+    others can't lock a User out just by sending requests with their username. Set the rate for the `scope` in
+    `DEFAULT_THROTTLE_RATES`.
+    """
+
+    cache_format = "throttle_%(scope)s_%(ident)s"
+
+    def get_cache_key(self, request: Request, view: APIView) -> str:
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+    def get_username_cache_key(self, request: Request) -> Optional[str]:
+        """Get the key for the username sent, if any."""
+        data: Any = request.data
+        username = data.get(User.USERNAME_FIELD) if hasattr(data, "get") else None
+        if isinstance(username, str) and username:
+            return self.cache_format % {"scope": self.scope, "ident": f"user_{username.lower()}"}
+        return None
+
+    def allow_request(self, request: Request, view: APIView) -> bool:
+        """Override this method to count the request in the `SlidingWindowCounters` instead of the cache."""
+        if self.rate is None:
+            return True
+        assert self.num_requests is not None and self.duration is not None
+        username_key = self.get_username_cache_key(request)
+        self._wait = throttle_counters.hit(
+            [self.get_cache_key(request, view)],
+            self.duration,
+            self.num_requests,
+            check_keys=[username_key] if username_key is not None else [],
+        )
+        return self._wait == 0
+
+    def count_failure(self, request: Request) -> None:
+        """Count a failed attempt (e.g. wrong credentials) on the username sent."""
+        username_key = self.get_username_cache_key(request)
+        if self.rate is None or username_key is None:
+            return
+        assert self.duration is not None
+        throttle_counters.count([username_key], self.duration)
+
+    def wait(self) -> Optional[float]:
+        return self._wait
+
+
+class LoginRateThrottle(CredentialsRateThrottle):
+    """Throttle for the login endpoint."""
+
+    scope = "login"
+
+
+class RegisterRateThrottle(CredentialsRateThrottle):
+    """Throttle for the register endpoint."""
+
+    scope = "register"
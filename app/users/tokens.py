@@ -0,0 +1,78 @@
+from typing import Any
+from django.db.models import F
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import tokens as jwt_tokens
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from extensions.utilities.invalidation import invalidation_bus
+from users import signing
+from users.authentication import TOKEN_VERSION_CLAIM, get_token_version, invalidate_cached_user
+from users.blacklist import blacklist_index
+from users.models import User
+
+
+def revoke_tokens(user_id: Any) -> None:
+    """
+    Revoke all of the User's tokens ("logout everywhere"), with a single `UPDATE` that increments its `token_version`.
+    """
+    User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).update(token_version=F("token_version") + 1)
+    # Updates don't send signals, so the caches have to be invalidated here
+    invalidate_cached_user(user_id)
+
+
+class AccessToken(jwt_tokens.AccessToken):
+    """Custom AccessToken that is signed by our `TokenBackend` (see `users.signing`), and carries the User's version."""
+
+    @property
+    def token_backend(self) -> TokenBackend:
+        """Override this property to use our `TokenBackend`."""
+        return signing.token_backend
+
+    @classmethod
+    def for_user(cls, user: User) -> "AccessToken":  # type: ignore[override]
+        """Override this method to embed the User's `token_version`."""
+        token = super().for_user(user)
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
+
+
+class RefreshToken(jwt_tokens.RefreshToken):
+    """
+    Custom RefreshToken that is signed by our `TokenBackend` (see `users.signing`), carries the User's version, and
+    checks the blacklist through the in-memory `BlacklistIndex`.
+    """
+
+    access_token_class = AccessToken
+
+    @property
+    def token_backend(self) -> TokenBackend:
+        """Override this property to use our `TokenBackend`."""
+        return signing.token_backend
+
+    @classmethod
+    def for_user(cls, user: User) -> "RefreshToken":  # type: ignore[override]
+        """Override this method to embed the User's `token_version`; access tokens made from this one inherit it."""
+        token = super().for_user(user)
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
+
+    def verify(self) -> None:
+        """Override this method to also reject the tokens revoked through the User's `token_version`."""
+        super().verify()
+        user_id = self.payload.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None and self.payload.get(TOKEN_VERSION_CLAIM, 0) != get_token_version(user_id):
+            raise TokenError(_("Token has been revoked"))
+
+    def check_blacklist(self) -> None:
+        """Override this method to use the `BlacklistIndex` instead of querying the blacklist tables."""
+        if blacklist_index.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> BlacklistedToken:
+        """Override this method to register the blacklisted token in the `BlacklistIndex` of every process on commit."""
+        retval = super().blacklist()
+        # Not right away: if the transaction rolls back, the token isn't blacklisted
+        invalidation_bus.publish("blacklist", self.payload[api_settings.JTI_CLAIM], immediate=False)
+        return retval
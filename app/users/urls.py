@@ -12,6 +12,7 @@ urlpatterns: URLPatternsList = [
     path("login/", views.UserLoginView.as_view(), name="login"),
     path("login/refresh/", views.UserLoginRefreshView.as_view(), name="login-refresh"),
     path("logout/", views.UserLogoutView.as_view(), name="logout"),
+    path("jwks/", views.UserJWKSView.as_view(), name="jwks"),
     path("change_password/", views.UserChangePasswordView.as_view(), name="change-password"),
     path("profile/", views.UserProfileView.as_view(), name="profile"),
 ]
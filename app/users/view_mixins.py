@@ -1,10 +1,56 @@
-from rest_framework.generics import GenericAPIView
+from typing import Any
+from django.conf import settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.generics import GenericAPIView, get_object_or_404
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.views import TokenViewBase
+from extensions.utilities.transactions import commit_mode
 from users.models import User
+from users.throttling import CredentialsRateThrottle
 
 
 class TargetAuthenticatedUserMixin(GenericAPIView[User]):
     """Mixin for views that target the authenticated user."""
 
     def get_object(self) -> User:
+        """
+        Override this method to return the authenticated User. For unsafe methods, it's loaded from the database again:
+        the authentication's instance can be a copy of a cached one, stale by up to the cache's timeout, and writing it
+        back could revert changes made elsewhere in the meantime (like a new password).
+        """
         assert isinstance(self.request.user, User)
-        return self.request.user
+        if self.request.method in SAFE_METHODS:
+            return self.request.user
+        return get_object_or_404(User.objects.all(), pk=self.request.user.pk)
+
+
+class BookkeepingTransactionMixin(TokenViewBase):
+    """
+    Mixin for the token views, to run their bookkeeping writes (outstanding and blacklisted tokens, token versions)
+    in a single transaction, with the `CommitMode` set for the view's `bookkeeping_scope` in the
+    `USERS_BOOKKEEPING_COMMIT_MODES` setting.
+    """
+
+    bookkeeping_scope: str
+
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        with commit_mode(settings.USERS_BOOKKEEPING_COMMIT_MODES.get(self.bookkeeping_scope)):
+            return super().post(request, *args, **kwargs)
+
+
+class CredentialsThrottleMixin(APIView):
+    """
+    Mixin for the views throttled with a `CredentialsRateThrottle`, to count the failed attempts (the requests that
+    fail with an `AuthenticationFailed`) on the username sent.
+    """
+
+    def handle_exception(self, exc: Exception) -> Response:
+        """Override this method to count the failed attempts."""
+        if isinstance(exc, AuthenticationFailed):
+            for throttle in self.get_throttles():
+                if isinstance(throttle, CredentialsRateThrottle):
+                    throttle.count_failure(self.request)
+        return super().handle_exception(exc)
@@ -1,5 +1,8 @@
 from typing import Any
+from django.conf import settings
 from django.contrib.auth.password_validation import validate_password
+from django.db.models import F
+from django.utils.cache import patch_cache_control
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 from rest_framework import generics, status
@@ -7,12 +10,15 @@ from rest_framework.exceptions import AuthenticationFailed, PermissionDenied
 from rest_framework.permissions import AllowAny
 from rest_framework.request import Request
 from rest_framework.response import Response
-from constance import config  # type: ignore[import-untyped]
+from rest_framework.views import APIView
 from drf_spectacular.utils import OpenApiResponse, extend_schema, extend_schema_view
 from rest_framework_simplejwt import settings as jwt_settings
 from rest_framework_simplejwt import views as jwt_views
-from users import models, serializers
-from users.view_mixins import TargetAuthenticatedUserMixin
+from core.config import get_config
+from users import models, serializers, signing
+from users.authentication import ClaimsJWTAuthentication
+from users.throttling import LoginRateThrottle, RegisterRateThrottle
+from users.view_mixins import BookkeepingTransactionMixin, CredentialsThrottleMixin, TargetAuthenticatedUserMixin
 
 
 @extend_schema(tags=["User Authentication"])
@@ -20,6 +26,7 @@ class UserRegisterView(generics.CreateAPIView[models.User]):
     """Endpoint to register users."""
 
     permission_classes = (AllowAny,)
+    throttle_classes = (RegisterRateThrottle,)
     serializer_class = serializers.UserRegisterSerializer
 
     @extend_schema(operation_id="users_register")
@@ -55,7 +62,7 @@ class UserRegisterView(generics.CreateAPIView[models.User]):
     )
     def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Override the POST method to block registration if disabled."""
-        registration_enabled = config.AUTH_USER_REGISTRATION_ENABLED
+        registration_enabled = get_config(request).AUTH_USER_REGISTRATION_ENABLED
         if not registration_enabled:
             raise PermissionDenied(_("Registration is disabled."))
         return super().post(request, *args, **kwargs)
@@ -95,7 +102,11 @@ class UserRegisterView(generics.CreateAPIView[models.User]):
         },
     )
 )
-class UserLoginView(jwt_views.TokenObtainPairView): ...
+class UserLoginView(CredentialsThrottleMixin, BookkeepingTransactionMixin, jwt_views.TokenObtainPairView):
+    """Endpoint to login users."""
+
+    bookkeeping_scope = "login"
+    throttle_classes = (LoginRateThrottle,)
 
 
 @extend_schema(tags=["User Authentication"])
@@ -106,7 +117,10 @@ class UserLoginView(jwt_views.TokenObtainPairView): ...
         description="Endpoint to refresh the user's `access_token` and `refresh_token`, from a valid `refresh_token`.\n\nThis will also return a new refresh token and invalidate the old one.",
     )
 )
-class UserLoginRefreshView(jwt_views.TokenRefreshView): ...
+class UserLoginRefreshView(BookkeepingTransactionMixin, jwt_views.TokenRefreshView):
+    """Endpoint to refresh the tokens."""
+
+    bookkeeping_scope = "login-refresh"
 
 
 @extend_schema(tags=["User Authentication"])
@@ -114,10 +128,43 @@ class UserLoginRefreshView(jwt_views.TokenRefreshView): ...
     post=extend_schema(
         operation_id="users_logout",
         summary="Logout user",
-        description="Endpoint to logout the user, by blacklisting it's `access_token` and `refresh_token`, from a valid `refresh_token`.",
+        description="Endpoint to logout the user everywhere, by revoking all of its `access_token`s and `refresh_token`s, from a valid `refresh_token`.",
+    )
+)
+class UserLogoutView(BookkeepingTransactionMixin, jwt_views.TokenBlacklistView):
+    """Endpoint to logout users."""
+
+    bookkeeping_scope = "logout"
+
+
+@extend_schema(tags=["User Authentication"])
+@extend_schema_view(
+    get=extend_schema(
+        operation_id="users_jwks",
+        summary="Get token verification keys",
+        description="Endpoint to retrieve the public keys that verify the access tokens, as a JWK set.\n\nThe set is empty if the tokens are signed with a secret key.",
+        responses={
+            200: OpenApiResponse(
+                response={
+                    "type": "object",
+                    "properties": {"keys": {"type": "array", "items": {"type": "object"}}},
+                    "required": ["keys"],
+                },
+                description="JWK set",
+            )
+        },
     )
 )
-class UserLogoutView(jwt_views.TokenBlacklistView): ...
+class UserJWKSView(APIView):
+    """Endpoint to publish the public keys that verify the access tokens, so other services can verify them locally."""
+
+    authentication_classes = ()
+    permission_classes = (AllowAny,)
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        response = Response(signing.get_jwks() or {"keys": []})
+        patch_cache_control(response, public=True, max_age=settings.USERS_JWKS_MAX_AGE)
+        return response
 
 
 @extend_schema(tags=["Users"])
@@ -129,10 +176,19 @@ class UserLogoutView(jwt_views.TokenBlacklistView): ...
     )
 )
 class UserWhoamiView(TargetAuthenticatedUserMixin, generics.RetrieveAPIView[models.User]):
-    """Endpoint to retrieve the identifying information of the currently logged in User."""
+    """
+    Endpoint to retrieve the identifying information of the currently logged in User.
 
+    Since it's the most polled endpoint, it's answered from the access token's claims, without querying the database.
+    """
+
+    authentication_classes = (ClaimsJWTAuthentication,)
     serializer_class = serializers.UserWhoamiSerializer
 
+    def get_object(self) -> models.User:
+        """Override this method, as the User may be a `TokenUser` built from the token's claims."""
+        return self.request.user  # type: ignore[return-value]
+
 
 @extend_schema(tags=["Users"])
 @extend_schema_view(
@@ -205,5 +261,7 @@ class UserChangePasswordView(TargetAuthenticatedUserMixin, generics.UpdateAPIVie
         new_password = serializer.data.get("new_password")
         validate_password(new_password)
         user.set_password(new_password)
-        user.save()
+        # Revoke all of the User's tokens in the same UPDATE
+        user.token_version = F("token_version") + 1  # type: ignore[assignment]
+        user.save(update_fields=("password", "token_version", "updated_at"))
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -159,8 +159,18 @@ def open_coverage() -> None:
     default=(PROJECT_DIR / "schema.yml"),
     help="Output destination. Can be a directory, in which case a 'schema.yml' file will be created inside.",
 )
-def schema(output: Path) -> None:
+@click.option("--profile", is_flag=True, help="Profile the schema generation instead, reporting the slowest parts.")
+def schema(output: Path, profile: bool) -> None:
     """Generate an OpenAPI schema using drf_spectacular."""
+    if profile:
+        log("Profiling schema generation...")
+        run_docker_command(
+            'run --rm --entrypoint "" app sh -c "python manage.py profile_schema"',
+            production=False,
+            stop_on_finish=False,
+            show_mode=False,
+        )
+        return
     log("Generating schema...")
     run_docker_command(
         'run --rm --entrypoint "" app sh -c "python manage.py spectacular --color --file schema.yml"',